@@ -0,0 +1,919 @@
+"""
+Headless micro-benchmarks for Cosmic Heat.
+Usage: python benchmarks.py <name> [--frames N]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from classes.constants import WIDTH, HEIGHT
+
+
+def _setup():
+    pygame.init()
+    return pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+def _report(title, rows):
+    print(title)
+    for label, value in rows:
+        print(f"  {label:<38}{value}")
+
+
+def bench_background(frames, scales=(1.0, 0.5)):
+    """Main-thread frame time with the parallax background drawn inline vs by the compositor thread."""
+    from compositor import BackgroundCompositor
+    from cosmic_ui import ParallaxBackground
+    from render import RenderTarget
+
+    display = pygame.display.get_surface()
+    random.seed(5)
+    meteor_img = pygame.image.load('images/meteors/meteor_2.png').convert_alpha()
+    positions = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(120)]
+
+    def entity_work(target):
+        # Stand-in for entity updates, collisions and sprite blits
+        rects = [meteor_img.get_rect(topleft=position) for position in positions]
+        for rect in rects:
+            rect.collidelistall(rects)
+        target.blits([(meteor_img, position) for position in positions], False)
+
+    rows = []
+    for scale in scales:
+        target = RenderTarget(display, scale)
+        for threaded in (False, True):
+            compositor = BackgroundCompositor(ParallaxBackground(), target, threaded)
+            background_ms = 0.0
+            start = time.perf_counter()
+            for _ in range(frames):
+                step = time.perf_counter()
+                compositor.draw(1.5)
+                background_ms += time.perf_counter() - step
+                entity_work(target)
+                target.present()
+            frame_ms = (time.perf_counter() - start) / frames * 1000
+            compositor.close()
+            mode = "threaded" if threaded else "inline"
+            rows.append((
+                f"scale {scale:.2f} {mode} ms/frame",
+                f"{frame_ms:.2f} (background on main thread {background_ms / frames * 1000:.2f})",
+            ))
+    _report(f"background compositor ({frames} frames)", rows)
+
+
+def bench_camera(frames):
+    """A shake plus flash applied to the finished frame vs the old copy-and-blit shake."""
+    from camera import Camera
+
+    screen = pygame.display.get_surface()
+    camera = Camera(screen.get_size())
+    random.seed(4)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        if not camera.active:
+            camera.shake(10 ** 6, 5)
+            camera.flash((255, 40, 40), 10 ** 6, 100)
+        camera.apply(screen)
+    camera_ms = (time.perf_counter() - start) / frames * 1000
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        shake_surface = screen.copy()
+        screen.fill((0, 0, 0))
+        screen.blit(shake_surface, (random.randint(-5, 5), random.randint(-5, 5)))
+    copy_ms = (time.perf_counter() - start) / frames * 1000
+
+    _report(f"camera ({frames} frames)", [
+        ("shake + flash in place ms/frame", f"{camera_ms:.3f}"),
+        ("screen.copy() shake ms/frame", f"{copy_ms:.3f}"),
+    ])
+
+
+def bench_collision(frames):
+    """Worst boss scenario: the first boss overlapping the player under heavy fire."""
+    from classes.player import Player
+    from classes.bullets import Bullet
+    from classes.bosses import BOSS_DEFINITIONS, Boss
+    from classes.meteors import Meteors, BlackHole
+    from classes.collision import CollisionRegistry, collide, rotated
+
+    random.seed(1)
+    player = Player()
+    boss = Boss(WIDTH // 2, HEIGHT // 2, BOSS_DEFINITIONS[0])
+    hole = BlackHole(WIDTH // 2 - 200, HEIGHT // 2 - 100, pygame.image.load('images/hole/black_hole2.png').convert_alpha())
+    meteor_img = pygame.image.load('images/meteors/meteor_2.png').convert_alpha()
+    meteors = pygame.sprite.Group(
+        Meteors(random.randint(300, 900), random.randint(200, 600), meteor_img) for _ in range(8)
+    )
+    bullets = pygame.sprite.Group()
+    boss_bullets = pygame.sprite.Group()
+    for _ in range(60):
+        bullets.add(Bullet(random.randint(400, 800), random.randint(300, 800)))
+    bullet_img = pygame.image.load('images/bullets/bulletboss2.png').convert_alpha()
+    for _ in range(40):
+        bullet = pygame.sprite.Sprite()
+        bullet.image, bullet.mask = rotated(bullet_img, random.uniform(-180, 0))
+        bullet.rect = bullet.image.get_rect(center=(random.randint(400, 800), random.randint(200, 700)))
+        boss_bullets.add(bullet)
+
+    def run(test):
+        hits = 0
+        elapsed = 0.0
+        for frame in range(frames):
+            player.rect.center = (WIDTH // 2 + (frame % 200) - 100, HEIGHT // 2 + 60)
+            hole.update()
+            for meteor in meteors:
+                meteor.update()
+                meteor.rect.center = (random.randint(300, 900), random.randint(200, 600))
+            start = time.perf_counter()
+            for hazard in (boss, hole, *meteors, *boss_bullets):
+                if test(hazard, player):
+                    hits += 1
+            for target in (boss, hole, *meteors):
+                hits += len(pygame.sprite.spritecollide(target, bullets, False, test))
+            elapsed += time.perf_counter() - start
+        return elapsed / frames * 1000, hits / frames
+
+    def rect_only(left, right):
+        return left.rect.colliderect(right.rect)
+
+    # The same tests as registered pairs, one query each
+    registry = CollisionRegistry()
+    player_group = pygame.sprite.GroupSingle(player)
+    bosses = pygame.sprite.Group(boss)
+    holes = pygame.sprite.Group(hole)
+    for name, left, right in (
+        ('bosses_player', bosses, player_group),
+        ('black_holes_player', holes, player_group),
+        ('meteors_player', meteors, player_group),
+        ('boss_bullets_player', boss_bullets, player_group),
+        ('bosses_bullets', bosses, bullets),
+        ('black_holes_bullets', holes, bullets),
+        ('meteors_bullets', meteors, bullets),
+    ):
+        registry.register(name, left, right, lambda pair, sprite, hits: None)
+
+    def run_registry():
+        # The earlier passes let the black hole drift off screen and die
+        holes.add(hole)
+        elapsed = 0.0
+        for frame in range(frames):
+            player.rect.center = (WIDTH // 2 + (frame % 200) - 100, HEIGHT // 2 + 60)
+            hole.rect.centery = HEIGHT // 2
+            hole.update()
+            for meteor in meteors:
+                meteor.update()
+                meteor.rect.center = (random.randint(300, 900), random.randint(200, 600))
+            start = time.perf_counter()
+            registry.resolve()
+            elapsed += time.perf_counter() - start
+        return elapsed / frames * 1000, registry.take_costs()
+
+    # First pass warms the mask and rotation caches, as a running game would
+    run(collide)
+    rect_ms, rect_hits = run(rect_only)
+    mask_ms, mask_hits = run(collide)
+    registry_ms, costs = run_registry()
+    _report(f"collision ({frames} frames, {len(bullets)} bullets, {len(boss_bullets)} boss bullets)", [
+        ("rect only ms/frame", f"{rect_ms:.3f}"),
+        ("rect + mask ms/frame", f"{mask_ms:.3f}"),
+        ("rect hits/frame", f"{rect_hits:.1f}"),
+        ("mask hits/frame", f"{mask_hits:.1f}"),
+        ("phantom hits removed", f"{(1 - mask_hits / max(rect_hits, 1e-9)) * 100:.0f}%"),
+        ("registry ms/frame", f"{registry_ms:.3f}"),
+    ] + [
+        (f"  {name} us/frame", f"{cost_us / frames:.1f} ({tests // frames} tests, {hits / frames:.1f} hits)")
+        for name, tests, hits, cost_us in costs
+    ])
+
+
+class _SpriteBullet(pygame.sprite.Sprite):
+    """The old one-sprite-per-bullet path, kept as the projectile baseline."""
+
+    def __init__(self, image, x, y, direction, speed):
+        super().__init__()
+        self.image_orig = image
+        self.image = image
+        self.rect = image.get_rect(center=(x, y))
+        self.direction = direction
+        self.speed = speed
+
+    def update(self):
+        self.rect.move_ip(self.direction.x * self.speed, self.direction.y * self.speed)
+        angle = math.degrees(math.atan2(self.direction.y, self.direction.x))
+        self.image = pygame.transform.rotate(self.image_orig, -angle)
+        self.rect = self.image.get_rect(center=self.rect.center)
+        if not self.rect.colliderect(-80, -80, WIDTH + 160, HEIGHT + 160):
+            self.kill()
+
+
+def _threshold_speed(score):
+    # The per-entity checks the meteor loops used to run every frame
+    speed = 2
+    if score >= 3000:
+        speed = 4
+    if score >= 10000:
+        speed = 6
+    if score >= 15000:
+        speed = 8
+    if score >= 20000:
+        speed = 10
+    return speed
+
+
+def bench_difficulty(frames, count=40):
+    """Difficulty for count rocks while the score climbs: per-entity checks against the curve."""
+    from classes.difficulty import DifficultyCurve
+
+    class Rock:
+        speed = 2
+
+    rocks = [Rock() for _ in range(count)]
+    scores = [frame * 25000 // frames for frame in range(frames)]
+
+    start = time.perf_counter()
+    for score in scores:
+        for rock in rocks:
+            rock.speed = _threshold_speed(score)
+    legacy_us = (time.perf_counter() - start) / frames * 1e6
+
+    def push(speeds):
+        for rock in rocks:
+            rock.speed = speeds['meteors']
+
+    curve = DifficultyCurve()
+    curve.subscribe('speed', push)
+    start = time.perf_counter()
+    for score in scores:
+        curve.update(score)
+    curve_us = (time.perf_counter() - start) / frames * 1e6
+
+    _report(f"difficulty ({frames} frames, {count} rocks, score 0 to 25000)", [
+        ("per-entity checks us/frame", f"{legacy_us:.2f}"),
+        ("curve update us/frame", f"{curve_us:.2f} ({curve.changes} breakpoints crossed)"),
+        ("speeds agree at the end", "yes" if rocks[0].speed == _threshold_speed(scores[-1]) else "NO"),
+    ])
+    return rocks[0].speed == _threshold_speed(scores[-1])
+
+
+class _SpriteExtraScore(pygame.sprite.Sprite):
+    """The old per-sprite ExtraScore update, kept as the entity baseline."""
+
+    def __init__(self, x, y, image):
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(topleft=(x, y))
+        self.speed = 2
+        self.direction_y = 1
+
+    def update(self):
+        self.rect.y += self.speed * self.direction_y
+        if self.rect.bottom >= HEIGHT + 100:
+            self.kill()
+
+
+def bench_ecs(frames, count=4000):
+    """
+    count falling pickups moved, culled and queued as sprites, as
+    EntitySprite facades and as plain entities, plus a two-sided
+    collision query against groupcollide.
+    """
+    from classes.ecs import EntitySprite, World, collide, lifetime, movement, render
+    from render import RenderLayer
+
+    image = pygame.image.load('images/score/score_coin.png').convert_alpha()
+    random.seed(5)
+    # Spread over a tall column so few reach the kill line within the run
+    starts = [(random.randint(0, WIDTH - 40), random.randint(-frames * 2 - HEIGHT, HEIGHT - 200)) for _ in range(count)]
+    kill_below = HEIGHT + 100
+
+    def per_ms(seconds, total):
+        return f"{total / (seconds * 1000):.0f} entities/ms ({seconds / frames * 1000:.2f} ms/frame)"
+
+    def run(update, layer_source):
+        layer = RenderLayer()
+        update_seconds = queue_seconds = 0.0
+        updated = 0
+        for _ in range(frames):
+            start = time.perf_counter()
+            updated += update()
+            middle = time.perf_counter()
+            layer_source(layer)
+            queue_seconds += time.perf_counter() - middle
+            update_seconds += middle - start
+            layer.items.clear()
+        return update_seconds, queue_seconds, updated
+
+    sprites = pygame.sprite.Group(_SpriteExtraScore(x, y, image) for x, y in starts)
+
+    def sprite_update():
+        moved = len(sprites)
+        sprites.update()
+        return moved
+    sprite_update_s, sprite_queue_s, sprite_total = run(sprite_update, lambda layer: layer.add_sprites(sprites))
+
+    facade_world = World()
+    facades = pygame.sprite.Group(
+        EntitySprite(facade_world, image, image.get_rect(topleft=start), direction=(0, 1), speed=2, kill_below=kill_below)
+        for start in starts
+    )
+
+    def facade_update():
+        moved = movement(facade_world)
+        lifetime(facade_world)
+        return moved
+    facade_update_s, facade_queue_s, facade_total = run(facade_update, lambda layer: layer.add_sprites(facades))
+
+    world = World()
+    width, height = image.get_size()
+    image_id = world.image_id(image)
+    for index, start in enumerate(starts):
+        world.create(
+            position=start, size=(width, height), image=image_id, direction=(0, 1), speed=2,
+            kill_below=kill_below, layer=1 << (index % 2),
+        )
+
+    def entity_update():
+        moved = movement(world)
+        lifetime(world)
+        return moved
+    entity_update_s, entity_queue_s, entity_total = run(entity_update, lambda layer: render(world, layer))
+    alive = (len(sprites), len(facades), len(world))
+
+    # Same rects on both sides: even entities against odd ones
+    archetype = world.query('layer')[0]
+    rects = [pygame.Rect(*position, width, height) for position in archetype.view('position').astype(int).tolist()]
+    evens, odds = pygame.sprite.Group(), pygame.sprite.Group()
+    for index, rect in enumerate(rects):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = rect
+        (evens if archetype.ids[index] % 2 == 0 else odds).add(sprite)
+    start = time.perf_counter()
+    for _ in range(frames):
+        group_hits = pygame.sprite.groupcollide(evens, odds, False, False)
+    groupcollide_ms = (time.perf_counter() - start) / frames * 1000
+    start = time.perf_counter()
+    for _ in range(frames):
+        lefts, _ = collide(world, 1, 2)
+    collide_ms = (time.perf_counter() - start) / frames * 1000
+
+    _report(f"ecs ({frames} frames, {count} falling pickups)", [
+        ("sprite update", per_ms(sprite_update_s, sprite_total)),
+        ("entity sprite facade update", per_ms(facade_update_s, facade_total)),
+        ("entity systems update", per_ms(entity_update_s, entity_total)),
+        ("sprite queue ms/frame", f"{sprite_queue_s / frames * 1000:.2f}"),
+        ("entity sprite facade queue ms/frame", f"{facade_queue_s / frames * 1000:.2f}"),
+        ("entity render system ms/frame", f"{entity_queue_s / frames * 1000:.2f}"),
+        ("alive at end, sprite/facade/entity", "%d / %d / %d" % alive),
+        ("groupcollide ms/frame", f"{groupcollide_ms:.2f}"),
+        ("collide system ms/frame", f"{collide_ms:.2f}"),
+        ("colliding, groupcollide/system", f"{len(group_hits)} / {len(set(lefts.tolist()))}"),
+    ])
+    return len(set(alive)) == 1 and len(group_hits) == len(set(lefts.tolist()))
+
+
+def bench_projectiles(frames, live=2000):
+    """Dense ring pattern: keep `live` enemy bullets on screen at once."""
+    from classes.player import Player
+    from classes.projectiles import ProjectileField, emit_ring
+
+    screen = pygame.display.get_surface()
+    player = Player()
+    field = ProjectileField()
+    image = pygame.image.load('images/bullets/bulletboss2.png').convert_alpha()
+    # Slow bullets so a ring every frame builds up to the target population
+    field.speeds[field.kind_id('boss2')] = 1.5
+    per_ring = 24
+
+    def run_field():
+        field.clear()
+        elapsed = 0.0
+        populations = []
+        for frame in range(frames):
+            start = time.perf_counter()
+            if len(field) < live:
+                emit_ring(field, 'boss2', WIDTH // 2, HEIGHT // 2, per_ring, frame * 7)
+            field.update()
+            field.draw(screen)
+            field.hit_test(player)
+            elapsed += time.perf_counter() - start
+            populations.append(len(field))
+        return elapsed / frames * 1000, max(populations)
+
+    def run_sprites():
+        group = pygame.sprite.Group()
+        elapsed = 0.0
+        populations = []
+        for frame in range(frames):
+            start = time.perf_counter()
+            if len(group) < live:
+                for step in range(per_ring):
+                    angle = math.radians(frame * 7 + step * 360 / per_ring)
+                    direction = pygame.math.Vector2(math.cos(angle), math.sin(angle))
+                    group.add(_SpriteBullet(image, WIDTH // 2, HEIGHT // 2, direction, 1.5))
+            group.update()
+            group.draw(screen)
+            for bullet in group:
+                if bullet.rect.colliderect(player.rect):
+                    bullet.kill()
+            elapsed += time.perf_counter() - start
+            populations.append(len(group))
+        return elapsed / frames * 1000, max(populations)
+
+    field_ms, field_peak = run_field()
+    sprite_ms, sprite_peak = run_sprites()
+    _report(f"projectiles ({frames} frames, target {live} live)", [
+        ("ProjectileField ms/frame", f"{field_ms:.2f} (peak {field_peak} live)"),
+        ("sprite group ms/frame", f"{sprite_ms:.2f} (peak {sprite_peak} live)"),
+        ("60 FPS frame budget ms", f"{1000 / 60:.2f}"),
+    ])
+
+
+def bench_render_scale(frames, scales=(1.0, 0.75, 0.5)):
+    """Fill-rate cost of a busy world frame at each internal render scale."""
+    from cosmic_ui import ParallaxBackground
+    from classes.collision import rotated
+    from classes.projectiles import ProjectileField, emit_ring
+    from render import RenderTarget
+
+    display = pygame.display.get_surface()
+    background = ParallaxBackground()
+    random.seed(2)
+    meteor_img = pygame.image.load('images/meteors/meteor_2.png').convert_alpha()
+    boss_img = pygame.image.load('images/boss/boss1.png').convert_alpha()
+    explosion_imgs = [pygame.image.load(f"images/explosion2/explosion{i}.png") for i in range(18)]
+    meteors = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(30)]
+    explosions = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(12)]
+    field = ProjectileField()
+    for step in range(12):
+        emit_ring(field, 'boss2', WIDTH // 2, HEIGHT // 2, 32, step * 5)
+    for _ in range(20):
+        field.update()
+
+    rows = []
+    baseline = None
+    for scale in scales:
+        target = RenderTarget(display, scale)
+        elapsed = 0.0
+        for frame in range(frames):
+            start = time.perf_counter()
+            background.update(2.0)
+            background.draw(target)
+            for index, (x, y) in enumerate(meteors):
+                image, _ = rotated(meteor_img, frame + index * 10)
+                target.blit(image, (x, y))
+            target.blit(boss_img, (WIDTH // 2 - 150, 100))
+            for index, (x, y) in enumerate(explosions):
+                target.blit(explosion_imgs[(frame + index) % 18], (x, y))
+            field.draw(target)
+            target.present()
+            elapsed += time.perf_counter() - start
+        ms = elapsed / frames * 1000
+        if baseline is None:
+            baseline = ms
+        size = target.surface.get_size()
+        rows.append((
+            f"scale {scale:.2f} ({size[0]}x{size[1]}) ms/frame",
+            f"{ms:.2f} ({(1 - ms / baseline) * 100:.0f}% saved)",
+        ))
+    _report(f"render scale ({frames} frames, {len(field)} projectiles, {len(meteors)} meteors)", rows)
+
+
+def bench_render_queue(frames, count=400):
+    """Per-sprite blits vs one culled blits() per layer, with a third of the sprites off screen."""
+    from render import RenderQueue, RenderTarget
+
+    display = pygame.display.get_surface()
+    target = RenderTarget(display)
+    random.seed(3)
+    images = [
+        pygame.image.load(f'images/meteors/meteor2_{i}.png').convert_alpha() for i in range(1, 5)
+    ] + [pygame.image.load('images/enemy/enemy1_1.png').convert_alpha()]
+    sprites = []
+    for index in range(count):
+        sprite = pygame.sprite.Sprite()
+        sprite.image = images[index % len(images)]
+        y = random.randint(-HEIGHT, -100) if index % 3 == 0 else random.randint(0, HEIGHT)
+        sprite.rect = sprite.image.get_rect(topleft=(random.randint(0, WIDTH), y))
+        sprites.append(sprite)
+    layers = (sprites[:count // 2], sprites[count // 2:])
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for layer in layers:
+            for sprite in layer:
+                target.blit(sprite.image, sprite.rect)
+    each_ms = (time.perf_counter() - start) / frames * 1000
+
+    queue = RenderQueue(target, (('lower', True), ('upper', True)))
+    start = time.perf_counter()
+    for _ in range(frames):
+        for name, layer in zip(('lower', 'upper'), layers):
+            queue[name].add_sprites(layer)
+        queue.flush()
+    queue_ms = (time.perf_counter() - start) / frames * 1000
+    submitted, culled = queue.take_counts()
+
+    _report(f"render queue ({frames} frames, {count} sprites in 2 layers)", [
+        ("blit per sprite ms/frame", f"{each_ms:.2f}"),
+        ("queued blits() per layer ms/frame", f"{queue_ms:.2f}"),
+        ("submitted / culled per frame", f"{submitted // frames} / {culled // frames}"),
+    ])
+
+
+class _SpriteEnemy(pygame.sprite.Sprite):
+    """The old per-sprite Enemy1 update, kept as the swarm baseline."""
+
+    def __init__(self, rect, direction):
+        super().__init__()
+        self.rect = pygame.Rect(rect)
+        self.speed = 4
+        self.direction = direction
+
+    def update(self, enemy_group):
+        from classes.constants import ENEMY_FORCE
+
+        dx, dy = self.direction
+        self.rect.x += dx * self.speed
+        self.rect.y += dy * self.speed
+
+        if self.rect.left < 5:
+            self.rect.left = 5
+            self.direction = random.choice([(1, 0), (0, -1), (0, 1), (1, -1), (1, 1)])
+        elif self.rect.right > WIDTH - 5:
+            self.rect.right = WIDTH - 5
+            self.direction = random.choice([(-1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1)])
+
+        if self.rect.top < 5:
+            self.rect.top = 5
+            self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (1, 1), (-1, 1)])
+        elif self.rect.bottom > HEIGHT - 5:
+            self.rect.bottom = HEIGHT - 5
+            self.direction = random.choice([(1, 0), (-1, 0), (0, -1), (1, -1), (-1, -1)])
+
+        for other_enemy in pygame.sprite.spritecollide(self, enemy_group, False):
+            if other_enemy != self:
+                distance_vec = pygame.math.Vector2(other_enemy.rect.center) - pygame.math.Vector2(self.rect.center)
+                distance = distance_vec.length()
+                angle = distance_vec.angle_to(pygame.math.Vector2(1, 0))
+
+                repel_vec = pygame.math.Vector2(1, 0).rotate(angle)
+                repel_vec *= (1 - (distance / (self.rect.width + other_enemy.rect.width)))
+                repel_vec *= ENEMY_FORCE
+
+                self_dir = pygame.math.Vector2(self.direction)
+                other_dir = pygame.math.Vector2(other_enemy.direction)
+
+                if distance != 0:
+                    new_dir = self_dir.reflect(distance_vec).normalize()
+                    other_new_dir = other_dir.reflect(-distance_vec).normalize()
+
+                    self.direction = new_dir.x, new_dir.y
+                    other_enemy.direction = other_new_dir.x, other_new_dir.y
+
+                self.rect.move_ip(-repel_vec.x, -repel_vec.y)
+                other_enemy.rect.move_ip(repel_vec.x, repel_vec.y)
+
+
+def bench_swarm(frames, count=300):
+    """count Enemy1 steered per sprite and as one array pass, from the same start."""
+    import numpy as np
+
+    from classes.enemies import Enemy1
+    from classes.swarm import overlapping_pairs, spawn_point, steer
+
+    image = pygame.image.load('images/enemy/enemy1_1.png').convert_alpha()
+
+    def overlaps(group):
+        rects = np.array([sprite.rect for sprite in group], np.float64)
+        return len(overlapping_pairs(rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3])[0])
+
+    random.seed(4)
+    scattered = pygame.sprite.Group(
+        Enemy1(random.randint(100, WIDTH - 50), random.randint(50, HEIGHT - 50), image) for _ in range(count)
+    )
+    scattered_overlaps = overlaps(scattered)
+    random.seed(4)
+    placed = pygame.sprite.Group()
+    for _ in range(count):
+        position = spawn_point(placed, image.get_size(), (100, WIDTH - 50), (50, HEIGHT - 50), tries=32)
+        if position is not None:
+            placed.add(Enemy1(*position, image))
+
+    legacy = pygame.sprite.Group(_SpriteEnemy(sprite.rect, sprite.direction) for sprite in scattered)
+    start = time.perf_counter()
+    for _ in range(frames):
+        for sprite in legacy:
+            sprite.update(legacy)
+    legacy_ms = (time.perf_counter() - start) / frames * 1000
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        steer(scattered)
+    swarm_ms = (time.perf_counter() - start) / frames * 1000
+
+    _report(f"swarm ({frames} frames, {count} enemies)", [
+        ("per-sprite update ms/frame", f"{legacy_ms:.2f}"),
+        ("swarm steer ms/frame", f"{swarm_ms:.2f} ({legacy_ms / swarm_ms:.1f}x)"),
+        ("overlaps after, per-sprite / swarm", f"{overlaps(legacy)} / {overlaps(scattered)}"),
+        ("overlaps at random spawn points", f"{scattered_overlaps}"),
+        ("overlaps at spawn_point() points", f"{overlaps(placed)} ({len(placed)} placed)"),
+    ])
+
+
+def bench_texture(frames):
+    """The render_scale scene presented through the display surface and through textures."""
+    from cosmic_ui import ParallaxBackground
+    from classes.collision import rotated
+    from classes.projectiles import ProjectileField, emit_ring
+    from render import RenderTarget, TextureDisplay, TextureTarget
+
+    display = pygame.display.get_surface()
+    background = ParallaxBackground()
+    random.seed(2)
+    meteor_img = pygame.image.load('images/meteors/meteor_2.png').convert_alpha()
+    boss_img = pygame.image.load('images/boss/boss1.png').convert_alpha()
+    explosion_imgs = [pygame.image.load(f"images/explosion2/explosion{i}.png").convert_alpha() for i in range(18)]
+    meteors = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(30)]
+    explosions = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(12)]
+    field = ProjectileField()
+    for step in range(12):
+        emit_ring(field, 'boss2', WIDTH // 2, HEIGHT // 2, 32, step * 5)
+    for _ in range(20):
+        field.update()
+
+    def draw(target, frame):
+        background.update(2.0)
+        background.draw(target)
+        for index, (x, y) in enumerate(meteors):
+            image, _ = rotated(meteor_img, frame + index * 10)
+            target.blit(image, (x, y))
+        target.blit(boss_img, (WIDTH // 2 - 150, 100))
+        for index, (x, y) in enumerate(explosions):
+            target.blit(explosion_imgs[(frame + index) % 18], (x, y))
+        field.draw(target)
+        target.present()
+
+    def run(target, present):
+        # The first pass uploads every texture; only the steady state is timed
+        for frame in range(36):
+            draw(target, frame)
+            present()
+        start = time.perf_counter()
+        for frame in range(frames):
+            draw(target, frame)
+            present()
+        return (time.perf_counter() - start) / frames * 1000
+
+    rows = [("surface ms/frame", f"{run(RenderTarget(display), pygame.display.flip):.2f}")]
+    try:
+        textures = TextureDisplay((WIDTH, HEIGHT), "benchmark", driver='software')
+    except (ImportError, RuntimeError, ValueError) as error:
+        rows.append(("texture", f"unavailable ({error})"))
+    else:
+        target = TextureTarget(textures)
+        rows.append(("texture (software renderer) ms/frame", f"{run(target, textures.present):.2f}"))
+        rows.append(("textures uploaded", f"{len(target._textures)}"))
+    _report(f"texture backend ({frames} frames, {len(field)} projectiles, {len(meteors)} meteors)", rows)
+
+
+def bench_ui(frames):
+    """Menu, pause and game over frames, and their neon widgets on their own."""
+    from cosmic_ui import ParallaxBackground
+    from functions import GameOverScene, PauseScene
+    from menu import MenuScene
+    from scenes import SceneManager
+
+    screen = pygame.display.get_surface()
+    manager = SceneManager(screen, 60)
+    background = ParallaxBackground()
+    menu = MenuScene(manager, background, lambda: None)
+    pause = PauseScene(manager)
+    game_over = GameOverScene(manager, background, lambda: None)
+
+    def widgets_menu():
+        menu.play_button.draw(screen, selected=True)
+        menu.exit_button.draw(screen, selected=False)
+
+    def widgets_pause():
+        pause.title_text.draw(screen, "PAUSED", (WIDTH // 2, HEIGHT // 2 - 80), color=(100, 180, 255))
+        pause.resume_button.draw(screen, selected=True)
+        pause.quit_button.draw(screen, selected=False)
+
+    def widgets_game_over():
+        game_over.title_text.draw(screen, "GAME OVER", (WIDTH // 2, HEIGHT // 2 - 80), color=(255, 60, 60))
+        game_over.score_text.draw(screen, "Final Score: 12,345", (WIDTH // 2, HEIGHT // 2), pulse=False)
+        game_over.retry_button.draw(screen, selected=True)
+        game_over.exit_button.draw(screen, selected=False)
+
+    rows = []
+    for label, draw in (
+        ("menu frame", lambda: menu.draw(screen)),
+        ("pause frame", lambda: pause.draw(screen)),
+        ("game over frame", lambda: game_over.draw(screen)),
+        ("menu widgets", widgets_menu),
+        ("pause widgets", widgets_pause),
+        ("game over widgets", widgets_game_over),
+    ):
+        draw()
+        start = time.perf_counter()
+        for _ in range(frames):
+            draw()
+        rows.append((f"{label} ms", f"{(time.perf_counter() - start) / frames * 1000:.3f}"))
+    _report(f"ui ({frames} frames each)", rows)
+
+
+def bench_scenes(frames):
+    """Pause/resume and game over transitions: warm scene stack vs building the screen on entry."""
+    from scenes import Scene, SceneManager
+    from functions import GameOverScene, PauseScene
+    from cosmic_ui import ParallaxBackground
+
+    screen = pygame.display.get_surface()
+    manager = SceneManager(screen, 60)
+    background = ParallaxBackground()
+    pause = PauseScene(manager)
+    game_over = GameOverScene(manager, background, lambda: None)
+    pygame.mixer.music.load = lambda *args, **kwargs: None
+    pygame.mixer.music.play = lambda *args, **kwargs: None
+    manager.push(Scene())
+    manager.transitions.clear()
+
+    cycles = max(1, frames // 10)
+    for scene in (pause, game_over):
+        for _ in range(cycles):
+            manager.push(scene)
+            manager.pop()
+
+    cold = 0.0
+    for _ in range(cycles):
+        start = time.perf_counter()
+        PauseScene(manager).enter()
+        cold += time.perf_counter() - start
+
+    rows = []
+    for label, (count, mean_ms, worst_ms, _) in sorted(manager.transition_summary().items()):
+        rows.append((f"{label} ms (mean / max)", f"{mean_ms:.3f} / {worst_ms:.3f}"))
+    rows.append(("cold PauseScene build + enter ms", f"{cold / cycles * 1000:.2f}"))
+    rows.append(("60 FPS frame budget ms", f"{1000 / 60:.2f}"))
+    _report(f"scenes ({cycles} cycles each)", rows)
+
+
+def bench_startup(frames):
+    """Cold construction of every scene as main() does, with font setup split out."""
+    import fonts
+    from cosmic_ui import ParallaxBackground
+    from main import GameScene
+    from menu import MenuScene
+    from quality import QualityGovernor
+    from render import RenderTarget
+    from scenes import SceneManager
+
+    screen = pygame.display.get_surface()
+    fonts.clear()
+    start = time.perf_counter()
+    manager = SceneManager(screen, 60)
+    background = ParallaxBackground()
+    game = GameScene(manager, RenderTarget(screen), QualityGovernor(), background)
+    MenuScene(manager, background, lambda: manager.replace(game))
+    startup_ms = (time.perf_counter() - start) * 1000
+    loaded, requested, font_ms = fonts.stats()
+
+    # The same requests the way every widget used to make them
+    start = time.perf_counter()
+    for (face, size, bold), count in fonts.requests().items():
+        for _ in range(count):
+            pygame.font.SysFont('Arial', size, bold=bold)
+    sysfont_ms = (time.perf_counter() - start) * 1000
+
+    _report("startup (menu, game, pause and game over scenes)", [
+        ("scene construction ms", f"{startup_ms:.1f}"),
+        ("font registry ms", f"{font_ms:.2f} ({loaded} fonts for {requested} requests)"),
+        ("SysFont for the same requests ms", f"{sysfont_ms:.2f} (first call scans system fonts)"),
+    ])
+
+
+def bench_snapshot(frames, warmup=900, replay=120):
+    """
+    Capture and restore cost of a busy late-game world, a byte-exact round
+    trip, and the same frames replayed from a restored snapshot. Ticks and
+    wall time are frozen to a frame counter so both runs see the same clock.
+    """
+    from main import GameScene
+    from quality import QualityGovernor
+    from render import RenderTarget
+    from scenes import SceneManager
+    from snapshot import RewindBuffer
+
+    screen = pygame.display.get_surface()
+    game = GameScene(SceneManager(screen, 60), RenderTarget(screen), QualityGovernor(), None)
+    tick = [0]
+    get_ticks, wall_time = pygame.time.get_ticks, time.time
+    pygame.time.get_ticks = lambda: tick[0]
+    time.time = lambda: 1000.0
+
+    # Held fire keeps bullets, hits and explosions in the world
+    game.input.held.add('fire')
+
+    def play(count):
+        for _ in range(count):
+            tick[0] += 17
+            game.score = max(game.score, 16000)
+            game.player_life = 200
+            game.bullet_counter = 200
+            game.step()
+            game.render_queue.clear()
+
+    try:
+        random.seed(8)
+        play(warmup)
+        codec = game.snapshots
+        now = tick[0]
+        live = sum(len(group) for group in (
+            game.enemy1_group, game.enemy2_group, game.meteor_group, game.meteor2_group,
+            game.black_hole_group, game.bullets, game.boss_group,
+        )) + len(game.enemy_projectiles) + len(game.effects)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            data = codec.capture(now)
+        capture_ms = (time.perf_counter() - start) / frames * 1000
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            codec.restore(data, now)
+        restore_ms = (time.perf_counter() - start) / frames * 1000
+        round_trip = codec.capture(now) == data
+
+        play(replay)
+        played = codec.capture(tick[0])
+        tick[0] = now
+        codec.restore(data, now)
+        play(replay)
+        replayed = codec.capture(tick[0]) == played
+
+        rewind = RewindBuffer(codec, seconds=10)
+        start = time.perf_counter()
+        for _ in range(len(rewind.slots)):
+            tick[0] += 17
+            rewind.record()
+        record_ms = (time.perf_counter() - start) / len(rewind.slots) * 1000
+    finally:
+        pygame.time.get_ticks, time.time = get_ticks, wall_time
+
+    _report(f"snapshot ({frames} frames, {live} live entities after {warmup} frames)", [
+        ("snapshot bytes", f"{len(data)}"),
+        ("capture ms", f"{capture_ms:.3f}"),
+        ("restore ms", f"{restore_ms:.3f}"),
+        ("rewind record ms/frame", f"{record_ms:.3f} ({len(rewind.slots)} slots)"),
+        ("restore then capture is identical", "yes" if round_trip else "NO"),
+        (f"replay of {replay} frames is identical", "yes" if replayed else "NO"),
+    ])
+    return round_trip and replayed
+
+
+BENCHMARKS = {
+    'background': bench_background,
+    'camera': bench_camera,
+    'collision': bench_collision,
+    'difficulty': bench_difficulty,
+    'ecs': bench_ecs,
+    'projectiles': bench_projectiles,
+    'render_queue': bench_render_queue,
+    'render_scale': bench_render_scale,
+    'scenes': bench_scenes,
+    'snapshot': bench_snapshot,
+    'startup': bench_startup,
+    'swarm': bench_swarm,
+    'texture': bench_texture,
+    'ui': bench_ui,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cosmic Heat benchmarks")
+    parser.add_argument('name', choices=sorted(BENCHMARKS) + ['all'])
+    parser.add_argument('--frames', type=int, default=600)
+    args = parser.parse_args(argv)
+
+    _setup()
+    names = sorted(BENCHMARKS) if args.name == 'all' else [args.name]
+    # Benchmarks that check their results return False on a mismatch
+    failed = [name for name in names if BENCHMARKS[name](args.frames) is False]
+    pygame.quit()
+    if failed:
+        sys.exit(f"checks failed: {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Camera and post effects for Cosmic Heat.
+Shake, flash and fade are timed in ms and advance one step per frame, so
+they never block the loop. They are applied to the finished frame: the
+shake offset scrolls the frame in place and the strongest flash or fade
+is one overlay blit, so no full-screen copy is made.
+"""
+
+import random
+
+import pygame
+
+
+class Camera:
+    """
+    Post effects for the frame being presented. on_done callbacks run on
+    the frame an effect finishes, which makes them usable as scene
+    transitions.
+    """
+
+    def __init__(self, size):
+        self.offset = (0, 0)
+        self.effects = []
+        self.overlay = pygame.Surface(size)
+        self.overlay_color = None
+
+    def shake(self, duration=400, amplitude=5, on_done=None):
+        """A shake that decays to nothing; replaces a weaker running shake."""
+        for effect in self.effects:
+            if effect[0] == 'shake' and on_done is None and self._strength(effect) > amplitude:
+                return
+        self._start('shake', duration, amplitude, None, on_done)
+
+    def flash(self, color=(255, 255, 255), duration=150, alpha=160, on_done=None):
+        """color over the frame, fading out from alpha."""
+        self._start('flash', duration, alpha, color, on_done)
+
+    def fade(self, color=(0, 0, 0), duration=500, fade_in=False, on_done=None):
+        """Fade the frame out to color, or in from it."""
+        self._start('fade_in' if fade_in else 'fade', duration, 255, color, on_done)
+
+    def clear(self):
+        self.effects.clear()
+        self.offset = (0, 0)
+
+    @property
+    def active(self):
+        return bool(self.effects)
+
+    def apply(self, screen):
+        """Advance every effect and apply them to the finished frame."""
+        if not self.effects:
+            return
+        now = pygame.time.get_ticks()
+        shake = 0
+        overlay_alpha = 0
+        overlay_color = None
+        finished = []
+        for effect in self.effects:
+            kind, start, duration, strength, color, on_done = effect
+            progress = min(1.0, (now - start) / duration) if duration else 1.0
+            if progress >= 1.0:
+                finished.append(effect)
+                continue
+            if kind == 'shake':
+                shake = max(shake, strength * (1 - progress))
+            else:
+                alpha = strength * (progress if kind == 'fade' else 1 - progress)
+                if alpha > overlay_alpha:
+                    overlay_alpha, overlay_color = alpha, color
+        for effect in finished:
+            self.effects.remove(effect)
+
+        amount = round(shake)
+        self.offset = (random.randint(-amount, amount), random.randint(-amount, amount)) if amount else (0, 0)
+        if self.offset != (0, 0):
+            self._scroll(screen, *self.offset)
+        if overlay_alpha >= 1:
+            if overlay_color != self.overlay_color:
+                self.overlay.fill(overlay_color)
+                self.overlay_color = overlay_color
+            self.overlay.set_alpha(int(overlay_alpha))
+            screen.blit(self.overlay, (0, 0))
+
+        for effect in finished:
+            if effect[5] is not None:
+                effect[5]()
+
+    def _start(self, kind, duration, strength, color, on_done):
+        # A newer effect of the same kind takes over, unless the old one has a callback to run
+        self.effects = [effect for effect in self.effects if effect[0] != kind or effect[5] is not None]
+        self.effects.append((kind, pygame.time.get_ticks(), duration, strength, color, on_done))
+
+    def _strength(self, effect):
+        kind, start, duration, strength, _, _ = effect
+        if not duration:
+            return 0
+        return strength * max(0.0, 1 - (pygame.time.get_ticks() - start) / duration)
+
+    def _scroll(self, screen, dx, dy):
+        """Move the frame by (dx, dy) in place and blank the uncovered edges."""
+        width, height = screen.get_size()
+        screen.scroll(dx, dy)
+        if dx > 0:
+            screen.fill((0, 0, 0), (0, 0, dx, height))
+        elif dx < 0:
+            screen.fill((0, 0, 0), (width + dx, 0, -dx, height))
+        if dy > 0:
+            screen.fill((0, 0, 0), (0, 0, width, dy))
+        elif dy < 0:
+            screen.fill((0, 0, 0), (0, height + dy, width, -dy))
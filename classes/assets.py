@@ -0,0 +1,40 @@
+import pygame
+
+
+# Shared by every entity, so each file is decoded once per process. Sounds
+# are keyed by (path, volume) because one file can play at several volumes.
+_images = {}
+_sounds = {}
+
+
+def load_image(path):
+    """Alpha-converted image, loaded on first use."""
+    image = _images.get(path)
+    if image is None:
+        image = pygame.image.load(path).convert_alpha()
+        _images[path] = image
+    return image
+
+
+def load_sound(path, volume):
+    """
+    Sound at volume, loaded on first use. pygame.mixer.Sound is looked up
+    per call, so counters installed at startup still see the load.
+    """
+    key = (path, volume)
+    sound = _sounds.get(key)
+    if sound is None:
+        sound = pygame.mixer.Sound(path)
+        sound.set_volume(volume)
+        _sounds[key] = sound
+    return sound
+
+
+def stats():
+    """(cached images, cached sounds)"""
+    return len(_images), len(_sounds)
+
+
+def clear():
+    _images.clear()
+    _sounds.clear()
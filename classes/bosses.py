@@ -2,272 +2,368 @@ import pygame
 import random
 import math
 
+from .assets import load_image, load_sound
 from .constants import WIDTH, HEIGHT
-
-
-class Boss1(pygame.sprite.Sprite):
-
-    def __init__(self, x, y, image):
+from .projectiles import PROJECTILE_TYPES, emit_aimed, emit_fan, emit_parallel, emit_ring
+
+
+# Bosses spawn in order as the score passes their 'score' threshold. Each
+# phase runs until it has fired 'shots' volleys; the last phase runs forever.
+# 'bullet' names an entry in projectiles.PROJECTILE_TYPES; FIRE_KEYS lists
+# the other keys each fire pattern reads. BossSpawner checks them on load.
+BOSS_DEFINITIONS = [
+    {
+        'name': 'boss1',
+        'image': 'images/boss/boss1.png',
+        'score': 5000,
+        'health': 150,
+        'hit_damage': 5,
+        'contact_damage': 20,
+        'reward': 400,
+        'drop_chance': 20,
+        'wobble': 3,
+        'teleport_interval': 0,
+        'phases': [
+            {
+                'shots': 20,
+                'movement': 'patrol',
+                'speed': 6,
+                'fire': 'volley',
+                'fire_interval': 60,
+                'offsets': (-20, 20, 0),
+                'bullet': 'boss1',
+            },
+            {'movement': 'chase', 'speed': 10},
+        ],
+    },
+    {
+        'name': 'boss2',
+        'image': 'images/boss/boss2_1.png',
+        'score': 10000,
+        'health': 150,
+        'hit_damage': 8,
+        'contact_damage': 2,
+        'reward': 800,
+        'drop_chance': 20,
+        'wobble': 2,
+        'teleport_interval': 0,
+        'phases': [
+            {
+                'shots': 20,
+                'movement': 'bounce',
+                'speed': 5,
+                'fire': 'aimed',
+                'fire_interval': 100,
+                'bullet': 'boss2',
+            },
+            {'movement': 'chase', 'speed': 5 / math.sqrt(2)},
+        ],
+    },
+    {
+        'name': 'boss3',
+        'image': 'images/boss/boss3.png',
+        'score': 15000,
+        'health': 200,
+        'hit_damage': 6,
+        'contact_damage': 1,
+        'reward': 1000,
+        'drop_chance': 20,
+        'wobble': 2,
+        'teleport_interval': 160,
+        'phases': [
+            {
+                'shots': 20,
+                'movement': 'bounce',
+                'speed': 5,
+                'fire': 'aimed',
+                'fire_interval': 120,
+                'bullet': 'boss3',
+            },
+            {'movement': 'chase', 'speed': 5 / math.sqrt(2)},
+        ],
+    },    {
+        'name': 'boss4',
+        'image': 'images/boss/boss2.png',
+        'score': 20000,
+        'health': 250,
+        'hit_damage': 5,
+        'contact_damage': 2,
+        'reward': 1500,
+        'drop_chance': 10,
+        'wobble': 2,
+        'teleport_interval': 0,
+        'phases': [
+            {
+                'shots': 12,
+                'movement': 'patrol',
+                'speed': 4,
+                'fire': 'fan',
+                'fire_interval': 60,
+                'spread': 70,
+                'count': 7,
+                'bullet': 'boss4',
+            },
+            {
+                'shots': 10,
+                'movement': 'bounce',
+                'speed': 3,
+                'fire': 'ring',
+                'fire_interval': 75,
+                'count': 16,
+                'bullet': 'boss4',
+            },
+            {
+                'movement': 'bounce',
+                'speed': 2,
+                'fire': 'spiral',
+                'fire_interval': 12,
+                'count': 4,
+                'spin': 13,
+                'bullet': 'boss4',
+            },
+        ],
+    },
+]
+
+WARNING_SOUND = 'game_sounds/warning.mp3'
+HEALTH_BAR_HEIGHT = 5
+
+def _direction_to(source, target):
+    direction = pygame.math.Vector2(
+        target.rect.centerx - source.rect.centerx,
+        target.rect.centery - source.rect.centery
+    )
+    if direction.length_squared() == 0:
+        return pygame.math.Vector2(0, 1)
+    return direction.normalize()
+
+
+def _move_patrol(boss, player, phase):
+    dx, dy = boss.direction
+    boss.rect.x += dx * phase['speed']
+    boss.rect.y = max(boss.rect.y, 50)
+    if boss.rect.left < 5:
+        boss.rect.left = 5
+        boss.direction = (1, 0)
+    elif boss.rect.right > WIDTH - 5:
+        boss.rect.right = WIDTH - 5
+        boss.direction = (-1, 0)
+
+
+def _move_bounce(boss, player, phase):
+    dx, dy = boss.direction
+    speed = phase['speed'] / math.sqrt(2) if dx and dy else phase['speed']
+    boss.rect.x += dx * speed
+    boss.rect.y += dy * speed
+    if boss.rect.left < 5:
+        boss.rect.left = 5
+        boss.direction = (1, dy or 1)
+    elif boss.rect.right > WIDTH - 5:
+        boss.rect.right = WIDTH - 5
+        boss.direction = (-1, dy or 1)
+    elif boss.rect.top < 70:
+        boss.rect.top = 70
+        boss.direction = (dx or 1, 1)
+    elif boss.rect.bottom > HEIGHT - 5:
+        boss.rect.bottom = HEIGHT - 5
+        boss.direction = (dx or 1, -1)
+
+
+def _move_chase(boss, player, phase):
+    direction = _direction_to(boss, player)
+    boss.rect.x += direction.x * phase['speed']
+    boss.rect.y += direction.y * phase['speed']
+
+
+def _fire_volley(boss, player, phase, projectiles):
+    bullet = phase['bullet']
+    emit_parallel(
+        projectiles, bullet, boss.rect.centerx, projectiles.below(bullet, boss.rect.bottom), phase['offsets']
+    )
+
+
+def _fire_aimed(boss, player, phase, projectiles):
+    bullet = phase['bullet']
+    emit_aimed(
+        projectiles, bullet, boss.rect.centerx, projectiles.below(bullet, boss.rect.bottom), player,
+        phase.get('count', 1), phase.get('spread', 0)
+    )
+
+
+def _fire_fan(boss, player, phase, projectiles):
+    bullet = phase['bullet']
+    emit_fan(
+        projectiles, bullet, boss.rect.centerx, projectiles.below(bullet, boss.rect.bottom),
+        90, phase['spread'], phase['count']
+    )
+
+
+def _fire_ring(boss, player, phase, projectiles):
+    emit_ring(projectiles, phase['bullet'], boss.rect.centerx, boss.rect.centery, phase['count'])
+
+
+def _fire_spiral(boss, player, phase, projectiles):
+    boss.spiral_angle = (boss.spiral_angle + phase['spin']) % 360
+    emit_ring(
+        projectiles, phase['bullet'], boss.rect.centerx, boss.rect.centery,
+        phase['count'], boss.spiral_angle
+    )
+
+
+MOVEMENTS = {
+    'patrol': _move_patrol,
+    'bounce': _move_bounce,
+    'chase': _move_chase,
+}
+
+FIRE_PATTERNS = {
+    'volley': _fire_volley,
+    'aimed': _fire_aimed,
+    'fan': _fire_fan,
+    'ring': _fire_ring,
+    'spiral': _fire_spiral,
+}
+
+FIRE_KEYS = {
+    'volley': ('offsets',),
+    'aimed': (),
+    'fan': ('spread', 'count'),
+    'ring': ('count',),
+    'spiral': ('count', 'spin'),
+}
+
+PATROL_DIRECTIONS = [(-1, 0), (1, 0)]
+BOUNCE_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+
+class Boss(pygame.sprite.Sprite):
+
+    def __init__(self, x, y, definition):
         super().__init__()
-        self.image = image
+        self.definition = definition
+        self.image = load_image(definition['image'])
         self.rect = self.image.get_rect(center=(x, y))
-        self.speed = 6
-        self.direction = random.choice([(-1, 0), (1, 0)])
-        self.shoot_timer = 0
+        self.max_health = definition['health']
+        self.health = self.max_health
+        self.hit_damage = definition['hit_damage']
+        self.contact_damage = definition['contact_damage']
+        self.reward = definition['reward']
+        self.drop_chance = definition['drop_chance']
+        self.phases = definition['phases']
+        self.phase_index = 0
         self.shots_fired = 0
-
-    def update(self, enemy_bullets_group, player):
-        self.rect.x += math.sin(pygame.time.get_ticks() * 0.01) * 3
-        self.rect.y += math.sin(pygame.time.get_ticks() * 0.01) * 3
-        if self.shots_fired < 20:
-            dx, dy = self.direction
-            self.rect.x += dx * self.speed
-            self.rect.y = max(self.rect.y, 50)
-
-            if self.rect.left < 5:
-                self.rect.left = 5
-                self.direction = (1, 0)
-            elif self.rect.right > WIDTH - 5:
-                self.rect.right = WIDTH - 5
-                self.direction = (-1, 0)
-
-            self.shoot_timer += 1
-            if self.shoot_timer >= 60:
-                bullet1 = Boss1Bullet(self.rect.centerx - 20, self.rect.bottom)
-                bullet2 = Boss1Bullet(self.rect.centerx + 20, self.rect.bottom)
-                bullet3 = Boss1Bullet(self.rect.centerx, self.rect.bottom)
-                enemy_bullets_group.add(bullet1, bullet2, bullet3)
-                self.shoot_timer = 0
-                self.shots_fired += 1
-        else:
-            self.speed = 10
-            dx = player.rect.centerx - self.rect.centerx
-            dy = player.rect.centery - self.rect.centery
-            direction = pygame.math.Vector2(dx, dy).normalize()
-
-            self.rect.x += direction.x * self.speed
-            self.rect.y += direction.y * self.speed
-
-
-class Boss1Bullet(pygame.sprite.Sprite):
-
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.image.load('images/bullets/bulletboss1.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y + 10
-        self.speed = 10
-        self.shoot_sound = pygame.mixer.Sound('game_sounds/shooting/boss1shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
-        self.shoot_sound.play()
-
-    def update(self):
-        self.rect.move_ip(0, self.speed)
-
-        if self.rect.top > HEIGHT:
-            self.kill()
-
-
-class Boss2(pygame.sprite.Sprite):
-
-    def __init__(self, x, y, image):
-        super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = 5
-        self.direction = random.choice([(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)])
-        self.direction_x, self.direction_y = self.direction
         self.shoot_timer = 0
-        self.shots_fired = 0
-
-    def update(self, enemy_bullets_group, player):
-        self.rect.x += math.sin(pygame.time.get_ticks() * 0.01) * 2
-        self.rect.y += math.sin(pygame.time.get_ticks() * 0.01) * 2
-        if self.shots_fired < 20:
-            dx, dy = self.direction
-            if self.direction in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
-                self.speed = 5 / math.sqrt(2)
-            else:
-                self.speed = 5
-            self.rect.x += dx * self.speed
-            self.rect.y += dy * self.speed
-
-            if self.rect.left < 5:
-                self.rect.left = 5
-                self.direction_x = 1
-                if self.direction_y == 0:
-                    self.direction_y = 1
-            elif self.rect.right > WIDTH - 5:
-                self.rect.right = WIDTH - 5
-                self.direction_x = -1
-                if self.direction_y == 0:
-                    self.direction_y = 1
-            elif self.rect.top < 70:
-                self.rect.top = 70
-                self.direction_y = 1
-                if self.direction_x == 0:
-                    self.direction_x = 1
-            elif self.rect.bottom > HEIGHT - 5:
-                self.rect.bottom = HEIGHT - 5
-                self.direction_y = -1
-                if self.direction_x == 0:
-                    self.direction_x = 1
-
-            self.direction = (self.direction_x, self.direction_y)
-            self.shoot_timer += 1
-            if self.shoot_timer >= 100:
-                dx = player.rect.centerx - self.rect.centerx
-                dy = player.rect.centery - self.rect.centery
-                direction = pygame.math.Vector2(dx, dy).normalize()
-                bullet = Boss2Bullet(self.rect.centerx, self.rect.bottom, direction)
-                enemy_bullets_group.add(bullet)
-                self.shoot_timer = 0
-                self.shots_fired += 1
-        else:
-            if self.speed != 5:
-                self.speed = 5 / math.sqrt(2)
-            dx = player.rect.centerx - self.rect.centerx
-            dy = player.rect.centery - self.rect.centery
-            direction = pygame.math.Vector2(dx, dy).normalize()
-
-            self.rect.x += direction.x * self.speed
-            self.rect.y += direction.y * self.speed
-
-            self.direction_x = direction.x / abs(direction.x) if direction.x != 0 else 0
-            self.direction_y = direction.y / abs(direction.y) if direction.y != 0 else 0
-            self.direction = (self.direction_x, self.direction_y)
-
-
-class Boss2Bullet(pygame.sprite.Sprite):
-
-    def __init__(self, x, y, direction):
-        super().__init__()
-        self.image_orig = pygame.image.load('images/bullets/bulletboss2.png').convert_alpha()
-        self.image = self.image_orig
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y + 10
-        self.speed = 11
-        self.direction = direction
-        self.shoot_sound = pygame.mixer.Sound('game_sounds/shooting/boss2shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
-        self.shoot_sound.play()
-
-    def update(self):
-        self.rect.move_ip(self.direction.x * self.speed, self.direction.y * self.speed)
-
-        angle = math.atan2(self.direction.y, self.direction.x)
-        angle = math.degrees(angle)
+        self.teleport_timer = 0
+        self.contact_timer = 0
+        self.spiral_angle = 0
+        first_movement = self.phases[0]['movement']
+        self.direction = random.choice(PATROL_DIRECTIONS if first_movement == 'patrol' else BOUNCE_DIRECTIONS)
 
-        self.image = pygame.transform.rotate(self.image_orig, -angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        self.health_bar = pygame.Surface((self.max_health, HEALTH_BAR_HEIGHT))
+        self._render_health_bar()
 
-        if self.rect.top > HEIGHT:
-            self.kill()
+    @property
+    def phase(self):
+        return self.phases[self.phase_index]
 
+    def update(self, projectiles, player):
+        wobble = math.sin(pygame.time.get_ticks() * 0.01) * self.definition['wobble']
+        self.rect.x += wobble
+        self.rect.y += wobble
 
-class Boss3(pygame.sprite.Sprite):
+        phase = self.phase
+        MOVEMENTS[phase['movement']](self, player, phase)
 
-    def __init__(self, x, y, image):
-        super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = 5
-        self.direction = random.choice([(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)])
-        self.direction_x, self.direction_y = self.direction
-        self.shoot_timer = 0
-        self.shots_fired = 0
-        self.teleport_timer = 0
-        self.teleport_interval = 160
-
-    def update(self, enemy_bullets_group, player):
-        self.rect.x += math.sin(pygame.time.get_ticks() * 0.01) * 2
-        self.rect.y += math.sin(pygame.time.get_ticks() * 0.01) * 2
-        if self.shots_fired < 20:
-            dx, dy = self.direction
-            if self.direction in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
-                self.speed = 5 / math.sqrt(2)
-            else:
-                self.speed = 5
-            self.rect.x += dx * self.speed
-            self.rect.y += dy * self.speed
-
-            if self.rect.left < 5:
-                self.rect.left = 5
-                self.direction_x = 1
-                if self.direction_y == 0:
-                    self.direction_y = 1
-            elif self.rect.right > WIDTH - 5:
-                self.rect.right = WIDTH - 5
-                self.direction_x = -1
-                if self.direction_y == 0:
-                    self.direction_y = 1
-            elif self.rect.top < 70:
-                self.rect.top = 70
-                self.direction_y = 1
-                if self.direction_x == 0:
-                    self.direction_x = 1
-            elif self.rect.bottom > HEIGHT - 5:
-                self.rect.bottom = HEIGHT - 5
-                self.direction_y = -1
-                if self.direction_x == 0:
-                    self.direction_x = 1
-
-            self.direction = (self.direction_x, self.direction_y)
+        fire = phase.get('fire')
+        if fire:
             self.shoot_timer += 1
-            if self.shoot_timer >= 120:
-                dx = player.rect.centerx - self.rect.centerx
-                dy = player.rect.centery - self.rect.centery
-                direction = pygame.math.Vector2(dx, dy).normalize()
-                bullet = Boss3Bullet(self.rect.centerx, self.rect.bottom, direction)
-                enemy_bullets_group.add(bullet)
+            if self.shoot_timer >= phase['fire_interval']:
+                FIRE_PATTERNS[fire](self, player, phase, projectiles)
+                projectiles.play(phase['bullet'])
                 self.shoot_timer = 0
                 self.shots_fired += 1
-        else:
-            if self.speed != 5:
-                self.speed = 5 / math.sqrt(2)
-            dx = player.rect.centerx - self.rect.centerx
-            dy = player.rect.centery - self.rect.centery
-            direction = pygame.math.Vector2(dx, dy).normalize()
-
-            self.rect.x += direction.x * self.speed
-            self.rect.y += direction.y * self.speed
-
-            self.direction_x = direction.x / abs(direction.x) if direction.x != 0 else 0
-            self.direction_y = direction.y / abs(direction.y) if direction.y != 0 else 0
-            self.direction = (self.direction_x, self.direction_y)
-
-        self.teleport_timer += 1
-        if self.teleport_timer >= self.teleport_interval:
-            self.rect.centerx = random.randint(50, WIDTH - 50)
-            self.rect.centery = random.randint(100, HEIGHT - 100)
-            self.teleport_timer = 0
-
-
-class Boss3Bullet(pygame.sprite.Sprite):
-
-    def __init__(self, x, y, direction):
-        super().__init__()
-        self.image_orig = pygame.image.load('images/bullets/bulletboss3.png').convert_alpha()
-        self.image = self.image_orig
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y + 10
-        self.speed = 15
-        self.direction = direction
-        self.shoot_sound = pygame.mixer.Sound('game_sounds/shooting/boss2shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
-        self.shoot_sound.play()
-
-    def update(self):
-        self.rect.move_ip(self.direction.x * self.speed, self.direction.y * self.speed)
-
-        angle = math.atan2(self.direction.y, self.direction.x)
-        angle = math.degrees(angle)
-
-        self.image = pygame.transform.rotate(self.image_orig, -angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
-
-        if self.rect.top > HEIGHT:
-            self.kill()
+                if self.shots_fired >= phase.get('shots', math.inf) and self.phase_index < len(self.phases) - 1:
+                    self.phase_index += 1
+                    self.shots_fired = 0
+
+        interval = self.definition['teleport_interval']
+        if interval:
+            self.teleport_timer += 1
+            if self.teleport_timer >= interval:
+                self.rect.centerx = random.randint(50, WIDTH - 50)
+                self.rect.centery = random.randint(100, HEIGHT - 100)
+                self.teleport_timer = 0
+
+        if self.contact_timer > 0:
+            self.contact_timer -= 1
+
+    def touch(self, interval=15):
+        """Returns True at most once every interval frames of player contact."""
+        if self.contact_timer > 0:
+            return False
+        self.contact_timer = interval
+        return True
+
+    def hit(self):
+        """Apply one player bullet; returns True when the boss is destroyed."""
+        self.health = max(0, self.health - self.hit_damage)
+        self._render_health_bar()
+        return self.health <= 0
+
+    def _render_health_bar(self):
+        self.health_bar.fill((255, 0, 0))
+        self.health_bar.fill((0, 255, 0), (0, 0, self.health, HEALTH_BAR_HEIGHT))
+
+    def draw_health_bar(self, surface):
+        surface.blit(self.health_bar, (
+            self.rect.centerx - self.max_health // 2,
+            self.rect.top - 5 - HEALTH_BAR_HEIGHT // 2
+        ))
+
+
+def check_definition(definition):
+    """Raises ValueError if a phase of definition could not run."""
+    for index, phase in enumerate(definition['phases']):
+        where = f"{definition['name']} phase {index}"
+        if phase['movement'] not in MOVEMENTS:
+            raise ValueError(f"{where}: unknown movement {phase['movement']!r}")
+        fire = phase.get('fire')
+        if fire is None:
+            continue
+        if fire not in FIRE_PATTERNS:
+            raise ValueError(f"{where}: unknown fire pattern {fire!r}")
+        missing = [key for key in ('fire_interval', 'bullet', *FIRE_KEYS[fire]) if key not in phase]
+        if missing:
+            raise ValueError(f"{where}: {fire} needs {', '.join(missing)}")
+        if phase['bullet'] not in PROJECTILE_TYPES:
+            raise ValueError(f"{where}: unknown bullet {phase['bullet']!r}")
+        if phase.get('count', 1) < 1:
+            raise ValueError(f"{where}: count must be at least 1")
+
+
+class BossSpawner:
+    """Spawns bosses from BOSS_DEFINITIONS in score order."""
+
+    def __init__(self, definitions=BOSS_DEFINITIONS):
+        for definition in definitions:
+            check_definition(definition)
+        self.definitions = sorted(definitions, key=lambda definition: definition['score'])
+        self.next_index = 0
+
+    def reset(self):
+        self.next_index = 0
+
+    def update(self, score, boss_group):
+        """Checks only the next pending boss, so cost is constant per frame."""
+        spawned = 0
+        while self.next_index < len(self.definitions) and score >= self.definitions[self.next_index]['score']:
+            definition = self.definitions[self.next_index]
+            load_sound(WARNING_SOUND, 1.0).play()
+            boss_group.add(Boss(
+                random.randint(200, WIDTH - 100),
+                random.randint(-HEIGHT, -100),
+                definition,
+            ))
+            self.next_index += 1
+            spawned += 1
+        return spawned
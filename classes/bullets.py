@@ -1,18 +1,22 @@
 import pygame
 
+from .assets import load_sound
+
 
 class Bullet(pygame.sprite.Sprite):
+    # Shared by every bullet so scaled and masked copies are built only once
+    shared_image = None
 
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.image.load('images/bullets/bullet1.png').convert_alpha()
+        if Bullet.shared_image is None:
+            Bullet.shared_image = pygame.image.load('images/bullets/bullet1.png').convert_alpha()
+        self.image = Bullet.shared_image
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y - 10
         self.speed = 10
-        self.shoot_sound = pygame.mixer.Sound('game_sounds/shooting/shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
-        self.shoot_sound.play()
+        self.shoot_sound = load_sound('game_sounds/shooting/shoot.mp3', 0.4)
 
     def update(self):
         self.rect.move_ip(0, -self.speed)
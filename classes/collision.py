@@ -0,0 +1,164 @@
+import time
+import weakref
+
+import pygame
+
+from .constants import ROTATION_STEP
+from .counters import Deltas
+
+
+_masks = weakref.WeakKeyDictionary()
+_rotations = weakref.WeakKeyDictionary()
+
+
+def get_mask(image):
+    """Return the collision mask for an image, building it only once."""
+    mask = _masks.get(image)
+    if mask is None:
+        mask = pygame.mask.from_surface(image)
+        _masks[image] = mask
+    return mask
+
+
+def rotated(image, angle, step=ROTATION_STEP):
+    """
+    Return (surface, mask) for image rotated by angle degrees, quantized to
+    step. Each rotation step is rendered and masked on first use only.
+    """
+    frames = _rotations.get(image)
+    if frames is None:
+        frames = [None] * (360 // step)
+        _rotations[image] = frames
+    index = round(angle / step) % len(frames)
+    frame = frames[index]
+    if frame is None:
+        surface = pygame.transform.rotozoom(image, index * step, 1)
+        frame = (surface, get_mask(surface))
+        frames[index] = frame
+    return frame
+
+
+def sprite_mask(sprite):
+    mask = getattr(sprite, 'mask', None)
+    if mask is None:
+        mask = get_mask(sprite.image)
+    return mask
+
+
+def collide(left, right):
+    """Pixel-accurate collision; the rect test stays as the fast reject."""
+    if not left.rect.colliderect(right.rect):
+        return False
+    offset = (right.rect.x - left.rect.x, right.rect.y - left.rect.y)
+    return sprite_mask(left).overlap(sprite_mask(right), offset) is not None
+
+
+class CollisionPair:
+    """
+    One registered (left, right) group pair. handler(pair, sprite, hits)
+    runs for every left sprite that hit something; damage, score and any
+    other values given at registration are attributes for it to read.
+    """
+
+    def __init__(self, name, left, right, handler, damage=0, score=0,
+                 kill_left=False, kill_right=False, test=collide, **values):
+        self.name = name
+        self.left = left
+        self.right = right
+        self.handler = handler
+        self.damage = damage
+        self.score = score
+        self.kill_left = kill_left
+        self.kill_right = kill_right
+        self.test = test
+        for key, value in values.items():
+            setattr(self, key, value)
+        self.tests = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+
+class CollisionRegistry:
+    """
+    Collision pairs resolved in registration order with one query per pair
+    per frame, so a sprite killed by an earlier pair is no longer tested
+    by later ones. Each pair keeps its own test, hit and time totals.
+    """
+
+    def __init__(self):
+        self.pairs = []
+        self._deltas = Deltas()
+
+    def register(self, name, left, right, handler, **values):
+        pair = CollisionPair(name, left, right, handler, **values)
+        self.pairs.append(pair)
+        return pair
+
+    def resolve(self):
+        """Run every pair once; returns the number of sprite pairs tested."""
+        tests = 0
+        for pair in self.pairs:
+            count = len(pair.left) * len(pair.right)
+            if not count:
+                continue
+            start = time.perf_counter()
+            hits = self.query(pair)
+            for sprite, others in hits.items():
+                pair.handler(pair, sprite, others)
+            pair.seconds += time.perf_counter() - start
+            pair.tests += count
+            pair.hits += len(hits)
+            tests += count
+        return tests
+
+    def query(self, pair):
+        """
+        groupcollide() for the pair, with the same result and kills. The
+        rect tests run from the smaller group with one collidelistall()
+        per sprite, so a large swarm costs C loops rather than Python ones.
+        """
+        left = pair.left.sprites()
+        right = pair.right.sprites()
+        test = pair.test
+        found = {}
+        if len(right) <= len(left):
+            left_rects = [sprite.rect for sprite in left]
+            for other in right:
+                for index in other.rect.collidelistall(left_rects):
+                    if test is None or test(left[index], other):
+                        found.setdefault(index, []).append(other)
+        else:
+            right_rects = [other.rect for other in right]
+            for index, sprite in enumerate(left):
+                for other_index in sprite.rect.collidelistall(right_rects):
+                    other = right[other_index]
+                    if test is None or test(sprite, other):
+                        found.setdefault(index, []).append(other)
+
+        # groupcollide walks the left group in order, and a right sprite it
+        # kills is gone before the next left sprite is tested
+        hits = {}
+        taken = set()
+        for index in sorted(found):
+            others = found[index]
+            if pair.kill_right:
+                others = [other for other in others if other not in taken]
+                if not others:
+                    continue
+                taken.update(others)
+            hits[left[index]] = others
+        for sprite, others in hits.items():
+            if pair.kill_left:
+                sprite.kill()
+            if pair.kill_right:
+                for other in others:
+                    other.kill()
+        return hits
+
+    def take_costs(self):
+        """(name, tests, hits, us) per pair since the previous call."""
+        costs = []
+        for pair in self.pairs:
+            tests, hits, seconds = self._deltas.take((pair.tests, pair.hits, pair.seconds), pair.name)
+            costs.append((pair.name, tests, hits, int(seconds * 1e6)))
+        return costs
@@ -1,3 +1,5 @@
+import os
+
 WIDTH = 1200
 HEIGHT = 800
 
@@ -7,3 +9,34 @@ FPS = 60
 WHITE = (154, 164, 166)
 BLACK = (0, 0, 0)
 RED = (255, 0, 0)
+
+# Degrees between cached rotation frames of spinning sprites
+ROTATION_STEP = 4
+
+CAPTURE_DIR = 'captures'
+CAPTURE_FORMAT = 'png'
+CAPTURE_SCALE = 0.5
+CAPTURE_SLOTS = 32
+
+TELEMETRY_PATH = os.environ.get('COSMIC_TELEMETRY', '')
+MEMTRACK_PATH = os.environ.get('COSMIC_MEMTRACK', '')
+
+LEADERBOARD_PATH = os.environ.get('COSMIC_LEADERBOARD', 'leaderboard.db')
+PLAYER_NAME = os.environ.get('COSMIC_PLAYER', os.environ.get('USER', 'player'))
+
+# 'auto' adapts to frame times; a tier name (high, medium, low, minimal) pins it
+QUALITY = os.environ.get('COSMIC_QUALITY', 'auto')
+
+# 'surface' blits onto the display surface; 'texture' draws the world with
+# pygame._sdl2.video textures and falls back to 'surface' if that fails
+RENDERER = os.environ.get('COSMIC_RENDERER', 'surface')
+
+# Fraction of the window resolution the world is drawn at before scaling up
+RENDER_SCALE = float(os.environ.get('COSMIC_RENDER_SCALE', '1.0'))
+
+# 1 renders the parallax background a frame ahead on a worker thread
+BACKGROUND_THREAD = os.environ.get('COSMIC_BACKGROUND_THREAD', '0') == '1'
+
+# Seconds of gameplay kept for the F8 debug rewind; 0 turns it off
+REWIND_SECONDS = float(os.environ.get('COSMIC_REWIND', '0'))
+REWIND_STEP = 2
@@ -0,0 +1,15 @@
+class Deltas:
+    """
+    Running totals reported as per-call amounts: take() returns how much
+    each total has grown since the previous take() with the same key.
+    """
+
+    def __init__(self):
+        self.last = {}
+
+    def take(self, totals, key=None):
+        last = self.last.get(key)
+        self.last[key] = totals
+        if last is None:
+            return totals
+        return tuple(total - previous for total, previous in zip(totals, last))
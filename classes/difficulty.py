@@ -0,0 +1,85 @@
+from bisect import bisect_right
+
+
+# Each row applies from its score on and only lists what changes; the
+# first row must set everything. 'background' is the parallax speed,
+# 'speed' the move speed of a lifetime group's sprites, 'spawn' the
+# 1-in-N chance per frame of a spawn (None: not yet), and 'damage'
+# overrides a collision pair's damage by pair name.
+DIFFICULTY_CURVE = [
+    {
+        'score': 0,
+        'background': 1.0,
+        'speed': {'meteors': 2, 'meteors2': 2, 'extra_score': 2, 'black_holes': 2},
+        'spawn': {
+            'enemy1': 120, 'enemy2': None, 'extra_score': 60,
+            'meteors': None, 'meteors2': 90, 'black_holes': None,
+        },
+        'damage': {},
+    },
+    {'score': 1000, 'spawn': {'black_holes': 500}},
+    {
+        'score': 3000,
+        'background': 1.5,
+        'speed': {'meteors': 4, 'meteors2': 4},
+        'spawn': {'enemy2': 40, 'meteors': 100},
+    },
+    {'score': 5000, 'speed': {'black_holes': 4}},
+    {'score': 10000, 'background': 2.0, 'speed': {'meteors': 6, 'meteors2': 6, 'extra_score': 4}},
+    {'score': 15000, 'background': 2.5, 'speed': {'meteors': 8, 'meteors2': 8, 'extra_score': 6, 'black_holes': 6}},
+    {'score': 20000, 'speed': {'meteors': 10, 'meteors2': 10, 'extra_score': 8, 'black_holes': 8}},
+]
+
+
+class DifficultyCurve:
+    """
+    Score breakpoints from a DIFFICULTY_CURVE table. update() only compares
+    the score with the current tier's bounds; when a breakpoint is crossed,
+    either way, each subscriber whose setting changed gets its new value.
+    """
+
+    def __init__(self, table=DIFFICULTY_CURVE):
+        rows = sorted(table, key=lambda row: row['score'])
+        self.breakpoints = [row['score'] for row in rows]
+        # Every tier holds the full settings, merged from the rows up to it
+        self.tiers = []
+        settings = {}
+        for row in rows:
+            settings = dict(settings)
+            for key, value in row.items():
+                if key != 'score':
+                    settings[key] = {**settings.get(key, {}), **value} if isinstance(value, dict) else value
+            self.tiers.append(settings)
+        self.subscribers = []
+        self.index = 0
+        # The first tier also covers anything below its score
+        self.low = float('-inf')
+        self.high = self._bound(1)
+        self.changes = 0
+
+    @property
+    def settings(self):
+        return self.tiers[self.index]
+
+    def _bound(self, index):
+        return self.breakpoints[index] if index < len(self.breakpoints) else float('inf')
+
+    def subscribe(self, key, callback):
+        """callback(value) now and whenever the value of settings[key] changes."""
+        self.subscribers.append((key, callback))
+        callback(self.settings[key])
+
+    def update(self, score):
+        """Returns True when score moved the curve to another tier."""
+        if self.low <= score < self.high:
+            return False
+        previous = self.settings
+        self.index = max(0, bisect_right(self.breakpoints, score) - 1)
+        self.low = self.breakpoints[self.index] if self.index else float('-inf')
+        self.high = self._bound(self.index + 1)
+        self.changes += 1
+        current = self.settings
+        for key, callback in self.subscribers:
+            if current[key] != previous[key]:
+                callback(current[key])
+        return True
@@ -0,0 +1,412 @@
+import numpy as np
+import pygame
+
+from .swarm import overlapping_pairs
+
+
+# name -> (dtype, shape of one entity's value). Positions are rect top-lefts;
+# 'image' indexes World.images; 'ttl' of 0 means no limit; an entity dies
+# once its bottom edge reaches 'kill_below'; 'layer' holds collision bits;
+# 'sprite' points back at an EntitySprite.
+COMPONENTS = {
+    'position': (np.float64, (2,)),
+    'size': (np.int32, (2,)),
+    'direction': (np.float64, (2,)),
+    'speed': (np.float64, ()),
+    'image': (np.int32, ()),
+    'age': (np.int32, ()),
+    'ttl': (np.int32, ()),
+    'kill_below': (np.float64, ()),
+    'layer': (np.uint8, ()),
+    'sprite': (object, ()),
+}
+
+
+class Archetype:
+    """
+    Every entity with exactly one set of components, one array per
+    component. Rows 0..count are live; removing a row moves the last one
+    into its place.
+    """
+
+    def __init__(self, components, capacity=64):
+        self.components = frozenset(components)
+        self.capacity = capacity
+        self.count = 0
+        self.ids = np.zeros(capacity, np.int64)
+        self.columns = {}
+        for name in self.components:
+            dtype, shape = COMPONENTS[name]
+            self.columns[name] = np.zeros((capacity, *shape), dtype)
+
+    def __len__(self):
+        return self.count
+
+    def view(self, name):
+        return self.columns[name][:self.count]
+
+    def _grow(self):
+        self.capacity *= 2
+        ids = np.zeros(self.capacity, np.int64)
+        ids[:self.count] = self.ids[:self.count]
+        self.ids = ids
+        for name, column in self.columns.items():
+            grown = np.zeros((self.capacity, *column.shape[1:]), column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
+    def append(self, entity, values):
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        self.ids[row] = entity
+        for name, value in values.items():
+            self.columns[name][row] = value
+        self.count += 1
+        return row
+
+    def read(self, row):
+        """{component: value} of one row, as plain Python values."""
+        return {name: column[row].tolist() if column.ndim > 1 else column[row] for name, column in self.columns.items()}
+
+    def remove(self, row):
+        """Returns the entity moved into row, or None."""
+        last = self.count - 1
+        moved = None
+        if row != last:
+            self.ids[row] = self.ids[last]
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved = int(self.ids[row])
+        if 'sprite' in self.columns:
+            self.columns['sprite'][last] = None
+        self.count = last
+        return moved
+
+    def compact(self, keep):
+        """
+        Drop the rows where keep is False, filling the holes with kept rows
+        from the end. Returns (removed entities, moved entities, their rows).
+        """
+        count = self.count
+        holes = np.flatnonzero(~keep)
+        removed = self.ids[holes].tolist()
+        remaining = count - len(holes)
+        targets = holes[holes < remaining]
+        sources = np.flatnonzero(keep[remaining:]) + remaining
+        self.ids[targets] = self.ids[sources]
+        for column in self.columns.values():
+            column[targets] = column[sources]
+        if 'sprite' in self.columns:
+            self.columns['sprite'][remaining:count] = None
+        self.count = remaining
+        return removed, self.ids[targets].tolist(), targets.tolist()
+
+
+class World:
+    """
+    Entities stored by archetype. Systems iterate the arrays of every
+    archetype a query matches; queries are cached until a new archetype
+    appears.
+    """
+
+    def __init__(self):
+        self.archetypes = {}
+        self.locations = {}
+        self.next_entity = 0
+        self.images = []
+        self.image_ids = {}
+        self._queries = {}
+
+    def __len__(self):
+        return len(self.locations)
+
+    def image_id(self, image):
+        image_id = self.image_ids.get(image)
+        if image_id is None:
+            image_id = self.image_ids[image] = len(self.images)
+            self.images.append(image)
+        return image_id
+
+    def archetype(self, components):
+        key = frozenset(components)
+        archetype = self.archetypes.get(key)
+        if archetype is None:
+            archetype = self.archetypes[key] = Archetype(key)
+            self._queries.clear()
+        return archetype
+
+    def query(self, *components):
+        """Every archetype that has all of components, empty ones included."""
+        key = frozenset(components)
+        archetypes = self._queries.get(key)
+        if archetypes is None:
+            archetypes = tuple(archetype for archetype in self.archetypes.values() if key <= archetype.components)
+            self._queries[key] = archetypes
+        return archetypes
+
+    def create(self, **components):
+        entity = self.next_entity
+        self.next_entity += 1
+        archetype = self.archetype(components)
+        self.locations[entity] = (archetype, archetype.append(entity, components))
+        return entity
+
+    def destroy(self, entity):
+        """Returns the entity's last component values, without 'sprite'."""
+        archetype, row = self.locations.pop(entity)
+        values = archetype.read(row)
+        values.pop('sprite', None)
+        moved = archetype.remove(row)
+        if moved is not None:
+            self.locations[moved] = (archetype, row)
+        return values
+
+    def compact(self, archetype, keep):
+        """Destroy every entity of archetype where keep is False, in one pass."""
+        removed, moved, rows = archetype.compact(keep)
+        for entity in removed:
+            del self.locations[entity]
+        for entity, row in zip(moved, rows):
+            self.locations[entity] = (archetype, row)
+        return removed
+
+    def get(self, entity, name):
+        archetype, row = self.locations[entity]
+        return archetype.columns[name][row]
+
+    def set(self, entity, name, value):
+        archetype, row = self.locations[entity]
+        archetype.columns[name][row] = value
+
+
+def movement(world):
+    """Moves everything with a position, direction and speed. Returns how many moved."""
+    moved = 0
+    for archetype in world.query('position', 'direction', 'speed'):
+        count = archetype.count
+        if count:
+            columns = archetype.columns
+            columns['position'][:count] += columns['direction'][:count] * columns['speed'][:count, None]
+            moved += count
+    return moved
+
+
+def _kill(world, archetype, doomed):
+    if 'sprite' in archetype.columns:
+        # Killing the sprite releases its entity, like any other kill
+        for sprite in archetype.columns['sprite'][:archetype.count][doomed].tolist():
+            sprite.kill()
+    else:
+        world.compact(archetype, ~doomed)
+
+
+def lifetime(world):
+    """
+    Ages entities with a ttl and removes those past it or past their
+    kill_below line. Returns (expired, culled).
+    """
+    expired = culled = 0
+    for archetype in world.query('age', 'ttl'):
+        count = archetype.count
+        if count:
+            age = archetype.columns['age'][:count]
+            age += 1
+            ttl = archetype.columns['ttl'][:count]
+            doomed = (ttl > 0) & (age > ttl)
+            if doomed.any():
+                expired += int(doomed.sum())
+                _kill(world, archetype, doomed)
+    for archetype in world.query('position', 'size', 'kill_below'):
+        count = archetype.count
+        if count:
+            columns = archetype.columns
+            doomed = columns['position'][:count, 1] + columns['size'][:count, 1] >= columns['kill_below'][:count]
+            if doomed.any():
+                culled += int(doomed.sum())
+                _kill(world, archetype, doomed)
+    return expired, culled
+
+
+def collide(world, left, right):
+    """
+    Entity pairs whose rects overlap, the first with any of the left layer
+    bits and the second with any of the right ones, as two id arrays.
+    """
+    parts = [
+        (archetype.view('position'), archetype.view('size'), archetype.view('layer'), archetype.ids[:archetype.count])
+        for archetype in world.query('position', 'size', 'layer') if archetype.count
+    ]
+    if not parts:
+        empty = np.zeros(0, np.int64)
+        return empty, empty
+    position = np.concatenate([part[0] for part in parts])
+    size = np.concatenate([part[1] for part in parts])
+    layer = np.concatenate([part[2] for part in parts])
+    ids = np.concatenate([part[3] for part in parts])
+    first, second = overlapping_pairs(position[:, 0], position[:, 1], size[:, 0], size[:, 1])
+    # Each overlap is found once, so it is checked both ways round
+    forward = ((layer[first] & left) != 0) & ((layer[second] & right) != 0)
+    backward = ((layer[second] & left) != 0) & ((layer[first] & right) != 0)
+    lefts = np.concatenate((first[forward], second[backward]))
+    rights = np.concatenate((second[forward], first[backward]))
+    return ids[lefts], ids[rights]
+
+
+def render(world, layer):
+    """Queues everything with a position, size and image on a RenderLayer."""
+    images = world.images
+    # Only culling layers need Rect destinations
+    destination = pygame.Rect if layer.cull else tuple
+    for archetype in world.query('position', 'size', 'image'):
+        count = archetype.count
+        if count:
+            rects = np.concatenate((archetype.view('position').astype(np.int32), archetype.view('size')), axis=1)
+            layer.blits(zip(
+                map(images.__getitem__, archetype.view('image').tolist()),
+                map(destination, rects.tolist()),
+            ))
+
+
+class EntityRect(pygame.Rect):
+    """
+    Rect read from an EntitySprite. Changing it in place writes it back to
+    the sprite, as changing a plain sprite's rect would move the sprite.
+    Rects derived from it (copy(), move(), ...) are detached.
+    """
+
+    __slots__ = ('sprite',)
+
+    def _write(self):
+        sprite = getattr(self, 'sprite', None)
+        if sprite is not None:
+            sprite.rect = self
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        self._write()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._write()
+
+
+def _writes_back(name):
+    method = getattr(pygame.Rect, name)
+
+    def write_back(self, *args, **kwargs):
+        method(self, *args, **kwargs)
+        self._write()
+    write_back.__name__ = name
+    return write_back
+
+
+# Every Rect method that changes the rect in place
+for _name in ('move_ip', 'inflate_ip', 'scale_by_ip', 'clamp_ip', 'union_ip', 'unionall_ip', 'update', 'normalize'):
+    setattr(EntityRect, _name, _writes_back(_name))
+
+# Sets EntityRect.sprite without going through the write-back __setattr__
+_attach = EntityRect.sprite.__set__
+
+
+class EntitySprite(pygame.sprite.Sprite):
+    """
+    Sprite facade over one entity, so classes can move into a World one at
+    a time while groups, collisions, lifetimes and snapshots still see a
+    sprite. rect, speed and direction read and write the entity's
+    components; rect is an EntityRect, so in-place changes move the entity.
+    The entity exists while the sprite is in a group; before and after
+    that its values are kept on the sprite.
+    """
+
+    def __init__(self, world, image, rect, **components):
+        super().__init__()
+        self.world = world
+        self.entity = None
+        self._image = image
+        self._values = {
+            'position': rect.topleft, 'size': rect.size, 'image': world.image_id(image), **components,
+        }
+
+    def _get(self, name):
+        if self.entity is None:
+            return self._values[name]
+        return self.world.get(self.entity, name)
+
+    def _set(self, name, value):
+        if self.entity is None:
+            self._values[name] = value
+        else:
+            self.world.set(self.entity, name, value)
+
+    def add_internal(self, group):
+        super().add_internal(group)
+        if self.entity is None:
+            self.entity = self.world.create(sprite=self, **self._values)
+            self._values = None
+
+    def _release(self):
+        if self.entity is not None and not self.alive():
+            self._values = self.world.destroy(self.entity)
+            self.entity = None
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        self._release()
+
+    def kill(self):
+        # Sprite.kill() does not go through remove_internal
+        super().kill()
+        self._release()
+
+    @property
+    def image(self):
+        return self._image
+
+    @image.setter
+    def image(self, image):
+        self._image = image
+        self._set('image', self.world.image_id(image))
+
+    @property
+    def rect(self):
+        if self.entity is None:
+            x, y = self._values['position']
+            width, height = self._values['size']
+        else:
+            # Read most often, so one lookup and no NumPy scalars
+            archetype, row = self.world.locations[self.entity]
+            x, y = archetype.columns['position'][row].tolist()
+            width, height = archetype.columns['size'][row].tolist()
+        rect = EntityRect(int(x), int(y), width, height)
+        _attach(rect, self)
+        return rect
+
+    @rect.setter
+    def rect(self, rect):
+        self._set('position', rect.topleft)
+        self._set('size', rect.size)
+
+    @property
+    def speed(self):
+        return float(self._get('speed'))
+
+    @speed.setter
+    def speed(self, speed):
+        self._set('speed', speed)
+
+    @property
+    def direction_x(self):
+        return float(self._get('direction')[0])
+
+    @direction_x.setter
+    def direction_x(self, value):
+        self._set('direction', (value, self.direction_y))
+
+    @property
+    def direction_y(self):
+        return float(self._get('direction')[1])
+
+    @direction_y.setter
+    def direction_y(self, value):
+        self._set('direction', (self.direction_x, value))
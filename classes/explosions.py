@@ -1,8 +1,22 @@
 import pygame
 import random
 
+from .assets import load_sound
+from .counters import Deltas
+
+
+EXPLOSION_SOUNDS = [
+    'game_sounds/explosions/explosion1.wav',
+    'game_sounds/explosions/explosion2.wav',
+    'game_sounds/explosions/explosion3.wav',
+]
+EXPLOSION2_SOUNDS = ['game_sounds/explosions/explosion3.wav']
+EXPLOSION_VOLUME = 0.3
+
 
 class Explosion(pygame.sprite.Sprite):
+    # Animation frames advanced per tick; the quality governor raises it to 2
+    frame_step = 1
 
     def __init__(self, center, explosion_images):
         super().__init__()
@@ -13,22 +27,15 @@ class Explosion(pygame.sprite.Sprite):
         self.frame = 0
         self.last_update = pygame.time.get_ticks()
         self.frame_rate = 60
-        self.explosion_sounds = [
-            pygame.mixer.Sound('game_sounds/explosions/explosion1.wav'),
-            pygame.mixer.Sound('game_sounds/explosions/explosion2.wav'),
-            pygame.mixer.Sound('game_sounds/explosions/explosion3.wav')
-        ]
-        for sound in self.explosion_sounds:
-            sound.set_volume(0.3)
-        self.explosion_sound = random.choice(self.explosion_sounds)
+        self.explosion_sound = load_sound(random.choice(EXPLOSION_SOUNDS), EXPLOSION_VOLUME)
         self.sound_played = False
 
     def update(self):
         now = pygame.time.get_ticks()
         if now - self.last_update > self.frame_rate:
             self.last_update = now
-            self.frame += 1
-            if self.frame == len(self.explosion_images):
+            self.frame += self.frame_step
+            if self.frame >= len(self.explosion_images):
                 self.kill()
             else:
                 center = self.rect.center
@@ -41,6 +48,7 @@ class Explosion(pygame.sprite.Sprite):
 
 
 class Explosion2(pygame.sprite.Sprite):
+    frame_step = 1
 
     def __init__(self, center, explosion2_images):
         super().__init__()
@@ -51,20 +59,15 @@ class Explosion2(pygame.sprite.Sprite):
         self.frame = 0
         self.last_update = pygame.time.get_ticks()
         self.frame_rate = 60
-        self.explosion2_sounds = [
-            pygame.mixer.Sound('game_sounds/explosions/explosion3.wav')
-        ]
-        for sound in self.explosion2_sounds:
-            sound.set_volume(0.3)
-        self.explosion2_sound = random.choice(self.explosion2_sounds)
+        self.explosion2_sound = load_sound(random.choice(EXPLOSION2_SOUNDS), EXPLOSION_VOLUME)
         self.sound_played = False
 
     def update(self):
         now = pygame.time.get_ticks()
         if now - self.last_update > self.frame_rate:
             self.last_update = now
-            self.frame += 1
-            if self.frame == len(self.explosion2_images):
+            self.frame += self.frame_step
+            if self.frame >= len(self.explosion2_images):
                 self.kill()
             else:
                 center = self.rect.center
@@ -74,3 +77,65 @@ class Explosion2(pygame.sprite.Sprite):
                 if not self.sound_played:
                     self.explosion2_sound.play()
                     self.sound_played = True
+
+
+class EffectManager:
+    """
+    Owns every live explosion. Spawns of the same animation near a live one
+    within merge_window ms are merged into it, and at most max_live effects
+    exist at once: the lowest-priority, oldest one is evicted to make room,
+    or the new one is dropped if everything live outranks it.
+    """
+
+    def __init__(self, max_live=40, merge_radius=24, merge_window=120):
+        self.group = pygame.sprite.Group()
+        self.max_live = max_live
+        self.merge_radius_sq = merge_radius * merge_radius
+        self.merge_window = merge_window
+        self.merged = 0
+        self.evicted = 0
+        self.dropped = 0
+        self._deltas = Deltas()
+
+    def __len__(self):
+        return len(self.group)
+
+    def spawn(self, effect_class, center, images, priority=0):
+        """Returns the new effect, or None when it was merged or dropped."""
+        now = pygame.time.get_ticks()
+        x, y = center
+        lowest = None
+        for effect in self.group:
+            if (effect.images is images and now - effect.spawned < self.merge_window
+                    and (effect.rect.centerx - x) ** 2 + (effect.rect.centery - y) ** 2 <= self.merge_radius_sq):
+                self.merged += 1
+                return None
+            if lowest is None or (effect.priority, effect.spawned) < (lowest.priority, lowest.spawned):
+                lowest = effect
+
+        if len(self.group) >= self.max_live:
+            if lowest.priority > priority:
+                self.dropped += 1
+                return None
+            lowest.kill()
+            self.evicted += 1
+
+        effect = effect_class(center, images)
+        effect.images = images
+        effect.priority = priority
+        effect.spawned = now
+        self.group.add(effect)
+        return effect
+
+    def update(self):
+        self.group.update()
+
+    def draw(self, surface):
+        self.group.draw(surface)
+
+    def clear(self):
+        self.group.empty()
+
+    def take_counts(self):
+        """(merged, evicted, dropped) since the previous call."""
+        return self._deltas.take((self.merged, self.evicted, self.dropped))
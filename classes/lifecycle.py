@@ -0,0 +1,74 @@
+import pygame
+
+from .constants import WIDTH, HEIGHT
+from .counters import Deltas
+
+
+# group -> (ttl, off-screen grace, cap). Times are in frames; None disables
+# the limit. Grace only starts once a sprite has been on screen, so things
+# spawned above the screen are not culled on their way in.
+LIFETIMES = {
+    'enemy1': (None, 120, 10),
+    'enemy2': (None, 120, 2),
+    'meteors': (None, 60, 8),
+    'meteors2': (None, 60, 12),
+    'black_holes': (None, 60, 3),
+    'extra_score': (None, 60, 16),
+    'bullet_refills': (900, 60, 4),
+    'health_refills': (900, 60, 4),
+    'double_refills': (900, 60, 4),
+}
+
+
+class Lifetimes:
+    """
+    Applies LIFETIMES to the world's sprite groups. Sprites are added
+    through add() so hard caps hold; update() removes the ones past their
+    TTL or off screen past their grace period.
+    """
+
+    def __init__(self, rules=None, bounds=(0, 0, WIDTH, HEIGHT)):
+        self.rules = rules if rules is not None else LIFETIMES
+        self.bounds = pygame.Rect(bounds)
+        self.groups = {}
+        self.frame = 0
+        self.expired = 0
+        self.culled = 0
+        self.refused = 0
+        self._deltas = Deltas()
+
+    def track(self, name, group):
+        self.groups[name] = group
+
+    def add(self, name, sprite):
+        """Returns False, without adding, when the group is at its cap."""
+        group = self.groups[name]
+        cap = self.rules[name][2]
+        if cap is not None and len(group) >= cap:
+            self.refused += 1
+            return False
+        sprite.born = self.frame
+        sprite.seen = None
+        group.add(sprite)
+        return True
+
+    def update(self):
+        self.frame += 1
+        frame = self.frame
+        bounds = self.bounds
+        for name, group in self.groups.items():
+            ttl, grace, _ = self.rules[name]
+            for sprite in group.sprites():
+                if bounds.colliderect(sprite.rect):
+                    sprite.seen = frame
+                elif grace is not None and sprite.seen is not None and frame - sprite.seen > grace:
+                    sprite.kill()
+                    self.culled += 1
+                    continue
+                if ttl is not None and frame - sprite.born > ttl:
+                    sprite.kill()
+                    self.expired += 1
+
+    def take_counts(self):
+        """(expired, culled, refused) since the previous call."""
+        return self._deltas.take((self.expired, self.culled, self.refused))
@@ -1,6 +1,8 @@
 import pygame
 
 from .constants import WIDTH, HEIGHT
+from .collision import rotated
+from .assets import load_sound
 
 
 class Meteors(pygame.sprite.Sprite):
@@ -24,7 +26,7 @@ class Meteors(pygame.sprite.Sprite):
             self.kill()
 
         self.angle = (self.angle - 1) % 360
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
+        self.image, self.mask = rotated(self.original_image, self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def draw(self, surface):
@@ -52,7 +54,7 @@ class Meteors2(pygame.sprite.Sprite):
             self.kill()
 
         self.angle = (self.angle - 1) % 360
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
+        self.image, self.mask = rotated(self.original_image, self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def draw(self, surface):
@@ -72,7 +74,7 @@ class BlackHole(pygame.sprite.Sprite):
         self.direction_y = 1
         self.angle = 0
         self.speed = 2
-        self.sound_effect = pygame.mixer.Sound("game_sounds/damage/black_hole.mp3")
+        self.sound_effect = load_sound("game_sounds/damage/black_hole.mp3", 1.0)
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -81,7 +83,7 @@ class BlackHole(pygame.sprite.Sprite):
             self.kill()
 
         self.angle = (self.angle - 1) % 360
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
+        self.image, self.mask = rotated(self.original_image, self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def draw(self, surface):
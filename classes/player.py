@@ -3,20 +3,22 @@ import pygame
 from .constants import WIDTH, HEIGHT
 
 
-class Player:
+class Player(pygame.sprite.Sprite):
 
     def __init__(self):
+        super().__init__()
         self.rect = pygame.Rect(WIDTH//2 - 100, HEIGHT - 100, 100, 100)
         self.speed = 10
         self.image = pygame.image.load('images/player.png').convert_alpha()
         self.original_image = self.image.copy()
+        self.flipped_image = pygame.transform.flip(self.original_image, True, False)
         self.direction = 'down'
 
     def move_left(self):
         if self.rect.left > 0:
             self.rect.x -= self.speed
             self.direction = 'left'
-            self.image = pygame.transform.flip(self.original_image, True, False)
+            self.image = self.flipped_image
 
     def move_right(self):
         if self.rect.right < WIDTH:
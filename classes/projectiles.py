@@ -0,0 +1,251 @@
+import math
+
+import numpy as np
+import pygame
+
+from .assets import load_sound
+from .constants import WIDTH, HEIGHT, ROTATION_STEP
+from .collision import get_mask, rotated, sprite_mask
+
+
+PROJECTILE_TYPES = {
+    'enemy2': {
+        'image': 'images/bullets/bullet4.png',
+        'sound': 'game_sounds/shooting/shoot2.mp3',
+        'volume': 0.3,
+        'speed': 8,
+        'damage': 10,
+        'rotate': False,
+    },
+    'boss1': {
+        'image': 'images/bullets/bulletboss1.png',
+        'sound': 'game_sounds/shooting/boss1shoot.mp3',
+        'volume': 0.4,
+        'speed': 10,
+        'damage': 20,
+        'rotate': False,
+    },
+    'boss2': {
+        'image': 'images/bullets/bulletboss2.png',
+        'sound': 'game_sounds/shooting/boss2shoot.mp3',
+        'volume': 0.4,
+        'speed': 11,
+        'damage': 20,
+        'rotate': True,
+    },
+    'boss3': {
+        'image': 'images/bullets/bulletboss3.png',
+        'sound': 'game_sounds/shooting/boss2shoot.mp3',
+        'volume': 0.4,
+        'speed': 15,
+        'damage': 20,
+        'rotate': True,
+    },
+    # Slow and light, for the dense fan, ring and spiral patterns
+    'boss4': {
+        'image': 'images/bullets/bulletboss2.png',
+        'sound': 'game_sounds/shooting/boss2shoot.mp3',
+        'volume': 0.3,
+        'speed': 5,
+        'damage': 8,
+        'rotate': True,
+    },
+}
+
+CULL_MARGIN = 80
+# A shot fired downward starts with its bottom edge this far below the shooter's
+MUZZLE_GAP = 10
+
+
+class ProjectileField:
+    """
+    Every live enemy projectile in contiguous NumPy arrays. Movement,
+    off-screen culling and the player hit test run vectorized; drawing is a
+    single Surface.blits call over pre-rotated frames.
+    """
+
+    def __init__(self, capacity=4096, types=PROJECTILE_TYPES):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.kind = np.zeros(capacity, np.int16)
+        self.frame = np.zeros(capacity, np.int32)
+        self.age = np.zeros(capacity, np.int32)
+        self.count = 0
+        self.dropped = 0
+
+        self.kind_ids = {}
+        self.speeds = []
+        self.sound_specs = []
+        self.muzzle_offsets = []
+        self.damage = []
+        self.frame_base = []
+        self.frame_steps = []
+        self.frame_surfaces = []
+        self.frame_masks = []
+        half_sizes = []
+        for name, kind in types.items():
+            self.kind_ids[name] = len(self.speeds)
+            self.speeds.append(kind['speed'])
+            self.sound_specs.append((kind['sound'], kind['volume']))
+            self.damage.append(kind['damage'])
+            self.frame_base.append(len(self.frame_surfaces))
+            image = pygame.image.load(kind['image']).convert_alpha()
+            self.muzzle_offsets.append(MUZZLE_GAP - image.get_height() / 2)
+            if kind['rotate']:
+                steps = 360 // ROTATION_STEP
+                frames = [rotated(image, step * ROTATION_STEP) for step in range(steps)]
+            else:
+                steps = 1
+                frames = [(image, get_mask(image))]
+            self.frame_steps.append(steps)
+            for surface, mask in frames:
+                self.frame_surfaces.append(surface)
+                self.frame_masks.append(mask)
+                half_sizes.append((surface.get_width() / 2, surface.get_height() / 2))
+        self.damage = np.array(self.damage, np.int32)
+        self.half_sizes = np.array(half_sizes, np.float32)
+
+    def __len__(self):
+        return self.count
+
+    def kind_id(self, name):
+        return self.kind_ids[name]
+
+    def speed(self, name):
+        return self.speeds[self.kind_ids[name]]
+
+    def below(self, name, bottom):
+        """Centre y for a shot of type name leaving a shooter whose bottom edge is at bottom."""
+        return bottom + self.muzzle_offsets[self.kind_ids[name]]
+
+    def play(self, name):
+        # Loaded on first use so sound hooks installed at startup see it
+        load_sound(*self.sound_specs[self.kind_ids[name]]).play()
+
+    def spawn(self, name, xs, ys, vxs, vys):
+        """Add one or many projectiles of one type; scalars or arrays."""
+        kind = self.kind_ids[name]
+        xs, ys, vxs, vys = np.broadcast_arrays(
+            np.atleast_1d(xs), np.atleast_1d(ys), np.atleast_1d(vxs), np.atleast_1d(vys)
+        )
+        amount = len(xs)
+        room = self.capacity - self.count
+        if amount > room:
+            self.dropped += amount - room
+            amount = room
+        start, end = self.count, self.count + amount
+        self.pos[start:end, 0] = xs[:amount]
+        self.pos[start:end, 1] = ys[:amount]
+        self.vel[start:end, 0] = vxs[:amount]
+        self.vel[start:end, 1] = vys[:amount]
+        self.kind[start:end] = kind
+        self.age[start:end] = 0
+
+        steps = self.frame_steps[kind]
+        if steps == 1:
+            self.frame[start:end] = self.frame_base[kind]
+        else:
+            # Sprites point along +x; screen y grows downward, rotation is counter-clockwise
+            angles = np.degrees(np.arctan2(-self.vel[start:end, 1], self.vel[start:end, 0]))
+            index = np.rint(angles / ROTATION_STEP).astype(np.int32) % steps
+            self.frame[start:end] = self.frame_base[kind] + index
+        self.count = end
+
+    def update(self):
+        count = self.count
+        if not count:
+            return
+        pos = self.pos[:count]
+        pos += self.vel[:count]
+        self.age[:count] += 1
+        x = pos[:, 0]
+        y = pos[:, 1]
+        keep = (x > -CULL_MARGIN) & (x < WIDTH + CULL_MARGIN) & (y > -CULL_MARGIN) & (y < HEIGHT + CULL_MARGIN)
+        if not keep.all():
+            self._compact(keep)
+
+    def _compact(self, keep):
+        count = self.count
+        remaining = int(keep.sum())
+        for array in (self.pos, self.vel, self.kind, self.frame, self.age):
+            array[:remaining] = array[:count][keep]
+        self.count = remaining
+
+    def draw(self, surface):
+        count = self.count
+        if not count:
+            return
+        frames = self.frame[:count]
+        topleft = (self.pos[:count] - self.half_sizes[frames]).astype(np.int32).tolist()
+        surfaces = self.frame_surfaces
+        surface.blits([(surfaces[frame], position) for frame, position in zip(frames.tolist(), topleft)], False)
+
+    def hit_test(self, target):
+        """
+        Remove projectiles touching target (rect fast reject, then mask) and
+        return (total damage, hits).
+        """
+        count = self.count
+        if not count:
+            return 0, 0
+        rect = target.rect
+        half = self.half_sizes[self.frame[:count]]
+        pos = self.pos[:count]
+        candidates = np.nonzero(
+            (np.abs(pos[:, 0] - rect.centerx) < half[:, 0] + rect.width / 2)
+            & (np.abs(pos[:, 1] - rect.centery) < half[:, 1] + rect.height / 2)
+        )[0]
+        if not len(candidates):
+            return 0, 0
+
+        target_mask = sprite_mask(target)
+        keep = np.ones(count, bool)
+        damage = 0
+        hits = 0
+        for index in candidates.tolist():
+            frame = int(self.frame[index])
+            offset = (
+                int(pos[index, 0] - half[index, 0]) - rect.x,
+                int(pos[index, 1] - half[index, 1]) - rect.y,
+            )
+            if target_mask.overlap(self.frame_masks[frame], offset) is not None:
+                keep[index] = False
+                damage += int(self.damage[self.kind[index]])
+                hits += 1
+        if hits:
+            self._compact(keep)
+        return damage, hits
+
+    def clear(self):
+        self.count = 0
+
+
+def emit_aimed(field, name, x, y, target, count=1, spread=0):
+    """Burst of count projectiles centred on the line to target."""
+    angle = math.atan2(target.rect.centery - y, target.rect.centerx - x)
+    emit_fan(field, name, x, y, math.degrees(angle), spread, count)
+
+
+def emit_fan(field, name, x, y, angle, spread, count):
+    """count projectiles evenly spread over spread degrees around angle."""
+    if count > 1:
+        angles = np.radians(np.linspace(angle - spread / 2, angle + spread / 2, count))
+    else:
+        angles = np.radians(np.array([angle], np.float32))
+    speed = field.speed(name)
+    field.spawn(name, x, y, np.cos(angles) * speed, np.sin(angles) * speed)
+
+
+def emit_ring(field, name, x, y, count, offset=0):
+    """count projectiles evenly spaced around a full circle."""
+    angles = np.radians(offset + np.arange(count) * (360 / count))
+    speed = field.speed(name)
+    field.spawn(name, x, y, np.cos(angles) * speed, np.sin(angles) * speed)
+
+
+def emit_parallel(field, name, x, y, offsets, angle=90):
+    """One projectile per x offset, all travelling along angle."""
+    speed = field.speed(name)
+    radians = math.radians(angle)
+    field.spawn(name, x + np.asarray(offsets), y, math.cos(radians) * speed, math.sin(radians) * speed)
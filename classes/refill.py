@@ -2,6 +2,8 @@ import pygame
 import random
 
 from .constants import WIDTH, HEIGHT
+from .ecs import EntitySprite
+from .assets import load_sound
 
 
 class BulletRefill(pygame.sprite.Sprite):
@@ -15,8 +17,7 @@ class BulletRefill(pygame.sprite.Sprite):
         self.speed = 1
         self.direction_x = random.choice([-2, 2])
         self.direction_y = random.choice([-2, 2])
-        self.sound_effect = pygame.mixer.Sound("game_sounds/refill/bullet_refill.wav")
-        self.sound_effect.set_volume(0.4)
+        self.sound_effect = load_sound("game_sounds/refill/bullet_refill.wav", 0.4)
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -44,8 +45,7 @@ class HealthRefill(pygame.sprite.Sprite):
         self.speed = 1
         self.direction_x = random.choice([-2, 2])
         self.direction_y = random.choice([-2, 2])
-        self.sound_effect = pygame.mixer.Sound("game_sounds/refill/health_refill.wav")
-        self.sound_effect.set_volume(0.4)
+        self.sound_effect = load_sound("game_sounds/refill/health_refill.wav", 0.4)
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -73,8 +73,7 @@ class DoubleRefill(pygame.sprite.Sprite):
         self.speed = 2
         self.direction_x = random.choice([-2, 2])
         self.direction_y = random.choice([-2, 2])
-        self.sound_effect = pygame.mixer.Sound("game_sounds/refill/double_refill.mp3")
-        self.sound_effect.set_volume(0.4)
+        self.sound_effect = load_sound("game_sounds/refill/double_refill.mp3", 0.4)
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -91,26 +90,15 @@ class DoubleRefill(pygame.sprite.Sprite):
         surface.blit(self.image, self.rect)
 
 
-class ExtraScore(pygame.sprite.Sprite):
+class ExtraScore(EntitySprite):
+    """Moved and culled by the movement and lifetime systems of world."""
 
-    def __init__(self, x, y, image):
-        super().__init__()
-        self.original_image = image
-        self.image = self.original_image.copy()
-        self.rect = self.image.get_rect()
-        self.speed = 2
-        self.rect.x = x
-        self.rect.y = y
-        self.direction_x = 0
-        self.direction_y = 1
-        self.sound_effect = pygame.mixer.Sound("game_sounds/refill/extra_score.mp3")
-        self.sound_effect.set_volume(0.4)
-
-    def update(self):
-        self.rect.y += self.speed * self.direction_y
-
-        if self.rect.bottom >= HEIGHT + 100:
-            self.kill()
+    def __init__(self, x, y, image, world):
+        super().__init__(
+            world, image, image.get_rect(topleft=(x, y)),
+            direction=(0, 1), speed=2, kill_below=HEIGHT + 100,
+        )
+        self.sound_effect = load_sound("game_sounds/refill/extra_score.mp3", 0.4)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -0,0 +1,176 @@
+import random
+
+import numpy as np
+import pygame
+
+from .constants import WIDTH, HEIGHT, ENEMY_FORCE
+
+
+# Enemies are kept 5px inside the screen edges
+SWARM_BOUNDS = pygame.Rect(5, 5, WIDTH - 10, HEIGHT - 10)
+
+# New direction after touching an edge, picked at random
+_BOUNCES = {
+    'left': [(1, 0), (0, -1), (0, 1), (1, -1), (1, 1)],
+    'right': [(-1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1)],
+    'top': [(1, 0), (-1, 0), (0, 1), (1, 1), (-1, 1)],
+    'bottom': [(1, 0), (-1, 0), (0, -1), (1, -1), (-1, -1)],
+}
+
+# Half of the 3x3 neighbourhood; (0, 0) is the cell itself, where only i < j counts
+_NEIGHBOURS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def overlapping_pairs(left, top, width, height):
+    """
+    Index arrays (i, j) of every pair of overlapping rects, each pair once.
+    Rects are binned by their top-left corner into a grid whose cells are
+    as large as the largest rect, so only neighbouring cells are compared.
+    """
+    count = len(left)
+    if count < 2:
+        empty = np.zeros(0, np.intp)
+        return empty, empty
+    cell = max(int(width.max()), int(height.max()), 1)
+    column = (left // cell).astype(np.int64)
+    row = (top // cell).astype(np.int64)
+    column -= column.min() - 1
+    row -= row.min() - 1
+    rows = int(row.max()) + 2
+    key = column * rows + row
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+
+    firsts, seconds = [], []
+    for dx, dy in _NEIGHBOURS:
+        wanted = key + dx * rows + dy
+        start = np.searchsorted(sorted_key, wanted, 'left')
+        counts = np.searchsorted(sorted_key, wanted, 'right') - start
+        total = int(counts.sum())
+        if not total:
+            continue
+        first = np.repeat(np.arange(count), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = order[np.repeat(start, counts) + offsets]
+        if (dx, dy) == (0, 0):
+            keep = first < second
+            first, second = first[keep], second[keep]
+        firsts.append(first)
+        seconds.append(second)
+    if not firsts:
+        empty = np.zeros(0, np.intp)
+        return empty, empty
+    first = np.concatenate(firsts)
+    second = np.concatenate(seconds)
+
+    # Same test as Rect.colliderect
+    overlap = (
+        (left[first] < left[second] + width[second]) & (left[second] < left[first] + width[first])
+        & (top[first] < top[second] + height[second]) & (top[second] < top[first] + height[first])
+    )
+    return first[overlap], second[overlap]
+
+
+def _separate(x, y, width, height, direction, force):
+    """Push overlapping rects apart and bounce their directions off each other, in place."""
+    first, second = overlapping_pairs(x, y, width, height)
+    if not len(first):
+        return 0
+    dx = (x[second] + width[second] / 2) - (x[first] + width[first] / 2)
+    dy = (y[second] + height[second] / 2) - (y[first] + height[first] / 2)
+    distance = np.hypot(dx, dy)
+    apart = distance > 0
+    safe = np.where(apart, distance, 1.0)
+    # Rects on the same centre are pushed apart horizontally
+    normal_x = np.where(apart, dx / safe, 1.0)
+    normal_y = np.where(apart, dy / safe, 0.0)
+
+    strength = (1 - distance / (width[first] + width[second])) * force
+    push_x = normal_x * strength
+    push_y = normal_y * strength
+    np.add.at(x, first, -push_x)
+    np.add.at(y, first, -push_y)
+    np.add.at(x, second, push_x)
+    np.add.at(y, second, push_y)
+
+    # Both directions are reflected off the line between the centres; a
+    # sprite in several pairs keeps the reflection of its last one
+    first, second = first[apart], second[apart]
+    normal = np.stack((normal_x[apart], normal_y[apart]), axis=1)
+    before = direction.copy()
+    for index in (first, second):
+        current = before[index]
+        reflected = current - 2 * np.sum(current * normal, axis=1, keepdims=True) * normal
+        length = np.hypot(reflected[:, 0], reflected[:, 1])[:, None]
+        direction[index] = np.where(length > 0, reflected / np.where(length > 0, length, 1), current)
+    return len(distance)
+
+
+def _arrays(sprites):
+    # One tuple per sprite converts much faster than a list of Rects
+    values = np.array([(*sprite.rect, *sprite.direction) for sprite in sprites], np.float64).reshape(-1, 6)
+    return values[:, 0], values[:, 1], values[:, 2], values[:, 3], values[:, 4:6].copy()
+
+
+def _write_back(sprites, x, y, direction):
+    for sprite, left, top, heading in zip(sprites, np.rint(x).tolist(), np.rint(y).tolist(), direction.tolist()):
+        sprite.rect.topleft = (left, top)
+        sprite.direction = tuple(heading)
+
+
+def steer(group, force=ENEMY_FORCE, bounds=SWARM_BOUNDS):
+    """
+    Move a swarm of sprites with rect, direction and speed along their
+    directions, bounce them off the edges of bounds, then separate the
+    ones that overlap. Returns the number of overlapping pairs.
+    """
+    sprites = group.sprites()
+    if not sprites:
+        return 0
+    x, y, width, height, direction = _arrays(sprites)
+    speed = np.array([sprite.speed for sprite in sprites], np.float64)
+    # Truncated like the Rect arithmetic the sprites used to move with
+    x = np.trunc(x + direction[:, 0] * speed)
+    y = np.trunc(y + direction[:, 1] * speed)
+
+    for edge, hits in (
+        ('left', x < bounds.left),
+        ('right', x + width > bounds.right),
+        ('top', y < bounds.top),
+        ('bottom', y + height > bounds.bottom),
+    ):
+        for index in np.flatnonzero(hits).tolist():
+            direction[index] = random.choice(_BOUNCES[edge])
+    x = np.clip(x, bounds.left, bounds.right - width)
+    y = np.clip(y, bounds.top, bounds.bottom - height)
+
+    pairs = _separate(x, y, width, height, direction, force)
+    _write_back(sprites, x, y, direction)
+    return pairs
+
+
+def separate(group, force=ENEMY_FORCE):
+    """Only the separation part of steer(), for sprites that move themselves."""
+    sprites = group.sprites()
+    if len(sprites) < 2:
+        return 0
+    x, y, width, height, direction = _arrays(sprites)
+    pairs = _separate(x, y, width, height, direction, force)
+    _write_back(sprites, x, y, direction)
+    return pairs
+
+
+def spawn_point(group, size, x_range, y_range, bounds=SWARM_BOUNDS, tries=8):
+    """
+    A random centre within x_range and y_range where a rect of size does
+    not overlap anything in group, or None if every try did. Candidates
+    are tested where bounds would clamp them, which is where a sprite
+    kept inside bounds first appears.
+    """
+    rects = [sprite.rect for sprite in group]
+    rect = pygame.Rect((0, 0), size)
+    for _ in range(tries):
+        rect.center = (random.randint(*x_range), random.randint(*y_range))
+        if not rects or rect.clamp(bounds).collidelist(rects) == -1:
+            return rect.center
+    return None
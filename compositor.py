@@ -0,0 +1,99 @@
+"""
+Background compositor for Cosmic Heat.
+The parallax background only depends on its scroll offsets and the speed
+multiplier, so it can be rendered a frame ahead. In threaded mode a worker
+draws the next background into a back buffer while the main thread runs
+entity updates and collisions; the main thread then only copies the
+finished buffer into the world. pygame releases the GIL during blits, so
+the two can overlap, but only with a spare CPU core; on a single core the
+threaded mode saves nothing and adds the hand-off cost. Synchronous mode
+draws on the main thread as before.
+"""
+
+import queue
+import threading
+import time
+
+_STOP = object()
+
+
+class BackgroundCompositor:
+    """
+    Owns a ParallaxBackground and draws it into a RenderTarget once per
+    frame. The back buffer and the world surface form the double buffer:
+    draw() copies the finished back buffer into the world and only then
+    asks the worker to render the next frame into it. Speed changes show
+    up one frame later. If the worker fails, the compositor falls back to
+    synchronous mode for good.
+    """
+
+    def __init__(self, background, target, threaded=False):
+        self.background = background
+        self.target = target
+        self.threaded = False
+        self.error = None
+        self.wait_ms = 0.0
+        self.frames = 0
+        self._requests = queue.SimpleQueue()
+        self._ready = threading.Event()
+        self._worker = None
+        if threaded:
+            self.start()
+
+    def start(self):
+        if not hasattr(self.target, 'offscreen'):
+            self._fall_back("the render target cannot draw offscreen")
+            return
+        self.back = self.target.offscreen()
+        self.background.draw(self.back)
+        try:
+            self._worker = threading.Thread(target=self._run, name='background-compositor', daemon=True)
+            self._worker.start()
+        except RuntimeError as error:
+            self._fall_back(error)
+            return
+        self.threaded = True
+        self._ready.set()
+
+    def draw(self, speed):
+        """Put this frame's background into the target and schedule the next one."""
+        self.frames += 1
+        if self.threaded:
+            start = time.perf_counter()
+            self._ready.wait()
+            self.wait_ms += (time.perf_counter() - start) * 1000
+            if self.error is None:
+                self._ready.clear()
+                self.target.surface.blit(self.back.surface, (0, 0))
+                self._requests.put(speed)
+                return
+            self._fall_back(self.error)
+        self.background.update(speed)
+        self.background.draw(self.target)
+
+    def close(self):
+        if self._worker is None:
+            return
+        self._requests.put(_STOP)
+        self._worker.join()
+        self._worker = None
+        self.threaded = False
+
+    def _fall_back(self, error):
+        print(f"Background compositor: {error}; drawing on the main thread")
+        self.threaded = False
+        self._worker = None
+
+    def _run(self):
+        while True:
+            speed = self._requests.get()
+            if speed is _STOP:
+                return
+            try:
+                self.background.update(speed)
+                self.background.draw(self.back)
+            except Exception as error:
+                self.error = error
+                self._ready.set()
+                return
+            self._ready.set()
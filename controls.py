@@ -1,35 +1,151 @@
+import time
+from collections import deque
+
 import pygame
 from classes.constants import WIDTH, HEIGHT
 
 
-def move_player(keys, player):
-    if keys[pygame.K_LEFT]:
-        if keys[pygame.K_UP]:
+KEY_ACTIONS = {
+    pygame.K_LEFT: 'left',
+    pygame.K_RIGHT: 'right',
+    pygame.K_UP: 'up',
+    pygame.K_DOWN: 'down',
+    pygame.K_SPACE: 'fire',
+    pygame.K_ESCAPE: 'pause',
+    pygame.K_p: 'pause',
+    pygame.K_PAUSE: 'pause',
+}
+
+JOY_BUTTON_ACTIONS = {
+    0: 'fire',
+    7: 'pause',
+}
+
+JOY_DEADZONE = 0.1
+
+
+class InputActions:
+    """
+    Maps keyboard and joystick events to actions. Presses and releases are
+    buffered until the frame that consumes them ends, so a tap shorter than
+    a frame still registers. Each frame that consumed input records the
+    time from its first input event to the frame being presented.
+    """
+
+    def __init__(self, joystick=None, history=600):
+        self.joystick = joystick
+        self.held = set()
+        self.pressed = set()
+        self.released = set()
+        self.axis = (0.0, 0.0)
+        self.first_event_time = None
+        self.consumed_time = None
+        self.latencies = deque(maxlen=history)
+
+    def handle_event(self, event):
+        """Returns True when the event maps to an action."""
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            action = KEY_ACTIONS.get(event.key)
+            down = event.type == pygame.KEYDOWN
+        elif event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+            action = JOY_BUTTON_ACTIONS.get(event.button)
+            down = event.type == pygame.JOYBUTTONDOWN
+        else:
+            return False
+        if action is None:
+            return False
+
+        if self.first_event_time is None:
+            self.first_event_time = time.perf_counter()
+        if down:
+            self.held.add(action)
+            self.pressed.add(action)
+        else:
+            self.held.discard(action)
+            self.released.add(action)
+        return True
+
+    def poll(self):
+        """Read analog state; call once per frame before using the actions."""
+        if self.joystick:
+            self.axis = (self.joystick.get_axis(0), self.joystick.get_axis(1))
+
+    def active(self, action):
+        """Held now, or pressed at any point since the last frame."""
+        return action in self.held or action in self.pressed
+
+    def end_frame(self):
+        """Drop the buffered edges; the frame has seen them."""
+        if self.first_event_time is not None:
+            self.consumed_time = self.first_event_time
+            self.first_event_time = None
+        self.pressed.clear()
+        self.released.clear()
+
+    def presented(self, present_time):
+        """
+        Record input-to-present latency for the frame that consumed input;
+        returns it in ms, or None when the frame consumed no input.
+        """
+        if self.consumed_time is None:
+            return None
+        latency = (present_time - self.consumed_time) * 1000
+        self.latencies.append(latency)
+        self.consumed_time = None
+        return latency
+
+    def sync(self):
+        """Rebuild held keys from the keyboard, e.g. after the game was paused."""
+        keys = pygame.key.get_pressed()
+        self.held = {action for key, action in KEY_ACTIONS.items() if keys[key]}
+        self.pressed.clear()
+        self.released.clear()
+        self.first_event_time = None
+        self.consumed_time = None
+
+    def latency_summary(self):
+        """(median, p95, max) input-to-present ms over recent frames."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return (
+            ordered[len(ordered) // 2],
+            ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            ordered[-1],
+        )
+
+
+def move_player(actions, player):
+    left = actions.active('left')
+    right = actions.active('right')
+    up = actions.active('up')
+    down = actions.active('down')
+    if left:
+        if up:
             player.move_up_left()
-        elif keys[pygame.K_DOWN]:
+        elif down:
             player.move_down_left()
         else:
             player.move_left()
-    elif keys[pygame.K_RIGHT]:
-        if keys[pygame.K_UP]:
+    elif right:
+        if up:
             player.move_up_right()
-        elif keys[pygame.K_DOWN]:
+        elif down:
             player.move_down_right()
         else:
             player.move_right()
-    elif keys[pygame.K_UP]:
+    elif up:
         player.move_up()
-    elif keys[pygame.K_DOWN]:
+    elif down:
         player.move_down()
     else:
         player.stop()
 
 
-def move_player_with_joystick(joystick, player):
-    x_axis = joystick.get_axis(0)
-    y_axis = joystick.get_axis(1)
+def move_player_with_joystick(actions, player):
+    x_axis, y_axis = actions.axis
 
-    if abs(x_axis) > 0.1:
+    if abs(x_axis) > JOY_DEADZONE:
         new_x = player.rect.x + x_axis * player.speed
         if new_x < 0:
             new_x = 0
@@ -37,7 +153,7 @@ def move_player_with_joystick(joystick, player):
             new_x = WIDTH - player.rect.width
         player.rect.x = new_x
 
-    if abs(y_axis) > 0.1:
+    if abs(y_axis) > JOY_DEADZONE:
         new_y = player.rect.y + y_axis * player.speed
         if new_y < 0:
             new_y = 0
@@ -7,6 +7,9 @@ import pygame
 import random
 import math
 from classes.constants import WIDTH, HEIGHT
+import quality
+import glow
+from fonts import get_font
 
 
 class ParallaxLayer:
@@ -162,11 +165,15 @@ class ParallaxBackground:
         self.near_layer.update(speed_multiplier)
     
     def draw(self, screen):
-        """Draw all layers from back to front."""
+        """Draw all layers from back to front; lower quality tiers drop the far ones."""
         screen.fill(self.base_color)
-        self.far_layer.draw(screen)
-        self.nebula_layer.draw(screen)
-        self.mid_layer.draw(screen)
+        star_layers = quality.settings['star_layers']
+        if star_layers >= 3:
+            self.far_layer.draw(screen)
+        if quality.settings['nebula']:
+            self.nebula_layer.draw(screen)
+        if star_layers >= 2:
+            self.mid_layer.draw(screen)
         self.near_layer.draw(screen)
 
 
@@ -231,7 +238,7 @@ class NeonBar:
         fill_width = int(self.bar_width * ratio)
         if fill_width > 0:
             glow_alpha = int(80 * pulse)
-            for i in range(3, 0, -1):
+            for i in range(quality.settings['bar_glow'], 0, -1):
                 glow_rect = pygame.Rect(
                     10 - i * 2, 10 - i * 2,
                     fill_width + i * 4, self.height + i * 4
@@ -288,7 +295,7 @@ class CosmicScoreDisplay:
         self.x = x
         self.y = y
         self.icon = score_icon
-        self.font = pygame.font.SysFont('Arial', 28, bold=True)
+        self.font = get_font(28, bold=True)
         self.glow_color = (255, 215, 0)
     
     def draw(self, screen, score, right_align=True):
@@ -322,7 +329,7 @@ class CosmicHiScoreDisplay:
     """Semi-transparent hi-score display for top center of screen."""
     
     def __init__(self):
-        self.font = pygame.font.SysFont('Arial', 18)
+        self.font = get_font(18)
     
     def draw(self, screen, hi_score):
         text = self.font.render(f'HI-SCORE: {hi_score:,}', True, (200, 200, 220))
@@ -346,89 +353,77 @@ class NeonButton:
         self.text = text
         self.base_color = base_color
         self.glow_color = glow_color
-        self.font = pygame.font.SysFont('Arial', font_size, bold=True)
+        self.font = get_font(font_size, bold=True)
         self.pulse_time = 0
         
     def draw(self, screen, selected=False):
         """Draw button with varying glow intensity based on selection state."""
         self.pulse_time += 0.1
-        
-        if selected:
-            pulse = 0.7 + 0.3 * math.sin(self.pulse_time * 2)
-            glow_intensity = 1.0
-            glow_layers = 5
-        else:
-            pulse = 1.0
-            glow_intensity = 0.3
-            glow_layers = 2
-        
-        # Glow effect (more layers and brighter when selected)
-        for i in range(glow_layers, 0, -1):
-            glow_alpha = int(40 * glow_intensity * pulse / i)
-            expand = i * 4 if selected else i * 2
-            glow_rect = self.rect.inflate(expand, expand)
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(
-                glow_surface, 
-                (*self.glow_color, glow_alpha),
-                (0, 0, glow_rect.width, glow_rect.height),
-                border_radius=12
+        pulse = 0.7 + 0.3 * math.sin(self.pulse_time * 2) if selected else 1.0
+        alpha = int(255 * pulse)
+
+        # Glow effect (wider and brighter when selected); pulsing only changes alpha
+        glow_layers = min(5 if selected else 2, quality.settings['button_glow'])
+        if glow_layers:
+            halo = glow.rect_glow(
+                self.rect.size, self.glow_color,
+                glow_layers * 2 if selected else glow_layers,
+                0.6 if selected else 0.25
             )
-            screen.blit(glow_surface, glow_rect.topleft)
-        
-        # Button background
+            halo.set_alpha(alpha)
+            screen.blit(halo, halo.get_rect(center=self.rect.center))
+
+        body = glow.baked(
+            ('button', self.rect.size, self.base_color, self.glow_color, selected),
+            lambda: self._bake_body(selected)
+        )
+        body.set_alpha(alpha)
+        screen.blit(body, self.rect.topleft)
+
+        # Text with glow when selected
+        text_color = (255, 255, 255) if selected else (200, 200, 220)
+        text_surface = glow.text(self.font, self.text, text_color)
+        text_rect = text_surface.get_rect(center=self.rect.center)
+        if selected:
+            halo = glow.text_glow(self.font, self.text, self.glow_color, 2, strength=1.0)
+            halo.set_alpha(alpha)
+            screen.blit(halo, halo.get_rect(center=text_rect.center))
+
+        screen.blit(text_surface, text_rect)
+
+    def _bake_body(self, selected):
+        """Gradient background, border and highlight at full pulse."""
         bg_alpha = 200 if selected else 160
         button_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        
+
         # Gradient background
         for i in range(self.rect.height):
             gradient_factor = 0.3 + 0.7 * (1 - abs(i - self.rect.height // 2) / (self.rect.height // 2))
             if selected:
-                col = tuple(int(c * gradient_factor * pulse) for c in self.base_color)
+                col = tuple(int(c * gradient_factor) for c in self.base_color)
             else:
                 col = tuple(int(c * gradient_factor * 0.5) for c in self.base_color)
             pygame.draw.line(
-                button_surface, 
-                (*col, bg_alpha), 
-                (0, i), 
+                button_surface,
+                (*col, bg_alpha),
+                (0, i),
                 (self.rect.width, i)
             )
-        
+
         # Button border
-        border_alpha = int(200 * pulse) if selected else 100
         pygame.draw.rect(
             button_surface,
-            (*self.glow_color, border_alpha),
+            (*self.glow_color, 200 if selected else 100),
             (0, 0, self.rect.width, self.rect.height),
             width=2,
             border_radius=10
         )
-        
+
         # Top highlight
         if selected:
-            highlight_surface = pygame.Surface((self.rect.width - 20, 2), pygame.SRCALPHA)
-            highlight_surface.fill((*self.glow_color, int(150 * pulse)))
-            button_surface.blit(highlight_surface, (10, 3))
-        
-        screen.blit(button_surface, self.rect.topleft)
-        
-        # Text with glow when selected
-        text_color = (255, 255, 255) if selected else (200, 200, 220)
-        text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        
-        if selected:
-            # Text glow
-            glow_text = self.font.render(self.text, True, self.glow_color)
-            for offset in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
-                glow_rect = text_rect.copy()
-                glow_rect.x += offset[0]
-                glow_rect.y += offset[1]
-                glow_text.set_alpha(int(100 * pulse))
-                screen.blit(glow_text, glow_rect)
-        
-        screen.blit(text_surface, text_rect)
-    
+            button_surface.fill((*self.glow_color, 150), (10, 3, self.rect.width - 20, 2))
+        return button_surface
+
     def is_hovered(self, pos):
         """Check if mouse position is over the button."""
         return self.rect.collidepoint(pos)
@@ -437,8 +432,8 @@ class NeonButton:
 class NeonText:
     """Neon-styled text with glow effect for headers and important messages."""
     
-    def __init__(self, font_name='Arial', font_size=50, bold=True):
-        self.font = pygame.font.SysFont(font_name, font_size, bold=bold)
+    def __init__(self, face='sans', font_size=50, bold=True):
+        self.font = get_font(font_size, bold=bold, face=face)
         self.pulse_time = 0
     
     def draw(self, screen, text, center_pos, color=(255, 100, 100), 
@@ -450,18 +445,15 @@ class NeonText:
         self.pulse_time += 0.1
         pulse_factor = 0.7 + 0.3 * math.sin(self.pulse_time) if pulse else 1.0
         
-        text_surface = self.font.render(text, True, color)
+        text_surface = glow.text(self.font, text, color)
         text_rect = text_surface.get_rect(center=center_pos)
-        
-        # Glow layers
-        for i in range(3, 0, -1):
-            glow_alpha = int(60 * pulse_factor / i)
-            glow_surface = self.font.render(text, True, (*glow_color[:3], glow_alpha))
-            for offset in [(-i, -i), (i, -i), (-i, i), (i, i), (0, -i), (0, i), (-i, 0), (i, 0)]:
-                glow_rect = text_rect.copy()
-                glow_rect.x += offset[0]
-                glow_rect.y += offset[1]
-                screen.blit(glow_surface, glow_rect)
-        
+
+        # Baked once per text and color; the tier sets the blur radius
+        radius = quality.settings['text_glow']
+        if radius:
+            halo = glow.text_glow(self.font, text, tuple(glow_color[:3]), radius * 2)
+            halo.set_alpha(int(255 * pulse_factor))
+            screen.blit(halo, halo.get_rect(center=text_rect.center))
+
         screen.blit(text_surface, text_rect)
         return text_rect
@@ -0,0 +1,53 @@
+"""
+Font registry for Cosmic Heat.
+Fonts load from bundled TTF files once per (face, size, bold) and are
+shared by every widget, instead of each one scanning the system font list
+through SysFont.
+"""
+
+import os
+import time
+
+import pygame
+
+
+# face -> (regular TTF, bold TTF). 'sans' is DejaVu Sans, bundled under
+# fonts/, with the FreeSans Bold file that ships inside the pygame package.
+FACES = {
+    'sans': (os.path.join('fonts', 'DejaVuSans.ttf'), pygame.font.get_default_font()),
+}
+
+_fonts = {}
+_requests = {}
+_load_seconds = 0.0
+
+
+def get_font(size, bold=False, face='sans'):
+    """Shared Font for (face, size, bold), loaded on first use."""
+    global _load_seconds
+    key = (face, size, bold)
+    _requests[key] = _requests.get(key, 0) + 1
+    font = _fonts.get(key)
+    if font is None:
+        start = time.perf_counter()
+        font = pygame.font.Font(FACES[face][1 if bold else 0], size)
+        _load_seconds += time.perf_counter() - start
+        _fonts[key] = font
+    return font
+
+
+def requests():
+    """{(face, size, bold): number of get_font calls}"""
+    return dict(_requests)
+
+
+def stats():
+    """(fonts loaded, get_font calls, total ms spent loading)"""
+    return len(_fonts), sum(_requests.values()), _load_seconds * 1000
+
+
+def clear():
+    global _load_seconds
+    _fonts.clear()
+    _requests.clear()
+    _load_seconds = 0.0
@@ -0,0 +1,105 @@
+"""
+Baked glow sprites for the neon UI.
+Text renders, soft glows and button bodies are drawn once per look and
+kept in a bounded cache; widgets only change a baked sprite's alpha to
+pulse. Glows are blurred with a separable box blur over the alpha plane.
+"""
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+
+# Enough for every menu label plus a few hundred score strings
+MAX_ENTRIES = 256
+BLUR_PASSES = 2
+
+_cache = OrderedDict()
+_bakes = 0
+_bake_seconds = 0.0
+
+
+def _cached(key, build):
+    global _bakes, _bake_seconds
+    surface = _cache.get(key)
+    if surface is None:
+        start = time.perf_counter()
+        surface = build()
+        _bake_seconds += time.perf_counter() - start
+        _bakes += 1
+        _cache[key] = surface
+        if len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return surface
+
+
+def _blur_rows(values, radius):
+    size = 2 * radius + 1
+    summed = np.cumsum(np.pad(values, ((radius + 1, radius), (0, 0))), axis=0)
+    return (summed[size:] - summed[:-size]) / size
+
+
+def box_blur(alpha, radius, passes=BLUR_PASSES):
+    """Blur a 2D array; a few box passes approximate a gaussian."""
+    values = alpha.astype(np.float32)
+    for _ in range(passes):
+        values = _blur_rows(_blur_rows(values, radius).T, radius).T
+    return values
+
+
+def _glow_from(shape, color, radius, strength):
+    """A glow sprite in color whose alpha is shape's alpha blurred by radius."""
+    padding = radius * BLUR_PASSES
+    width, height = shape.get_size()
+    glow = pygame.Surface((width + 2 * padding, height + 2 * padding), pygame.SRCALPHA)
+    glow.fill((*color[:3], 0))
+    alpha = np.zeros(glow.get_size(), np.float32)
+    alpha[padding:padding + width, padding:padding + height] = pygame.surfarray.array_alpha(shape)
+    alpha = box_blur(alpha, radius) * strength
+    pixels = pygame.surfarray.pixels_alpha(glow)
+    pixels[:] = np.clip(alpha, 0, 255).astype(np.uint8)
+    del pixels
+    return glow
+
+
+def text(font, string, color):
+    """font.render(string, True, color), rendered once."""
+    return _cached(('text', font, string, color), lambda: font.render(string, True, color))
+
+
+def text_glow(font, string, color, radius, strength=2.0):
+    """Soft glow around rendered text, to be blitted centred on it."""
+    return _cached(
+        ('text_glow', font, string, color, radius, strength),
+        lambda: _glow_from(font.render(string, True, color), color, radius, strength)
+    )
+
+
+def rect_glow(size, color, radius, strength, border_radius=12):
+    """Soft glow around a rounded rect of size, to be blitted centred on it."""
+    def build():
+        shape = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(shape, (255, 255, 255, 255), shape.get_rect(), border_radius=border_radius)
+        return _glow_from(shape, color, radius, strength)
+    return _cached(('rect_glow', size, color, radius, strength, border_radius), build)
+
+
+def baked(key, build):
+    """Any other surface that only depends on key."""
+    return _cached(('baked',) + key, build)
+
+
+def stats():
+    """(cached sprites, sprites baked, total ms spent baking)"""
+    return len(_cache), _bakes, _bake_seconds * 1000
+
+
+def clear():
+    global _bakes, _bake_seconds
+    _cache.clear()
+    _bakes = 0
+    _bake_seconds = 0.0
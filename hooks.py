@@ -0,0 +1,80 @@
+"""
+Instrumentation hooks for Cosmic Heat.
+One layer of wrappers around the pygame calls that allocate Surfaces or
+play sounds, shared by the telemetry counters and memtrack: each
+subscribes a listener instead of wrapping pygame itself.
+
+Only module attributes are replaced, so code that looks up pygame.Surface,
+pygame.mixer.Sound and friends at call time is covered, and objects made
+before install() are not. Install before any scene is built.
+"""
+
+import sys
+
+import pygame
+
+
+# Transforms that return a new Surface unless given a dest_surface
+TRANSFORMS = ('rotate', 'rotozoom', 'flip', 'scale', 'smoothscale', 'scale2x', 'laplacian')
+
+# listener(frame, surface): a new Surface, with the stack frame that asked for it
+surface_listeners = []
+# listener(): a Sound started playing
+sound_listeners = []
+
+_installed = False
+
+
+def _into_dest(result, args, kwargs):
+    """True when a transform wrote into a dest_surface the caller supplied."""
+    return 'dest_surface' in kwargs or any(result is arg for arg in args)
+
+
+def _made(surface):
+    frame = sys._getframe(1)
+    for listener in surface_listeners:
+        listener(frame, surface)
+
+
+def _allocating(function):
+    def wrapper(*args, **kwargs):
+        result = function(*args, **kwargs)
+        if surface_listeners and not _into_dest(result, args, kwargs):
+            _made(result)
+        return result
+    return wrapper
+
+
+def install():
+    """Wrap pygame once; later calls do nothing."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    class HookedSurface(pygame.Surface):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if surface_listeners:
+                _made(self)
+
+    class HookedFont(pygame.font.Font):
+        def render(self, *args, **kwargs):
+            result = super().render(*args, **kwargs)
+            if surface_listeners:
+                _made(result)
+            return result
+
+    class HookedSound(pygame.mixer.Sound):
+        def play(self, *args, **kwargs):
+            for listener in sound_listeners:
+                listener()
+            return super().play(*args, **kwargs)
+
+    pygame.Surface = HookedSurface
+    pygame.font.Font = HookedFont
+    pygame.sysfont.Font = HookedFont
+    pygame.mixer.Sound = HookedSound
+    pygame.image.load = _allocating(pygame.image.load)
+    for name in TRANSFORMS:
+        setattr(pygame.transform, name, _allocating(getattr(pygame.transform, name)))
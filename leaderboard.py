@@ -0,0 +1,162 @@
+"""
+Persistent local leaderboard for Cosmic Heat.
+Runs are stored in SQLite (WAL journal, indexed by score). The best score
+is read once at startup and kept in memory; finished runs are queued to a
+background writer thread so the game loop never waits on disk I/O.
+
+Usage: python leaderboard.py top [--limit N] [--player NAME] [--path FILE]
+"""
+
+import argparse
+import json
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    frames INTEGER NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_player ON runs (player, score DESC);
+"""
+
+_STOP = object()
+
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    return connection
+
+
+class Leaderboard:
+    """
+    Score history with an in-memory cache of the best score. submit() only
+    queues the run; queries open their own connection and are meant for
+    menus and tools, not for frames of play.
+    """
+
+    def __init__(self, path='leaderboard.db'):
+        self.path = path
+        self.enabled = bool(path)
+        self.best = 0
+        self.written = 0
+        self.failed = 0
+        self._pending = queue.SimpleQueue()
+        self._worker = None
+        if not self.enabled:
+            return
+
+        connection = _connect(path)
+        try:
+            connection.executescript(SCHEMA)
+            self.best = connection.execute('SELECT COALESCE(MAX(score), 0) FROM runs').fetchone()[0]
+        finally:
+            connection.close()
+        self._worker = threading.Thread(target=self._run, name='leaderboard-writer', daemon=True)
+        self._worker.start()
+
+    def submit(self, player, score, started_at, duration, frames, **metadata):
+        """Queue a finished run and update the cached best score."""
+        self.best = max(self.best, score)
+        if self.enabled:
+            self._pending.put((player, score, started_at, duration, frames, json.dumps(metadata)))
+
+    def top(self, limit=10, player=None):
+        """Best runs as dicts, highest score first; optionally for one player."""
+        if not self.enabled:
+            return []
+        query = 'SELECT player, score, started_at, duration, frames, metadata FROM runs'
+        args = ()
+        if player is not None:
+            query += ' WHERE player = ?'
+            args = (player,)
+        query += ' ORDER BY score DESC LIMIT ?'
+        connection = _connect(self.path)
+        try:
+            rows = connection.execute(query, args + (limit,)).fetchall()
+        finally:
+            connection.close()
+        return [
+            {
+                'player': player_name, 'score': score, 'started_at': started_at,
+                'duration': duration, 'frames': frames, 'metadata': json.loads(metadata),
+            }
+            for player_name, score, started_at, duration, frames, metadata in rows
+        ]
+
+    def player_bests(self, limit=10):
+        """[(player, best score)] highest first."""
+        if not self.enabled:
+            return []
+        connection = _connect(self.path)
+        try:
+            return connection.execute(
+                'SELECT player, MAX(score) AS best FROM runs GROUP BY player ORDER BY best DESC LIMIT ?',
+                (limit,)
+            ).fetchall()
+        finally:
+            connection.close()
+
+    def close(self):
+        """Write every queued run and stop the worker."""
+        if self._worker is None:
+            return
+        self._pending.put(_STOP)
+        self._worker.join()
+        self._worker = None
+
+    def _run(self):
+        connection = _connect(self.path)
+        while True:
+            run = self._pending.get()
+            if run is _STOP:
+                break
+            try:
+                with connection:
+                    connection.execute(
+                        'INSERT INTO runs (player, score, started_at, duration, frames, metadata)'
+                        ' VALUES (?, ?, ?, ?, ?, ?)',
+                        run
+                    )
+                self.written += 1
+            except sqlite3.Error:
+                self.failed += 1
+        connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cosmic Heat leaderboard")
+    parser.add_argument('command', choices=['top', 'players'])
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--player')
+    parser.add_argument('--path', default='leaderboard.db')
+    args = parser.parse_args(argv)
+
+    board = Leaderboard(args.path)
+    if args.command == 'top':
+        for rank, run in enumerate(board.top(args.limit, args.player), 1):
+            started = time.strftime('%Y-%m-%d %H:%M', time.localtime(run['started_at']))
+            sys.stdout.write(
+                f"{rank:>3}. {run['player']:<16}{run['score']:>10,}  {started}"
+                f"  {run['duration']:>6.0f}s  {run['frames']:>7} frames\n"
+            )
+    else:
+        for rank, (player, best) in enumerate(board.player_bests(args.limit), 1):
+            sys.stdout.write(f"{rank:>3}. {player:<16}{best:>10,}\n")
+    board.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,29 @@
 import sys
+import time
 
 import pygame
 import random
 
-from controls import move_player, move_player_with_joystick
-from classes.constants import WIDTH, HEIGHT, FPS, SHOOT_DELAY
-from functions import show_game_over, show_pause_menu, music_background
-from menu import show_menu
+from compositor import BackgroundCompositor
+from controls import InputActions, move_player, move_player_with_joystick
+from classes.constants import (
+    WIDTH, HEIGHT, FPS, SHOOT_DELAY,
+    CAPTURE_DIR, CAPTURE_FORMAT, CAPTURE_SCALE, CAPTURE_SLOTS, TELEMETRY_PATH,
+    MEMTRACK_PATH, QUALITY, RENDER_SCALE, LEADERBOARD_PATH, PLAYER_NAME, BACKGROUND_THREAD,
+    RENDERER, REWIND_SECONDS, REWIND_STEP
+)
+from functions import GameOverScene, PauseScene, music_background
+from menu import MenuScene
+from leaderboard import Leaderboard
+import hooks
+import memtrack
+from quality import QualityGovernor, tier_index
+from recorder import FrameRecorder
+from render import RenderQueue, RenderTarget, TextureDisplay, TextureTarget
+from scenes import Scene, SceneManager
+from snapshot import RewindBuffer, SnapshotCodec
+from telemetry import FrameTelemetry, install_pygame_counters
+from fonts import get_font
 from cosmic_ui import (
     ParallaxBackground, NeonBar, CosmicScoreDisplay, CosmicHiScoreDisplay
 )
@@ -15,752 +32,685 @@ from classes.player import Player
 from classes.bullets import Bullet
 from classes.refill import BulletRefill, HealthRefill, DoubleRefill, ExtraScore
 from classes.meteors import Meteors, Meteors2, BlackHole
-from classes.explosions import Explosion, Explosion2
+from classes.explosions import Explosion, Explosion2, EffectManager
+from classes.lifecycle import Lifetimes
 from classes.enemies import Enemy1, Enemy2
-from classes.bosses import Boss1, Boss2, Boss3
-
-
-pygame.init()
-music_background()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-surface = pygame.Surface((WIDTH, HEIGHT))
-pygame.display.set_caption("Cosmic Heat")
-clock = pygame.time.Clock()
-
-
-explosions = pygame.sprite.Group()
-explosions2 = pygame.sprite.Group()
-bullets = pygame.sprite.Group()
-enemy1_group = pygame.sprite.Group()
-enemy2_group = pygame.sprite.Group()
-boss1_group = pygame.sprite.Group()
-boss2_group = pygame.sprite.Group()
-boss3_group = pygame.sprite.Group()
-bullet_refill_group = pygame.sprite.Group()
-health_refill_group = pygame.sprite.Group()
-double_refill_group = pygame.sprite.Group()
-meteor_group = pygame.sprite.Group()
-meteor2_group = pygame.sprite.Group()
-extra_score_group = pygame.sprite.Group()
-black_hole_group = pygame.sprite.Group()
-enemy2_bullets = pygame.sprite.Group()
-
-boss1_bullets = pygame.sprite.Group()
-boss2_bullets = pygame.sprite.Group()
-boss3_bullets = pygame.sprite.Group()
-
-boss1_health = 150
-boss1_health_bar_rect = pygame.Rect(0, 0, 150, 5)
-boss1_spawned = False
-
-boss2_health = 150
-boss2_health_bar_rect = pygame.Rect(0, 0, 150, 5)
-boss2_spawned = False
-
-boss3_health = 200
-boss3_health_bar_rect = pygame.Rect(0, 0, 200, 5)
-boss3_spawned = False
-
-# Modern parallax background system
-parallax_bg = ParallaxBackground()
-
-explosion_images = [pygame.image.load(f"images/explosion/explosion{i}.png") for i in range(8)]
-explosion2_images = [pygame.image.load(f"images/explosion2/explosion{i}.png") for i in range(18)]
-explosion3_images = [pygame.image.load(f"images/explosion3/explosion{i}.png") for i in range(18)]
-
-enemy1_img = [
-    pygame.image.load('images/enemy/enemy1_1.png').convert_alpha(),
-    pygame.image.load('images/enemy/enemy1_2.png').convert_alpha(),
-    pygame.image.load('images/enemy/enemy1_3.png').convert_alpha()
-]
-enemy2_img = [
-    pygame.image.load('images/enemy/enemy2_1.png').convert_alpha(),
-    pygame.image.load('images/enemy/enemy2_2.png').convert_alpha()
-]
-boss1_img = pygame.image.load('images/boss/boss1.png').convert_alpha()
-boss2_img = pygame.image.load('images/boss/boss2_1.png').convert_alpha()
-boss3_img = pygame.image.load('images/boss/boss3.png').convert_alpha()
-
-health_refill_img = pygame.image.load('images/refill/health_refill.png').convert_alpha()
-bullet_refill_img = pygame.image.load('images/refill/bullet_refill.png').convert_alpha()
-double_refill_img = pygame.image.load('images/refill/double_refill.png').convert_alpha()
-
-meteor_imgs = [
-    pygame.image.load('images/meteors/meteor_1.png').convert_alpha(),
-    pygame.image.load('images/meteors/meteor_2.png').convert_alpha(),
-    pygame.image.load('images/meteors/meteor_3.png').convert_alpha(),
-    pygame.image.load('images/meteors/meteor_4.png').convert_alpha()
-]
-meteor2_imgs = [
-    pygame.image.load('images/meteors/meteor2_1.png').convert_alpha(),
-    pygame.image.load('images/meteors/meteor2_2.png').convert_alpha(),
-    pygame.image.load('images/meteors/meteor2_3.png').convert_alpha(),
-    pygame.image.load('images/meteors/meteor2_4.png').convert_alpha()
-]
-extra_score_img = pygame.image.load('images/score/score_coin.png').convert_alpha()
-black_hole_imgs = [
-    pygame.image.load('images/hole/black_hole.png').convert_alpha(),
-    pygame.image.load('images/hole/black_hole2.png').convert_alpha()
-]
-
-initial_player_pos = (WIDTH // 2, HEIGHT - 100)
-
-# Neon UI elements
-health_icon = pygame.image.load("images/life_bar.png").convert_alpha()
-ammo_icon = pygame.image.load("images/bullet_bar.png").convert_alpha()
-
-health_bar = NeonBar(
-    x=10, y=10, width=220, height=22,
-    icon_surface=health_icon,
-    fill_color=(50, 220, 100),
-    glow_color=(100, 255, 150),
-    low_threshold=0.25
-)
-
-ammo_bar = NeonBar(
-    x=10, y=45, width=220, height=22,
-    icon_surface=ammo_icon,
-    fill_color=(220, 80, 80),
-    glow_color=(255, 120, 120),
-    low_threshold=0.25
+from classes.swarm import separate, spawn_point, steer
+from classes.bosses import BossSpawner
+from classes.collision import CollisionRegistry
+from classes.difficulty import DifficultyCurve
+from classes.ecs import World, lifetime, movement
+from classes.projectiles import ProjectileField
+
+
+TELEMETRY_COUNTERS = (
+    'collision_tests', 'surfaces', 'sounds',
+    'spawn_enemy1', 'spawn_enemy2', 'spawn_boss', 'spawn_meteor', 'spawn_meteor2',
+    'spawn_black_hole', 'spawn_extra_score', 'spawn_refill', 'spawn_bullet',
+    'kill_enemy1', 'kill_enemy2', 'kill_boss', 'kill_meteor', 'kill_meteor2',
+    'effects_merged', 'effects_evicted', 'effects_dropped', 'input_latency_us',
+    'lifetime_expired', 'lifetime_culled', 'spawn_refused', 'blits_submitted', 'draw_culled',
 )
 
-score_display = CosmicScoreDisplay(WIDTH - 15, 12, extra_score_img)
-hi_score_display = CosmicHiScoreDisplay()
-
-score = 0
-hi_score = 0
-player = Player()
-player_life = 200
-bullet_counter = 200
-
-running = True
-
-joystick = None
-if pygame.joystick.get_count() > 0:
-    joystick = pygame.joystick.Joystick(0)
-    joystick.init()
-
-if show_menu:
-    import menu
-    menu.main()
-
-is_shooting = False
-last_shot_time = 0
-
-
-while running:
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                if bullet_counter > 0 and pygame.time.get_ticks() - last_shot_time > SHOOT_DELAY:
-                    last_shot_time = pygame.time.get_ticks()
-                    bullet = Bullet(player.rect.centerx, player.rect.top)
-                    bullets.add(bullet)
-                    bullet_counter -= 1
-                is_shooting = True
-
-            elif event.key == pygame.K_ESCAPE or event.key == pygame.K_p or event.key == pygame.K_PAUSE:
-                # Capture current screen for pause menu background
-                game_snapshot = screen.copy()
-                result = show_pause_menu(game_snapshot)
-                if result == 'resume':
-                    continue
-            elif event.key == pygame.K_LEFT:
-                player.move_left()
-            elif event.key == pygame.K_RIGHT:
-                player.move_right()
-            elif event.key == pygame.K_UP:
-                player.move_up()
-            elif event.key == pygame.K_DOWN:
-                player.move_down()
-
-        elif event.type == pygame.KEYUP:
-            if event.key == pygame.K_SPACE and player.original_image is not None:
-                player.image = player.original_image.copy()
-                is_shooting = False
-            elif event.key == pygame.K_LEFT:
-                player.stop_left()
-            elif event.key == pygame.K_RIGHT:
-                player.stop_right()
-            elif event.key == pygame.K_UP:
-                player.stop_up()
-            elif event.key == pygame.K_DOWN:
-                player.stop_down()
-
-        elif event.type == pygame.JOYBUTTONDOWN:
-            if event.button == 0:
-                is_shooting = True
-                if bullet_counter > 0:
-                    bullet = Bullet(player.rect.centerx, player.rect.top)
-                    bullets.add(bullet)
-                    bullet_counter -= 1
-            elif event.button == 7:
-                game_snapshot = screen.copy()
-                result = show_pause_menu(game_snapshot)
-                if result == 'resume':
-                    continue
-        elif event.type == pygame.JOYBUTTONUP:
-            if event.button == 0 and player.original_image is not None:
-                is_shooting = False
-
-    if pygame.time.get_ticks() - last_shot_time > SHOOT_DELAY and is_shooting:
-        if bullet_counter > 0:
-            last_shot_time = pygame.time.get_ticks()
-            bullet = Bullet(player.rect.centerx, player.rect.top)
-            bullets.add(bullet)
-            bullet_counter -= 1
-
-    if joystick:
-        move_player_with_joystick(joystick, player)
-
-    keys = pygame.key.get_pressed()
-    move_player(keys, player)
-
-    # Parallax background with score-based speed increase
-    bg_speed = 1.0
-    if score > 3000:
-        bg_speed = 1.5
-    if score > 10000:
-        bg_speed = 2.0
-    if score > 15000:
-        bg_speed = 2.5
-
-    parallax_bg.update(bg_speed)
-    parallax_bg.draw(screen)
-
-    if score > hi_score:
-        hi_score = score
-
-    if random.randint(0, 120) == 0:
-        enemy_img = random.choice(enemy1_img)
-        enemy_object = Enemy1(
-            random.randint(100, WIDTH - 50),
-            random.randint(-HEIGHT, -50),
-            enemy_img,
-        )
-        enemy1_group.add(enemy_object)
-
-    if score >= 3000 and random.randint(0, 40) == 0 and len(enemy2_group) < 2:
-        enemy_img = random.choice(enemy2_img)
-        enemy2_object = Enemy2(
-            random.randint(200, WIDTH - 100),
-            random.randint(-HEIGHT, -100),
-            enemy_img,
-        )
-        enemy2_group.add(enemy2_object)
-
-    if score >= 5000 and not boss1_spawned:
-        pygame.mixer.Sound('game_sounds/warning.mp3').play()
-        boss1_img = boss1_img
-        boss1_object = Boss1(
-            random.randint(200, WIDTH - 100),
-            random.randint(-HEIGHT, -100),
-            boss1_img,
-        )
-        boss1_group.add(boss1_object)
-        boss1_spawned = True
-
-    if score >= 10000 and not boss2_spawned:
-        pygame.mixer.Sound('game_sounds/warning.mp3').play()
-        boss2_img = boss2_img
-        boss2_object = Boss2(
-            random.randint(200, WIDTH - 100),
-            random.randint(-HEIGHT, -100),
-            boss2_img,
-        )
-        boss2_group.add(boss2_object)
-        boss2_spawned = True
-
-    if score >= 15000 and not boss3_spawned:
-        pygame.mixer.Sound('game_sounds/warning.mp3').play()
-        boss3_img = boss3_img
-        boss3_object = Boss3(
-            random.randint(200, WIDTH - 100),
-            random.randint(-HEIGHT, -100),
-            boss3_img,
-        )
-        boss3_group.add(boss3_object)
-        boss3_spawned = True
-
-    if random.randint(0, 60) == 0:
-        extra_score = ExtraScore(
-            random.randint(50, WIDTH - 50),
-            random.randint(-HEIGHT, -50 - extra_score_img.get_rect().height),
-            extra_score_img,
-        )
-
-        extra_score_group.add(extra_score)
 
-    if score > 3000 and random.randint(0, 100) == 0:
-        meteor_img = random.choice(meteor_imgs)
-        meteor_object = Meteors(
-            random.randint(0, 50),
-            random.randint(0, 50),
-            meteor_img,
-        )
-        meteor_group.add(meteor_object)
-
-    if random.randint(0, 90) == 0:
-        meteor2_img = random.choice(meteor2_imgs)
-        meteor2_object = Meteors2(
-            random.randint(100, WIDTH - 50),
-            random.randint(-HEIGHT, -50 - meteor2_img.get_rect().height),
-            meteor2_img,
-        )
-        meteor2_group.add(meteor2_object)
-
-    if score > 1000 and random.randint(0, 500) == 0:
-        black_hole_img = random.choice(black_hole_imgs)
-        black_hole_object = BlackHole(
-            random.randint(100, WIDTH - 50),
-            random.randint(-HEIGHT, -50 - black_hole_img.get_rect().height),
-            black_hole_img,
+class GameScene(Scene):
+    """
+    The gameplay loop. Everything is loaded once; retry resets the state
+    in place, and the pause and game over scenes are built alongside it.
+    """
+
+    def __init__(self, manager, world, governor, menu_background, telemetry_path='', leaderboard=None):
+        self.manager = manager
+        self.world = world
+        self.governor = governor
+        self.leaderboard = leaderboard if leaderboard is not None else Leaderboard('')
+
+        self.player_group = pygame.sprite.GroupSingle()
+        self.bullets = pygame.sprite.Group()
+        self.enemy1_group = pygame.sprite.Group()
+        self.enemy2_group = pygame.sprite.Group()
+        self.boss_group = pygame.sprite.Group()
+        self.bullet_refill_group = pygame.sprite.Group()
+        self.health_refill_group = pygame.sprite.Group()
+        self.double_refill_group = pygame.sprite.Group()
+        self.meteor_group = pygame.sprite.Group()
+        self.meteor2_group = pygame.sprite.Group()
+        self.extra_score_group = pygame.sprite.Group()
+        self.black_hole_group = pygame.sprite.Group()
+        self.effects = EffectManager()
+        self.enemy_projectiles = ProjectileField()
+        self.boss_spawner = BossSpawner()
+        self.lifetimes = Lifetimes()
+        # Classes migrated to arrays; their sprites are facades over these entities
+        self.entities = World()
+        # Submitted in this order, each layer with one blits() call
+        self.render_queue = RenderQueue(world, (
+            ('world', True),
+            ('projectiles', False),
+            ('player', True),
+            ('effects', True),
+            ('bullets', True),
+        ))
+
+        for name, group in (
+            ('enemy1', self.enemy1_group),
+            ('enemy2', self.enemy2_group),
+            ('meteors', self.meteor_group),
+            ('meteors2', self.meteor2_group),
+            ('black_holes', self.black_hole_group),
+            ('extra_score', self.extra_score_group),
+            ('bullet_refills', self.bullet_refill_group),
+            ('health_refills', self.health_refill_group),
+            ('double_refills', self.double_refill_group),
+        ):
+            self.lifetimes.track(name, group)
+
+        # Modern parallax background system, optionally rendered off the main thread
+        self.background = BackgroundCompositor(ParallaxBackground(), world, BACKGROUND_THREAD)
+
+        self.explosion_images = [pygame.image.load(f"images/explosion/explosion{i}.png") for i in range(8)]
+        self.explosion2_images = [pygame.image.load(f"images/explosion2/explosion{i}.png") for i in range(18)]
+        self.explosion3_images = [pygame.image.load(f"images/explosion3/explosion{i}.png") for i in range(18)]
+
+        self.enemy1_img = [
+            pygame.image.load('images/enemy/enemy1_1.png').convert_alpha(),
+            pygame.image.load('images/enemy/enemy1_2.png').convert_alpha(),
+            pygame.image.load('images/enemy/enemy1_3.png').convert_alpha()
+        ]
+        self.enemy2_img = [
+            pygame.image.load('images/enemy/enemy2_1.png').convert_alpha(),
+            pygame.image.load('images/enemy/enemy2_2.png').convert_alpha()
+        ]
+
+        self.health_refill_img = pygame.image.load('images/refill/health_refill.png').convert_alpha()
+        self.bullet_refill_img = pygame.image.load('images/refill/bullet_refill.png').convert_alpha()
+        self.double_refill_img = pygame.image.load('images/refill/double_refill.png').convert_alpha()
+
+        self.meteor_imgs = [
+            pygame.image.load('images/meteors/meteor_1.png').convert_alpha(),
+            pygame.image.load('images/meteors/meteor_2.png').convert_alpha(),
+            pygame.image.load('images/meteors/meteor_3.png').convert_alpha(),
+            pygame.image.load('images/meteors/meteor_4.png').convert_alpha()
+        ]
+        self.meteor2_imgs = [
+            pygame.image.load('images/meteors/meteor2_1.png').convert_alpha(),
+            pygame.image.load('images/meteors/meteor2_2.png').convert_alpha(),
+            pygame.image.load('images/meteors/meteor2_3.png').convert_alpha(),
+            pygame.image.load('images/meteors/meteor2_4.png').convert_alpha()
+        ]
+        self.extra_score_img = pygame.image.load('images/score/score_coin.png').convert_alpha()
+        self.black_hole_imgs = [
+            pygame.image.load('images/hole/black_hole.png').convert_alpha(),
+            pygame.image.load('images/hole/black_hole2.png').convert_alpha()
+        ]
+
+        self.drops = {
+            'bullet_refills': (BulletRefill, self.bullet_refill_img),
+            'health_refills': (HealthRefill, self.health_refill_img),
+            'double_refills': (DoubleRefill, self.double_refill_img),
+        }
+
+        # Resolved in this order once per frame; telemetry records each pair's cost as <name>_us
+        self.collisions = CollisionRegistry()
+        player, bullets = self.player_group, self.bullets
+        small_blast = dict(effect=Explosion, images=self.explosion_images)
+        big_blast = dict(effect=Explosion2, images=self.explosion2_images)
+        register = self.collisions.register
+        register('black_holes_player', self.black_hole_group, player, self.drain, damage=1)
+        register('bullet_refills_player', self.bullet_refill_group, player, self.pick_up,
+                 kill_left=True, test=None, life=0, ammo=50)
+        register('health_refills_player', self.health_refill_group, player, self.pick_up,
+                 kill_left=True, test=None, life=50, ammo=0)
+        register('extra_score_player', self.extra_score_group, player, self.pick_up,
+                 score=20, kill_left=True, test=None, life=0, ammo=0)
+        register('double_refills_player', self.double_refill_group, player, self.pick_up,
+                 kill_left=True, test=None, life=50, ammo=50)
+        register('meteors_player', self.meteor_group, player, self.crash,
+                 damage=10, score=50, kill_left=True, counter='kill_meteor', **small_blast)
+        register('meteors_bullets', self.meteor_group, bullets, self.shot_down,
+                 score=80, kill_left=True, kill_right=True, counter='kill_meteor',
+                 drops=(('double_refills', 10),), **small_blast)
+        register('meteors2_player', self.meteor2_group, player, self.crash,
+                 damage=10, score=20, kill_left=True, counter='kill_meteor2', **small_blast)
+        register('meteors2_bullets', self.meteor2_group, bullets, self.shot_down,
+                 score=40, kill_left=True, kill_right=True, counter='kill_meteor2',
+                 drops=(('double_refills', 20),), **small_blast)
+        register('enemy1_player', self.enemy1_group, player, self.crash,
+                 damage=10, score=20, kill_left=True, counter='kill_enemy1', **small_blast)
+        register('enemy1_bullets', self.enemy1_group, bullets, self.shot_down,
+                 score=50, kill_left=True, kill_right=True, counter='kill_enemy1',
+                 drops=(('bullet_refills', 8), ('health_refills', 8)), **small_blast)
+        register('enemy2_player', self.enemy2_group, player, self.crash,
+                 damage=40, score=20, kill_left=True, counter='kill_enemy2', **big_blast)
+        register('enemy2_bullets', self.enemy2_group, bullets, self.shot_down,
+                 score=80, kill_left=True, kill_right=True, counter='kill_enemy2',
+                 drops=(('double_refills', 20),), **big_blast)
+        register('bosses_player', self.boss_group, player, self.boss_contact)
+        register('bosses_bullets', self.boss_group, bullets, self.boss_shot, kill_right=True)
+        self.collision_fields = tuple(f'{pair.name}_us' for pair in self.collisions.pairs)
+
+        # Score breakpoints push speeds, spawn rates and damage; nothing is checked per frame
+        self.difficulty = DifficultyCurve()
+        self._score = 0
+        self.base_damage = {pair.name: pair.damage for pair in self.collisions.pairs}
+        self.difficulty.subscribe('background', self.set_background_speed)
+        self.difficulty.subscribe('spawn', self.set_spawn_rates)
+        self.difficulty.subscribe('speed', self.set_speeds)
+        self.difficulty.subscribe('damage', self.set_damage)
+
+        self.telemetry = FrameTelemetry(
+            telemetry_path,
+            groups={
+                'enemy1': self.enemy1_group,
+                'enemy2': self.enemy2_group,
+                'bosses': self.boss_group,
+                'meteors': self.meteor_group,
+                'meteors2': self.meteor2_group,
+                'black_holes': self.black_hole_group,
+                'extra_score': self.extra_score_group,
+                'bullet_refills': self.bullet_refill_group,
+                'health_refills': self.health_refill_group,
+                'double_refills': self.double_refill_group,
+                'bullets': self.bullets,
+                'enemy_projectiles': self.enemy_projectiles,
+                'effects': self.effects,
+            },
+            counters=TELEMETRY_COUNTERS + self.collision_fields
         )
-        black_hole_group.add(black_hole_object)
-
-    if player_life <= 0:
-        result = show_game_over(score)
-        if result == 'retry':
-            boss1_spawned = False
-            boss1_health = 150
-            boss2_spawned = False
-            boss2_health = 150
-            boss3_spawned = False
-            boss3_health = 200
-            score = 0
-            player_life = 200
-            bullet_counter = 200
-            player.rect.topleft = initial_player_pos
-            bullets.empty()
-            bullet_refill_group.empty()
-            health_refill_group.empty()
-            double_refill_group.empty()
-            extra_score_group.empty()
-            black_hole_group.empty()
-            meteor_group.empty()
-            meteor2_group.empty()
-            enemy1_group.empty()
-            enemy2_group.empty()
-            boss1_group.empty()
-            boss2_group.empty()
-            boss3_group.empty()
-            explosions.empty()
-            explosions2.empty()
-            boss1_bullets.empty()
-            boss2_bullets.empty()
-            boss3_bullets.empty()
-            enemy2_bullets.empty()
-
-    for black_hole_object in black_hole_group:
-        black_hole_object.update()
-        black_hole_object.draw(screen)
-
-        if black_hole_object.rect.colliderect(player.rect):
-            player_life -= 1
-            black_hole_object.sound_effect.play()
-
-        if score >= 5000:
-            meteor_object.speed = 4
-        if score >= 10000:
-            meteor_object.speed = 4
-        if score >= 15000:
-            meteor_object.speed = 6
-        if score >= 20000:
-            meteor_object.speed = 8
-
-    for bullet_refill in bullet_refill_group:
-
-        bullet_refill.update()
-        bullet_refill.draw(screen)
-
-        if player.rect.colliderect(bullet_refill.rect):
-            if bullet_counter < 200:
-                bullet_counter += 50
-                if bullet_counter > 200:
-                    bullet_counter = 200
-                bullet_refill.kill()
-                bullet_refill.sound_effect.play()
-            else:
-                bullet_refill.kill()
-                bullet_refill.sound_effect.play()
-
-    for health_refill in health_refill_group:
-        health_refill.update()
-        health_refill.draw(screen)
-
-        if player.rect.colliderect(health_refill.rect):
-            if player_life < 200:
-                player_life += 50
-                if player_life > 200:
-                    player_life = 200
-                health_refill.kill()
-                health_refill.sound_effect.play()
-            else:
-                health_refill.kill()
-                health_refill.sound_effect.play()
-
-    for extra_score in extra_score_group:
-        extra_score.update()
-        extra_score.draw(screen)
-
-        if player.rect.colliderect(extra_score.rect):
-            score += 20
-            extra_score.kill()
-            extra_score.sound_effect.play()
-
-        if score >= 3000:
-            extra_score.speed = 2
-        if score >= 10000:
-            extra_score.speed = 4
-        if score >= 15000:
-            extra_score.speed = 6
-        if score >= 20000:
-            extra_score.speed = 8
-
-    for double_refill in double_refill_group:
-        double_refill.update()
-        double_refill.draw(screen)
-
-        if player.rect.colliderect(double_refill.rect):
-            if player_life < 200:
-                player_life += 50
-                if player_life > 200:
-                    player_life = 200
-            if bullet_counter < 200:
-                bullet_counter += 50
-                if bullet_counter > 200:
-                    bullet_counter = 200
-                double_refill.kill()
-                double_refill.sound_effect.play()
-            else:
-                double_refill.kill()
-                double_refill.sound_effect.play()
-
-    for meteor_object in meteor_group:
-        meteor_object.update()
-        meteor_object.draw(screen)
-
-        if meteor_object.rect.colliderect(player.rect):
-            player_life -= 10
-            explosion = Explosion(meteor_object.rect.center, explosion_images)
-            explosions.add(explosion)
-            meteor_object.kill()
-            score += 50
-
-        bullet_collisions = pygame.sprite.spritecollide(meteor_object, bullets, True)
-        for bullet_collision in bullet_collisions:
-            explosion = Explosion(meteor_object.rect.center, explosion_images)
-            explosions.add(explosion)
-            meteor_object.kill()
-            score += 80
-
-            if random.randint(0, 10) == 0:
-                double_refill = DoubleRefill(
-                    meteor_object.rect.centerx,
-                    meteor_object.rect.centery,
-                    double_refill_img,
-                )
-                double_refill_group.add(double_refill)
-
-        if score >= 3000:
-            meteor_object.speed = 4
-        if score >= 10000:
-            meteor_object.speed = 6
-        if score >= 15000:
-            meteor_object.speed = 8
-        if score >= 20000:
-            meteor_object.speed = 10
-
-    for meteor2_object in meteor2_group:
-        meteor2_object.update()
-        meteor2_object.draw(screen)
-
-        if meteor2_object.rect.colliderect(player.rect):
-            player_life -= 10
-            explosion = Explosion(meteor2_object.rect.center, explosion_images)
-            explosions.add(explosion)
-            meteor2_object.kill()
-            score += 20
-
-        bullet_collisions = pygame.sprite.spritecollide(meteor2_object, bullets, True)
-        for bullet_collision in bullet_collisions:
-            explosion = Explosion(meteor2_object.rect.center, explosion_images)
-            explosions.add(explosion)
-            meteor2_object.kill()
-            score += 40
-
-            if random.randint(0, 20) == 0:
-                double_refill = DoubleRefill(
-                    meteor2_object.rect.centerx,
-                    meteor2_object.rect.centery,
-                    double_refill_img,
-                )
-                double_refill_group.add(double_refill)
-
-        if score >= 3000:
-            meteor2_object.speed = 4
-        if score >= 10000:
-            meteor2_object.speed = 6
-        if score >= 15000:
-            meteor2_object.speed = 8
-        if score >= 20000:
-            meteor2_object.speed = 10
-
-    for enemy_object in enemy1_group:
-        enemy_object.update(enemy1_group)
-        enemy1_group.draw(screen)
-
-        if enemy_object.rect.colliderect(player.rect):
-            player_life -= 10
-            explosion = Explosion(enemy_object.rect.center, explosion_images)
-            explosions.add(explosion)
-            enemy_object.kill()
-            score += 20
-
-        bullet_collisions = pygame.sprite.spritecollide(enemy_object, bullets, True)
-        for bullet_collision in bullet_collisions:
-            explosion = Explosion(enemy_object.rect.center, explosion_images)
-            explosions.add(explosion)
-            enemy_object.kill()
-            score += 50
-
-            if random.randint(0, 8) == 0:
-                bullet_refill = BulletRefill(
-                    enemy_object.rect.centerx,
-                    enemy_object.rect.centery,
-                    bullet_refill_img,
-                )
-                bullet_refill_group.add(bullet_refill)
-
-            if random.randint(0, 8) == 0:
-                health_refill = HealthRefill(
-                    random.randint(50, WIDTH - 30),
-                    random.randint(-HEIGHT, -30),
-                    health_refill_img,
-                )
-                health_refill_group.add(health_refill)
-
-    for enemy2_object in enemy2_group:
-        enemy2_object.update(enemy2_group, enemy2_bullets, player)
-        enemy2_group.draw(screen)
-        enemy2_bullets.update()
-        enemy2_bullets.draw(screen)
-
-        if enemy2_object.rect.colliderect(player.rect):
-            player_life -= 40
-            explosion2 = Explosion2(enemy2_object.rect.center, explosion2_images)
-            explosions2.add(explosion2)
-            enemy2_object.kill()
-            score += 20
-
-        bullet_collisions = pygame.sprite.spritecollide(enemy2_object, bullets, True)
-        for bullet_collision in bullet_collisions:
-            explosion2 = Explosion2(enemy2_object.rect.center, explosion2_images)
-            explosions2.add(explosion2)
-            enemy2_object.kill()
-            score += 80
-
-            if random.randint(0, 20) == 0:
-                double_refill = DoubleRefill(
-                    enemy2_object.rect.centerx,
-                    enemy2_object.rect.centery,
-                    double_refill_img,
-                )
-                double_refill_group.add(double_refill)
-
-        for enemy2_bullet in enemy2_bullets:
-            if enemy2_bullet.rect.colliderect(player.rect):
-                player_life -= 10
-                explosion = Explosion(player.rect.center, explosion3_images)
-                explosions.add(explosion)
-                enemy2_bullet.kill()
-
-    for boss1_object in boss1_group:
-        boss1_object.update(boss1_bullets, player)
-        boss1_group.draw(screen)
-        boss1_bullets.update()
-        boss1_bullets.draw(screen)
-
-        if boss1_object.rect.colliderect(player.rect):
-            player_life -= 20
-            explosion = Explosion2(boss1_object.rect.center, explosion2_images)
-            explosions2.add(explosion)
-
-        bullet_collisions = pygame.sprite.spritecollide(boss1_object, bullets, True)
-        for bullet_collision in bullet_collisions:
-            explosion2 = Explosion(boss1_object.rect.center, explosion2_images)
-            explosions2.add(explosion2)
-            boss1_health -= 5
-            if boss1_health <= 0:
-                explosion = Explosion2(boss1_object.rect.center, explosion3_images)
-                explosions.add(explosion)
-                boss1_object.kill()
-                score += 400
-
-                if random.randint(0, 20) == 0:
-                    double_refill = DoubleRefill(
-                        boss1_object.rect.centerx,
-                        boss1_object.rect.centery,
-                        double_refill_img,
-                    )
-                    double_refill_group.add(double_refill)
-
-        for boss1_bullet in boss1_bullets:
-            if boss1_bullet.rect.colliderect(player.rect):
-                player_life -= 20
-                explosion = Explosion(player.rect.center, explosion3_images)
-                explosions.add(explosion)
-                boss1_bullet.kill()
-
-        if boss1_health <= 0:
-            explosion = Explosion2(boss1_object.rect.center, explosion2_images)
-            explosions2.add(explosion)
-            boss1_object.kill()
-
-    if boss1_group:
-        boss1_object = boss1_group.sprites()[0]
-        boss1_health_bar_rect.center = (boss1_object.rect.centerx, boss1_object.rect.top - 5)
-        pygame.draw.rect(screen, (255, 0, 0), boss1_health_bar_rect)
-        pygame.draw.rect(screen, (0, 255, 0), (boss1_health_bar_rect.left, boss1_health_bar_rect.top, boss1_health, boss1_health_bar_rect.height))
-
-    for boss2_object in boss2_group:
-        boss2_object.update(boss2_bullets, player)
-        boss2_group.draw(screen)
-        boss2_bullets.update()
-        boss2_bullets.draw(screen)
-
-        if boss2_object.rect.colliderect(player.rect):
-            player_life -= 2
-            explosion2 = Explosion2(boss2_object.rect.center, explosion2_images)
-            explosions2.add(explosion2)
-
-        bullet_collisions = pygame.sprite.spritecollide(boss2_object, bullets, True)
-        for bullet_collision in bullet_collisions:
-            explosion2 = Explosion2(boss2_object.rect.center, explosion2_images)
-            explosions2.add(explosion2)
-            boss2_health -= 8
-            if boss2_health <= 0:
-                explosion2 = Explosion2(boss2_object.rect.center, explosion3_images)
-                explosions2.add(explosion2)
-                boss2_object.kill()
-                score += 800
-
-                if random.randint(0, 20) == 0:
-                    double_refill = DoubleRefill(
-                        boss2_object.rect.centerx,
-                        boss2_object.rect.centery,
-                        double_refill_img,
-                    )
-                    double_refill_group.add(double_refill)
-
-        for boss2_bullet in boss2_bullets:
-            if boss2_bullet.rect.colliderect(player.rect):
-                player_life -= 20
-                explosion = Explosion(player.rect.center, explosion3_images)
-                explosions.add(explosion)
-                boss2_bullet.kill()
-
-        if boss2_health <= 0:
-            explosion = Explosion2(boss2_object.rect.center, explosion2_images)
-            explosions2.add(explosion)
-            boss2_object.kill()
-
-    if boss2_group:
-        boss2_object = boss2_group.sprites()[0]
-        boss2_health_bar_rect.center = (boss2_object.rect.centerx, boss2_object.rect.top - 5)
-        pygame.draw.rect(screen, (255, 0, 0), boss2_health_bar_rect)
-        pygame.draw.rect(screen, (0, 255, 0), (boss2_health_bar_rect.left, boss2_health_bar_rect.top, boss2_health, boss2_health_bar_rect.height))
-
-    for boss3_object in boss3_group:
-        boss3_object.update(boss3_bullets, player)
-        boss3_group.draw(screen)
-        boss3_bullets.update()
-        boss3_bullets.draw(screen)
-
-        if boss3_object.rect.colliderect(player.rect):
-            player_life -= 1
-            explosion2 = Explosion2(boss3_object.rect.center, explosion2_images)
-            explosions2.add(explosion2)
-
-        bullet_collisions = pygame.sprite.spritecollide(boss3_object, bullets, True)
-        for bullet_collision in bullet_collisions:
-            explosion2 = Explosion2(boss3_object.rect.center, explosion2_images)
-            explosions2.add(explosion2)
-            boss3_health -= 6
-            if boss3_health <= 0:
-                explosion2 = Explosion2(boss3_object.rect.center, explosion3_images)
-                explosions2.add(explosion2)
-                boss3_object.kill()
-                score += 1000
-
-                if random.randint(0, 20) == 0:
-                    double_refill = DoubleRefill(
-                        boss3_object.rect.centerx,
-                        boss3_object.rect.centery,
-                        double_refill_img,
-                    )
-                    double_refill_group.add(double_refill)
-
-        for boss3_bullet in boss3_bullets:
-            if boss3_bullet.rect.colliderect(player.rect):
-                player_life -= 20
-                explosion = Explosion(player.rect.center, explosion3_images)
-                explosions.add(explosion)
-                boss3_bullet.kill()
-
-        if boss3_health <= 0:
-            explosion = Explosion2(boss3_object.rect.center, explosion2_images)
-            explosions2.add(explosion)
-            boss3_object.kill()
-
-    if boss3_group:
-        boss3_object = boss3_group.sprites()[0]
-        boss3_health_bar_rect.center = (
-            boss3_object.rect.centerx,
-            boss3_object.rect.top - 5
-        )
-        pygame.draw.rect(screen, (255, 0, 0), boss3_health_bar_rect)
-        pygame.draw.rect(screen, (0, 255, 0), (
-            boss3_health_bar_rect.left,
-            boss3_health_bar_rect.top,
-            boss3_health,
-            boss3_health_bar_rect.height)
-        )
-
-    player_image_copy = player.image.copy()
-    screen.blit(player_image_copy, player.rect)
 
-    for explosion in explosions:
-        explosion.update()
-        screen.blit(explosion.image, explosion.rect)
 
-    for explosion2 in explosions2:
-        explosion2.update()
-        screen.blit(explosion2.image, explosion2.rect)
+        self.initial_player_pos = (WIDTH // 2, HEIGHT - 100)
 
-    for bullet in bullets:
-        bullet.update()
-        screen.blit(bullet.image, bullet.rect)
+        # Neon UI elements
+        health_icon = pygame.image.load("images/life_bar.png").convert_alpha()
+        ammo_icon = pygame.image.load("images/bullet_bar.png").convert_alpha()
 
-        if bullet.rect.bottom < 0:
-            bullet.kill()
-            bullet_counter -= 1
-
-    # Draw neon UI elements
-    health_bar.draw(screen, player_life, 200)
-    ammo_bar.draw(screen, bullet_counter, 200)
-    score_display.draw(screen, score)
-    hi_score_display.draw(screen, hi_score)
+        self.health_bar = NeonBar(
+            x=10, y=10, width=220, height=22,
+            icon_surface=health_icon,
+            fill_color=(50, 220, 100),
+            glow_color=(100, 255, 150),
+            low_threshold=0.25
+        )
 
-    pygame.display.flip()
+        self.ammo_bar = NeonBar(
+            x=10, y=45, width=220, height=22,
+            icon_surface=ammo_icon,
+            fill_color=(220, 80, 80),
+            glow_color=(255, 120, 120),
+            low_threshold=0.25
+        )
 
-    clock.tick(FPS)
+        self.score_display = CosmicScoreDisplay(WIDTH - 15, 12, self.extra_score_img)
+        self.hi_score_display = CosmicHiScoreDisplay()
+
+        self.pause_scene = PauseScene(manager)
+        self.game_over_scene = GameOverScene(manager, menu_background, self.reset)
+
+        self.joystick = None
+        if pygame.joystick.get_count() > 0:
+            self.joystick = pygame.joystick.Joystick(0)
+            self.joystick.init()
+        self.input = InputActions(self.joystick)
+
+        # Read once at startup; the HUD never touches the database during play
+        self.hi_score = self.leaderboard.best
+        self.player = Player()
+        self.player_group.add(self.player)
+        self.player.rect.topleft = self.initial_player_pos
+        self.score = 0
+        self.player_life = 200
+        self.bullet_counter = 200
+        self.last_shot_time = 0
+        self.run_started = time.time()
+        self.run_frames = 0
+
+        # Retry restores the empty world captured here
+        self.snapshots = SnapshotCodec(self)
+        self.start_state = self.snapshots.capture()
+        self.rewind = RewindBuffer(self.snapshots, REWIND_SECONDS, FPS) if REWIND_SECONDS > 0 else None
+
+    def reset(self):
+        # The RNG keeps running so every retry plays differently
+        self.snapshots.restore(self.start_state, rng=False)
+        self.run_started = time.time()
+        self.render_queue.clear()
+        if self.rewind is not None:
+            self.rewind.clear()
+
+    def rewind_to(self, seconds):
+        """Debug rewind: restore the world from about seconds ago."""
+        if self.rewind is not None and self.rewind.rewind(seconds):
+            self.render_queue.clear()
+
+    @property
+    def score(self):
+        return self._score
+
+    @score.setter
+    def score(self, score):
+        self._score = score
+        self.difficulty.update(score)
+
+    def set_background_speed(self, speed):
+        self.bg_speed = speed
+
+    def set_spawn_rates(self, rates):
+        self.spawn_rates = rates
+
+    def set_speeds(self, speeds):
+        """New sprites spawn at these speeds; live ones change right away."""
+        self.speeds = speeds
+        for name, speed in speeds.items():
+            for sprite in self.lifetimes.groups[name]:
+                sprite.speed = speed
+
+    def set_damage(self, damage):
+        for pair in self.collisions.pairs:
+            pair.damage = damage.get(pair.name, self.base_damage[pair.name])
+
+    def spawn(self, name, sprite, counter):
+        """Adds sprite to a lifetime group at the current difficulty's speed."""
+        if name in self.speeds:
+            sprite.speed = self.speeds[name]
+        if self.lifetimes.add(name, sprite):
+            self.telemetry.count(counter)
+
+    def enter(self):
+        pygame.display.set_caption("Cosmic Heat")
+        music_background()
+        self.input.sync()
+
+    def resume(self):
+        # Keys may have been released while another scene was on top
+        self.input.sync()
+
+    def handle_event(self, event):
+        self.input.handle_event(event)
+
+    def presented(self, present_time):
+        latency = self.input.presented(present_time)
+        if latency is not None:
+            self.telemetry.set('input_latency_us', int(latency * 1000))
+
+    def update(self):
+        self.input.poll()
+        self.step()
+        self.input.end_frame()
+
+    def step(self):
+        """One frame of gameplay: actions, spawning, collisions and world drawing."""
+        self.run_frames += 1
+        life_at_start = self.player_life
+        actions = self.input
+
+        if 'pause' in actions.pressed:
+            self.manager.push(self.pause_scene)
+            return
+
+        # Keyboard and joystick fire share the same SHOOT_DELAY gate
+        if actions.active('fire') and self.bullet_counter > 0:
+            if pygame.time.get_ticks() - self.last_shot_time > SHOOT_DELAY:
+                self.last_shot_time = pygame.time.get_ticks()
+                bullet = Bullet(self.player.rect.centerx, self.player.rect.top)
+                bullet.shoot_sound.play()
+                self.bullets.add(bullet)
+                self.telemetry.count('spawn_bullet')
+                self.bullet_counter -= 1
+        if 'fire' in actions.released:
+            self.player.image = self.player.original_image
+
+        # Movement is applied once per frame from the held actions
+        move_player_with_joystick(actions, self.player)
+        move_player(actions, self.player)
+
+        # Parallax background, faster as the difficulty curve rises
+        self.background.draw(self.bg_speed)
+
+        if self.score > self.hi_score:
+            self.hi_score = self.score
+
+        # Enemies are kept on screen, so spawn points are checked where they will first appear
+        # 1 in rate chance per frame; a rate of None means not at this difficulty
+        rates = self.spawn_rates
+        if rates['enemy1'] and random.randint(0, rates['enemy1']) == 0:
+            enemy_img = random.choice(self.enemy1_img)
+            position = spawn_point(self.enemy1_group, enemy_img.get_size(), (100, WIDTH - 50), (-HEIGHT, -50))
+            if position is None:
+                self.telemetry.count('spawn_refused')
+            else:
+                self.spawn('enemy1', Enemy1(*position, enemy_img), 'spawn_enemy1')
 
-pygame.mixer.music.stop()
-pygame.quit()
-sys.exit()
+        if rates['enemy2'] and random.randint(0, rates['enemy2']) == 0:
+            enemy_img = random.choice(self.enemy2_img)
+            position = spawn_point(self.enemy2_group, enemy_img.get_size(), (200, WIDTH - 100), (-HEIGHT, -100))
+            if position is None:
+                self.telemetry.count('spawn_refused')
+            else:
+                self.spawn('enemy2', Enemy2(*position, enemy_img), 'spawn_enemy2')
+
+        spawned_bosses = self.boss_spawner.update(self.score, self.boss_group)
+        if spawned_bosses:
+            self.telemetry.count('spawn_boss', spawned_bosses)
+
+        if rates['extra_score'] and random.randint(0, rates['extra_score']) == 0:
+            extra_score = ExtraScore(
+                random.randint(50, WIDTH - 50),
+                random.randint(-HEIGHT, -50 - self.extra_score_img.get_rect().height),
+                self.extra_score_img,
+                self.entities,
+            )
+            self.spawn('extra_score', extra_score, 'spawn_extra_score')
+
+        if rates['meteors'] and random.randint(0, rates['meteors']) == 0:
+            meteor_img = random.choice(self.meteor_imgs)
+            meteor_object = Meteors(
+                random.randint(0, 50),
+                random.randint(0, 50),
+                meteor_img,
+            )
+            self.spawn('meteors', meteor_object, 'spawn_meteor')
+
+        if rates['meteors2'] and random.randint(0, rates['meteors2']) == 0:
+            meteor2_img = random.choice(self.meteor2_imgs)
+            meteor2_object = Meteors2(
+                random.randint(100, WIDTH - 50),
+                random.randint(-HEIGHT, -50 - meteor2_img.get_rect().height),
+                meteor2_img,
+            )
+            self.spawn('meteors2', meteor2_object, 'spawn_meteor2')
+
+        if rates['black_holes'] and random.randint(0, rates['black_holes']) == 0:
+            black_hole_img = random.choice(self.black_hole_imgs)
+            black_hole_object = BlackHole(
+                random.randint(100, WIDTH - 50),
+                random.randint(-HEIGHT, -50 - black_hole_img.get_rect().height),
+                black_hole_img,
+            )
+            self.spawn('black_holes', black_hole_object, 'spawn_black_hole')
+
+        self.lifetimes.update()
+
+        if self.player_life <= 0:
+            self.leaderboard.submit(
+                PLAYER_NAME, self.score, self.run_started, time.time() - self.run_started, self.run_frames,
+                render_scale=self.world.scale, quality_tier=self.governor.tier
+            )
+            self.game_over_scene.score = self.score
+            self.manager.push(self.game_over_scene)
+            return
+
+        # World sprites are queued here and submitted per layer in draw()
+        sprites = self.render_queue['world']
+
+        self.black_hole_group.update()
+        sprites.add_sprites(self.black_hole_group)
+
+        self.bullet_refill_group.update()
+        sprites.add_sprites(self.bullet_refill_group)
+        self.health_refill_group.update()
+        sprites.add_sprites(self.health_refill_group)
+
+        movement(self.entities)
+        lifetime(self.entities)
+        sprites.add_sprites(self.extra_score_group)
+
+        self.double_refill_group.update()
+        sprites.add_sprites(self.double_refill_group)
+
+        self.meteor_group.update()
+        sprites.add_sprites(self.meteor_group)
+        self.meteor2_group.update()
+        sprites.add_sprites(self.meteor2_group)
+
+        steer(self.enemy1_group)
+        sprites.add_sprites(self.enemy1_group)
+
+        for enemy2_object in self.enemy2_group:
+            enemy2_object.update(self.enemy_projectiles, self.player)
+        separate(self.enemy2_group)
+        sprites.add_sprites(self.enemy2_group)
+
+        for boss_object in self.boss_group:
+            boss_object.update(self.enemy_projectiles, self.player)
+        sprites.add_sprites(self.boss_group)
+
+        # Everything has moved; sprites are queued before collisions so hits still show this frame
+        self.telemetry.count('collision_tests', self.collisions.resolve())
+        for field, (_, _, _, cost_us) in zip(self.collision_fields, self.collisions.take_costs()):
+            self.telemetry.count(field, cost_us)
+
+        self.enemy_projectiles.update()
+        self.enemy_projectiles.draw(self.render_queue['projectiles'])
+        self.telemetry.count('collision_tests', len(self.enemy_projectiles))
+        projectile_damage, projectile_hits = self.enemy_projectiles.hit_test(self.player)
+        if projectile_hits:
+            self.player_life -= projectile_damage
+            for _ in range(projectile_hits):
+                self.effects.spawn(Explosion, self.player.rect.center, self.explosion3_images, priority=1)
+
+        self.render_queue['player'].blit(self.player.image, self.player.rect)
+
+        self.effects.update()
+        self.render_queue['effects'].add_sprites(self.effects.group)
+        merged, evicted, dropped = self.effects.take_counts()
+        self.telemetry.count('effects_merged', merged)
+        self.telemetry.count('effects_evicted', evicted)
+        self.telemetry.count('effects_dropped', dropped)
+        expired, culled, refused = self.lifetimes.take_counts()
+        self.telemetry.count('lifetime_expired', expired)
+        self.telemetry.count('lifetime_culled', culled)
+        self.telemetry.count('spawn_refused', refused)
+
+        bullet_layer = self.render_queue['bullets']
+        for bullet in self.bullets:
+            bullet.update()
+            bullet_layer.blit(bullet.image, bullet.rect)
+
+            if bullet.rect.bottom < 0:
+                bullet.kill()
+                self.bullet_counter -= 1
+
+        self.react_to_damage(life_at_start - self.player_life)
+        if self.rewind is not None:
+            self.rewind.record()
+
+    def crash(self, pair, hazard, _):
+        """A hazard flew into the player and is destroyed."""
+        self.player_life -= pair.damage
+        self.effects.spawn(pair.effect, hazard.rect.center, pair.images)
+        self.telemetry.count(pair.counter)
+        self.score += pair.score
+
+    def shot_down(self, pair, target, bullets):
+        # Every bullet that landed this frame scores, as it always has
+        for _ in bullets:
+            self.effects.spawn(pair.effect, target.rect.center, pair.images)
+            self.telemetry.count(pair.counter)
+            self.score += pair.score
+            for name, chance in pair.drops:
+                if random.randint(0, chance) == 0:
+                    self.drop(name, target)
+
+    def drain(self, pair, black_hole, _):
+        self.player_life -= pair.damage
+        # Contact lasts many frames; restarting the sound on each one used to take every channel
+        if not black_hole.sound_effect.get_num_channels():
+            black_hole.sound_effect.play()
+
+    def pick_up(self, pair, pickup, _):
+        if pair.life and self.player_life < 200:
+            self.player_life = min(200, self.player_life + pair.life)
+        if pair.ammo and self.bullet_counter < 200:
+            self.bullet_counter = min(200, self.bullet_counter + pair.ammo)
+        self.score += pair.score
+        pickup.sound_effect.play()
+
+    def boss_contact(self, pair, boss_object, _):
+        self.player_life -= boss_object.contact_damage
+        if boss_object.touch():
+            self.effects.spawn(Explosion2, boss_object.rect.center, self.explosion2_images, priority=1)
+
+    def boss_shot(self, pair, boss_object, bullets):
+        for _ in bullets:
+            self.effects.spawn(Explosion2, boss_object.rect.center, self.explosion2_images, priority=1)
+            if boss_object.hit():
+                self.effects.spawn(Explosion2, boss_object.rect.center, self.explosion3_images, priority=2)
+                boss_object.kill()
+                self.telemetry.count('kill_boss')
+                self.manager.camera.shake(500, 10)
+                self.manager.camera.flash((255, 255, 255), 200, 120)
+                self.score += boss_object.reward
+                if random.randint(0, boss_object.drop_chance) == 0:
+                    self.drop('double_refills', boss_object)
+                break
+
+    def drop(self, name, source):
+        """Spawn a refill where source was; health refills fall from the top of the screen."""
+        refill_type, image = self.drops[name]
+        if name == 'health_refills':
+            position = (random.randint(50, WIDTH - 30), 0)
+        else:
+            position = source.rect.center
+        if self.lifetimes.add(name, refill_type(*position, image)):
+            self.telemetry.count('spawn_refill')
+
+    def react_to_damage(self, damage):
+        """Shake and flash on hits; the black hole's steady drain stays below the threshold."""
+        if damage < 10:
+            return
+        camera = self.manager.camera
+        camera.shake(250, min(12, 3 + damage // 8))
+        camera.flash((255, 40, 40), 150, min(120, 30 + damage * 2))
+
+    def draw(self, screen):
+        self.render_queue.flush()
+        submitted, culled = self.render_queue.take_counts()
+        self.telemetry.count('blits_submitted', submitted)
+        self.telemetry.count('draw_culled', culled)
+        self.world.present()
+
+        # HUD draws at full resolution on top of the scaled world
+        for boss_object in self.boss_group:
+            boss_object.draw_health_bar(screen)
+
+        # Draw neon UI elements
+        self.health_bar.draw(screen, self.player_life, 200)
+        self.ammo_bar.draw(screen, self.bullet_counter, 200)
+        self.score_display.draw(screen, self.score)
+        self.hi_score_display.draw(screen, self.hi_score)
+        self.governor.draw_readout(screen)
+        if self.governor.show_readout:
+            self.draw_latency_readout(screen)
+
+    def draw_latency_readout(self, screen):
+        summary = self.input.latency_summary()
+        if summary is None:
+            return
+        text = get_font(14).render(
+            "input to present: median {:.1f} / p95 {:.1f} / max {:.1f} ms".format(*summary),
+            True, (255, 220, 180)
+        )
+        screen.blit(text, (10, screen.get_height() - 58))
+
+
+def apply_quality(settings):
+    Explosion.frame_step = settings['explosion_step']
+    Explosion2.frame_step = settings['explosion_step']
+
+
+def main():
+    pygame.mixer.init()
+    pygame.init()
+    pygame.mixer.set_num_channels(20)
+    for i in range(20):
+        channel = pygame.mixer.Channel(i)
+        channel.set_volume(0.25)
+
+    display = None
+    if RENDERER == 'texture':
+        # Images are still converted against the display format, so a hidden mode is kept around
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        try:
+            display = TextureDisplay((WIDTH, HEIGHT), "Cosmic Heat")
+        except (ImportError, RuntimeError, ValueError) as error:
+            print(f"Texture renderer unavailable ({error}); using the display surface")
+
+    if display is None:
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        world = RenderTarget(screen, RENDER_SCALE)
+    else:
+        screen = display.screen
+        world = TextureTarget(display)
+
+    recorder = FrameRecorder(
+        screen if display is None else display.frame,
+        output_dir=CAPTURE_DIR,
+        slots=CAPTURE_SLOTS,
+        scale=CAPTURE_SCALE,
+        fmt=CAPTURE_FORMAT,
+        fps=FPS
+    )
+
+    if QUALITY == 'auto':
+        governor = QualityGovernor()
+    else:
+        governor = QualityGovernor(adaptive=False, tier=tier_index(QUALITY))
+    governor.subscribe(apply_quality)
+
+    # Installed before the scenes are built, so the Surfaces and Sounds their
+    # constructors make are hooked too
+    if TELEMETRY_PATH or MEMTRACK_PATH:
+        hooks.install()
+    memtrack.install(MEMTRACK_PATH)
+
+    manager = SceneManager(screen, FPS, display)
+    # Shared by the menu and game over screens, which are never on screen together
+    menu_background = ParallaxBackground()
+    leaderboard = Leaderboard(LEADERBOARD_PATH)
+    game = GameScene(manager, world, governor, menu_background, TELEMETRY_PATH, leaderboard)
+    menu = MenuScene(manager, menu_background, lambda: manager.replace(game))
+
+    install_pygame_counters(game.telemetry)
+
+    def debug_keys(event):
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_F9:
+            recorder.toggle()
+        elif event.key == pygame.K_F12:
+            recorder.request_screenshot()
+        elif event.key == pygame.K_F8 and manager.top is game:
+            game.rewind_to(REWIND_STEP)
+        elif event.key == pygame.K_F3:
+            governor.show_readout = not governor.show_readout
+            manager.show_readout = governor.show_readout
+        else:
+            return False
+        return True
+
+    manager.event_filters.append(debug_keys)
+    if display is None:
+        manager.before_flip.append(recorder.capture)
+    else:
+        manager.before_flip.append(lambda screen: recorder.wants_frame and recorder.capture(display.read()))
+    manager.after_present.append(game.presented)
+    manager.after_frame.append(game.telemetry.commit)
+    manager.after_frame.append(governor.update)
+    manager.after_frame.append(lambda frame_ms: memtrack.end_frame())
+
+    manager.push(menu)
+    manager.run()
+
+    recorder.close()
+    game.background.close()
+    leaderboard.close()
+    game.telemetry.close()
+    memtrack.close()
+    pygame.mixer.music.stop()
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Memory instrumentation for Cosmic Heat.
+Counts Surface allocations and their pixel bytes per frame, grouped by the
+line of game code that made them, and takes tracemalloc snapshots at every
+round boundary so growth between rounds shows up as numbers.
+
+Enable with COSMIC_MEMTRACK=<report path>. Everything here is a no-op
+unless install() has been called.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+import hooks
+
+
+_tracker = None
+
+# Wrappers from these modules sit between the game code and pygame
+_INSTRUMENTATION = ('memtrack.py', 'hooks.py')
+
+# Surface methods that hand back a new Surface; subsurface shares pixels
+_SURFACE_METHODS = {'copy': True, 'convert': True, 'convert_alpha': True, 'subsurface': False}
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class MemoryTracker:
+    """Per-call-site Surface accounting plus tracemalloc round snapshots."""
+
+    def __init__(self, report_path, top=15):
+        self.report_path = report_path
+        self.top = top
+        self.frames = 0
+        self.frame_allocations = 0
+        self.frame_bytes = 0
+        self.peak_frame_allocations = 0
+        self.peak_frame_bytes = 0
+        self.sites = {}
+        self.round = 0
+        self.round_started = time.perf_counter()
+        self.round_frames = 0
+        self.round_sites = {}
+        self.snapshot = None
+        self._package_root = os.path.dirname(os.path.abspath(__file__))
+
+    def record(self, frame, nbytes):
+        """Attribute one allocation to the first game-code frame on the stack."""
+        while frame is not None and (
+            not frame.f_code.co_filename.startswith(self._package_root)
+            or os.path.basename(frame.f_code.co_filename) in _INSTRUMENTATION
+        ):
+            frame = frame.f_back
+        if frame is None:
+            site = '<pygame>'
+        else:
+            filename = os.path.relpath(frame.f_code.co_filename, self._package_root)
+            site = f"{filename}:{frame.f_lineno} {frame.f_code.co_name}"
+        for sites in (self.sites, self.round_sites):
+            entry = sites.get(site)
+            if entry is None:
+                sites[site] = [1, nbytes]
+            else:
+                entry[0] += 1
+                entry[1] += nbytes
+        self.frame_allocations += 1
+        self.frame_bytes += nbytes
+
+    def end_frame(self):
+        self.peak_frame_allocations = max(self.peak_frame_allocations, self.frame_allocations)
+        self.peak_frame_bytes = max(self.peak_frame_bytes, self.frame_bytes)
+        self.frame_allocations = 0
+        self.frame_bytes = 0
+        self.frames += 1
+        self.round_frames += 1
+
+    def checkpoint(self, label):
+        """Snapshot the Python heap and report growth since the last checkpoint."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        lines = [
+            f"=== round {self.round} ({label}): {self.round_frames} frames, "
+            f"{time.perf_counter() - self.round_started:.1f}s ===",
+        ]
+        lines.extend(self._site_lines(self.round_sites, max(1, self.round_frames)))
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines.append(f"python heap: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)")
+        if self.snapshot is not None:
+            growth = snapshot.compare_to(self.snapshot, 'lineno')
+            total = sum(stat.size_diff for stat in growth)
+            lines.append(f"heap growth since previous round: {total / 1024:+.1f} KiB")
+            for stat in growth[:self.top]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                lines.append(
+                    f"  {stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+6d} blocks  "
+                    f"{frame.filename}:{frame.lineno}"
+                )
+        self._write(lines)
+
+        self.snapshot = snapshot
+        self.round += 1
+        self.round_frames = 0
+        self.round_sites = {}
+        self.round_started = time.perf_counter()
+
+    def summary(self):
+        lines = [
+            f"=== session: {self.frames} frames, peak {self.peak_frame_allocations} "
+            f"surfaces / {self.peak_frame_bytes / 1024:.1f} KiB in one frame ===",
+        ]
+        lines.extend(self._site_lines(self.sites, max(1, self.frames)))
+        self._write(lines)
+
+    def _site_lines(self, sites, frames):
+        lines = [f"{'surfaces/frame':>15}{'KiB/frame':>12}  call site"]
+        ranked = sorted(sites.items(), key=lambda item: item[1][1], reverse=True)
+        for site, (count, nbytes) in ranked[:self.top]:
+            lines.append(f"{count / frames:>15.2f}{nbytes / frames / 1024:>12.1f}  {site}")
+        return lines
+
+    def _write(self, lines):
+        with open(self.report_path, 'a') as report:
+            report.write('\n'.join(lines) + '\n\n')
+
+
+def install(report_path):
+    """Start tracking. Call before game objects are created."""
+    global _tracker
+    if _tracker is not None or not report_path:
+        return _tracker
+    tracker = MemoryTracker(report_path)
+    tracemalloc.start(1)
+
+    hooks.install()
+    hooks.surface_listeners.append(lambda frame, surface: tracker.record(frame, _surface_bytes(surface)))
+
+    # Methods of the C Surface type cannot be wrapped, so catch them
+    # through the profiler hook and size them from the source surface.
+    def profile(frame, event, arg):
+        if event != 'c_call':
+            return
+        owns_pixels = _SURFACE_METHODS.get(getattr(arg, '__name__', None))
+        if owns_pixels is None:
+            return
+        source = getattr(arg, '__self__', None)
+        if isinstance(source, pygame.surface.Surface):
+            tracker.record(frame, _surface_bytes(source) if owns_pixels else 0)
+
+    sys.setprofile(profile)
+    _tracker = tracker
+    return tracker
+
+
+def end_frame():
+    if _tracker is not None:
+        _tracker.end_frame()
+
+
+def checkpoint(label):
+    if _tracker is not None:
+        _tracker.checkpoint(label)
+
+
+def close():
+    global _tracker
+    if _tracker is not None:
+        sys.setprofile(None)
+        _tracker.summary()
+        _tracker = None
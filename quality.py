@@ -0,0 +1,129 @@
+"""
+Adaptive visual quality for Cosmic Heat.
+The governor watches recent frame work times and steps through quality
+tiers: down when frames run over budget, back up once there is headroom.
+UI components read the active tier from `settings`.
+"""
+
+from classes.constants import FPS
+from fonts import get_font
+
+
+QUALITY_TIERS = [
+    {
+        'name': 'high',
+        'text_glow': 3,
+        'button_glow': 5,
+        'bar_glow': 3,
+        'nebula': True,
+        'star_layers': 3,
+        'explosion_step': 1,
+    },
+    {
+        'name': 'medium',
+        'text_glow': 2,
+        'button_glow': 3,
+        'bar_glow': 2,
+        'nebula': True,
+        'star_layers': 3,
+        'explosion_step': 1,
+    },
+    {
+        'name': 'low',
+        'text_glow': 1,
+        'button_glow': 1,
+        'bar_glow': 1,
+        'nebula': False,
+        'star_layers': 2,
+        'explosion_step': 2,
+    },
+    {
+        'name': 'minimal',
+        'text_glow': 0,
+        'button_glow': 0,
+        'bar_glow': 0,
+        'nebula': False,
+        'star_layers': 1,
+        'explosion_step': 2,
+    },
+]
+
+# Every tier sets the same keys, so a tier change can overwrite them in place
+assert all(tier.keys() == QUALITY_TIERS[0].keys() for tier in QUALITY_TIERS)
+
+# The active tier; updated in place so importers always see the current one
+settings = dict(QUALITY_TIERS[0])
+
+
+def tier_index(name):
+    for index, tier in enumerate(QUALITY_TIERS):
+        if tier['name'] == name:
+            return index
+    raise ValueError(f"Unknown quality tier: {name}")
+
+
+class QualityGovernor:
+    """Steps quality tiers from a rolling window of frame work times."""
+
+    def __init__(self, budget_ms=1000 / FPS, window=60, downgrade_at=0.9,
+                 upgrade_at=0.55, cooldown=180, adaptive=True, tier=0):
+        self.budget_ms = budget_ms
+        self.window = window
+        self.downgrade_at = downgrade_at
+        self.upgrade_at = upgrade_at
+        self.cooldown = cooldown
+        self.adaptive = adaptive
+        self.samples = [0.0] * window
+        self.sample_index = 0
+        self.frames_since_change = 0
+        self.tier = tier
+        self.last_p90 = 0.0
+        self.subscribers = []
+        self.show_readout = False
+        self._apply()
+
+    def subscribe(self, callback):
+        """callback(settings) runs now and on every tier change."""
+        self.subscribers.append(callback)
+        callback(settings)
+
+    def update(self, frame_ms):
+        """Feed one frame's work time (excluding the tick sleep)."""
+        self.samples[self.sample_index] = frame_ms
+        self.sample_index += 1
+        self.frames_since_change += 1
+        if self.sample_index < self.window:
+            return
+        self.sample_index = 0
+
+        ordered = sorted(self.samples)
+        self.last_p90 = ordered[int(self.window * 0.9)]
+        if not self.adaptive or self.frames_since_change < self.cooldown:
+            return
+        if self.last_p90 > self.budget_ms * self.downgrade_at and self.tier < len(QUALITY_TIERS) - 1:
+            self.set_tier(self.tier + 1)
+        elif self.last_p90 < self.budget_ms * self.upgrade_at and self.tier > 0:
+            self.set_tier(self.tier - 1)
+
+    def set_tier(self, tier):
+        self.tier = tier
+        self.frames_since_change = 0
+        self._apply()
+
+    def _apply(self):
+        # Never cleared: the background worker may be reading it, and
+        # overwriting existing keys keeps every lookup valid
+        settings.update(QUALITY_TIERS[self.tier])
+        for callback in self.subscribers:
+            callback(settings)
+
+    def draw_readout(self, screen):
+        """Debug overlay with the active tier and recent p90 work time."""
+        if not self.show_readout:
+            return
+        mode = 'auto' if self.adaptive else 'fixed'
+        text = get_font(14).render(
+            f"quality: {settings['name']} ({mode})  p90 {self.last_p90:.1f} ms",
+            True, (180, 255, 180)
+        )
+        screen.blit(text, (10, screen.get_height() - 22))
@@ -0,0 +1,230 @@
+"""
+Non-blocking gameplay recorder for Cosmic Heat.
+Presented frames are copied into a ring of surfaces, allocated when the
+first recording starts, and written out by a background worker, so
+capturing never stalls the game loop.
+
+Raw recordings are a single `frames.raw` file of packed RGB frames; the
+accompanying `frames.txt` holds the ffmpeg arguments needed to encode it:
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r 60 -i frames.raw out.mp4
+"""
+
+import os
+import queue
+import threading
+import time
+
+import pygame
+
+
+_STOP = object()
+
+
+class FrameRecorder:
+    """Ring-buffered frame capture with a background writer thread."""
+
+    def __init__(self, screen, output_dir='captures', slots=32, scale=1.0, fmt='png', fps=60):
+        if fmt not in ('png', 'raw'):
+            raise ValueError(f"Unknown capture format: {fmt}")
+        self.screen = screen
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.fps = fps
+        width, height = screen.get_size()
+        self.frame_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        self.scaled = self.frame_size != (width, height)
+
+        # Surfaces are allocated on first use and then reused, so a game that
+        # never records or takes a screenshot never pays for them
+        self.slot_count = slots
+        self.slots = []
+        self.screenshot_surface = None
+        self.free_slots = queue.SimpleQueue()
+        # Joinable, so start() can wait for the previous session to finish
+        self.pending = queue.Queue()
+
+        self.recording = False
+        self.session_dir = None
+        self.frame_index = 0
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.screenshot_requested = False
+        self.screenshot_busy = False
+        self.error = None
+        self._failed = False
+        self._raw_file = None
+        self._session_dir = None
+        self._screenshot_count = 0
+
+        self._worker = threading.Thread(target=self._run, name='frame-recorder', daemon=True)
+        self._worker.start()
+
+    def start(self):
+        """Begin a new recording session in its own timestamped directory."""
+        if self.recording:
+            return
+        if not self.slots:
+            self.slots = [pygame.Surface(self.frame_size, 0, self.screen) for _ in range(self.slot_count)]
+            for index in range(self.slot_count):
+                self.free_slots.put(index)
+        # The counters belong to the previous session until its frames are written
+        self.pending.join()
+        self.session_dir = os.path.join(self.output_dir, time.strftime('session_%Y%m%d_%H%M%S'))
+        os.makedirs(self.session_dir, exist_ok=True)
+        self.error = None
+        self.frame_index = 0
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.pending.put(('begin', self.session_dir, None))
+        self.recording = True
+
+    def stop(self):
+        """End the current session; queued frames are still written out."""
+        if not self.recording:
+            return
+        self.recording = False
+        self.pending.put(('end', None, None))
+
+    def toggle(self):
+        if self.recording:
+            self.stop()
+        else:
+            self.start()
+
+    def request_screenshot(self):
+        """Save the next presented frame at full resolution."""
+        self.screenshot_requested = True
+
+    @property
+    def wants_frame(self):
+        """True when the next capture() would use the frame."""
+        return self.recording or (self.screenshot_requested and not self.screenshot_busy)
+
+    def capture(self, screen):
+        """Copy the frame about to be presented. Call once per frame, before flip."""
+        if self.screenshot_requested and not self.screenshot_busy:
+            self.screenshot_requested = False
+            self.screenshot_busy = True
+            if self.screenshot_surface is None:
+                self.screenshot_surface = pygame.Surface(screen.get_size(), 0, screen)
+            self.screenshot_surface.blit(screen, (0, 0))
+            self.pending.put(('screenshot', None, None))
+
+        if not self.recording:
+            return
+
+        try:
+            index = self.free_slots.get_nowait()
+        except queue.Empty:
+            # Writer cannot keep up; drop rather than stall the frame
+            self.frames_dropped += 1
+            self.frame_index += 1
+            return
+
+        slot = self.slots[index]
+        if self.scaled:
+            pygame.transform.scale(screen, self.frame_size, slot)
+        else:
+            slot.blit(screen, (0, 0))
+        self.pending.put(('frame', index, self.frame_index))
+        self.frame_index += 1
+        self.frames_captured += 1
+
+    def stats(self):
+        return {
+            'recording': self.recording,
+            'captured': self.frames_captured,
+            'written': self.frames_written,
+            'dropped': self.frames_dropped,
+            'error': self.error,
+        }
+
+    def close(self):
+        """Flush everything queued and stop the worker thread."""
+        self.stop()
+        self.pending.put((_STOP, None, None))
+        self._worker.join()
+        if self.frames_captured or self.frames_dropped:
+            print(
+                f"Recorder: {self.frames_written} frames written, "
+                f"{self.frames_dropped} dropped"
+            )
+
+    def _run(self):
+        while True:
+            kind, arg, frame_number = self.pending.get()
+            try:
+                if kind is _STOP:
+                    self._close_raw()
+                    return
+                if kind == 'begin':
+                    self._failed = False
+                    self._open_session(arg)
+                elif kind == 'end':
+                    self._close_raw()
+                elif kind == 'frame':
+                    self._write_frame(arg, frame_number)
+                elif kind == 'screenshot':
+                    self._write_screenshot()
+            except Exception as error:
+                self._fail(kind, error)
+            finally:
+                self.pending.task_done()
+
+    def _fail(self, kind, error):
+        """Report a write error; any but a screenshot's also stops recording."""
+        self.error = f"{kind}: {error}"
+        if kind == 'screenshot':
+            print(f"Recorder: screenshot failed ({error})")
+            return
+        self._failed = True
+        self.recording = False
+        try:
+            self._close_raw()
+        except OSError:
+            # The error being reported is the one that matters
+            pass
+        print(f"Recorder: {kind} failed ({error}); recording stopped")
+
+    def _open_session(self, session_dir):
+        self._close_raw()
+        if self.fmt == 'raw':
+            width, height = self.frame_size
+            with open(os.path.join(session_dir, 'frames.txt'), 'w') as header:
+                header.write(
+                    f"-f rawvideo -pix_fmt rgb24 -s {width}x{height} -r {self.fps}\n"
+                )
+            self._raw_file = open(os.path.join(session_dir, 'frames.raw'), 'wb')
+        self._session_dir = session_dir
+
+    def _close_raw(self):
+        if self._raw_file is not None:
+            raw_file, self._raw_file = self._raw_file, None
+            raw_file.close()
+
+    def _write_frame(self, index, frame_number):
+        slot = self.slots[index]
+        try:
+            if self._failed:
+                # Queued behind the write that failed, for a session that has stopped
+                return
+            if self.fmt == 'raw':
+                self._raw_file.write(pygame.image.tobytes(slot, 'RGB'))
+            else:
+                path = os.path.join(self._session_dir, f'frame_{frame_number:06d}.png')
+                pygame.image.save(slot, path)
+            self.frames_written += 1
+        finally:
+            self.free_slots.put(index)
+
+    def _write_screenshot(self):
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            stamp = time.strftime('%Y%m%d_%H%M%S')
+            self._screenshot_count += 1
+            path = os.path.join(self.output_dir, f'screenshot_{stamp}_{self._screenshot_count}.png')
+            pygame.image.save(self.screenshot_surface, path)
+        finally:
+            self.screenshot_busy = False
@@ -0,0 +1,269 @@
+"""
+Internal render resolution for Cosmic Heat.
+The world is drawn into a RenderTarget at RENDER_SCALE of the window size
+and scaled up once per frame; simulation coordinates stay in WIDTH x HEIGHT.
+Sprites are queued per layer in a RenderQueue and submitted in batches.
+TextureDisplay and TextureTarget are an optional backend that draws the
+world as texture copies through pygame._sdl2.video.
+"""
+
+import math
+import weakref
+
+import pygame
+
+from classes.counters import Deltas
+
+
+class RenderTarget:
+    """
+    Drop-in for the display surface's fill/blit/blits that draws at a
+    reduced internal resolution. Source images are scaled once and cached,
+    so only images that live across frames should be blitted here; HUD and
+    per-frame surfaces go straight to the display after present().
+    """
+
+    def __init__(self, display, scale=1.0, surface=None):
+        self.display = display
+        self.scale = scale
+        self._scaled = weakref.WeakKeyDictionary()
+        if surface is not None:
+            # An offscreen target already at the internal resolution
+            self.surface = surface
+        elif scale == 1:
+            self.surface = display
+        else:
+            self.surface = pygame.Surface(self.internal_size(display.get_size(), scale)).convert()
+        if scale == 1:
+            # Full resolution draws straight to the surface with no overhead
+            self.fill = self.surface.fill
+            self.blit = self.surface.blit
+            self.blits = self.surface.blits
+
+    @staticmethod
+    def internal_size(size, scale):
+        width, height = size
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def offscreen(self):
+        """A target with the same scale and logical size that draws into a surface of its own."""
+        return RenderTarget(self.display, self.scale, pygame.Surface(self.surface.get_size()).convert())
+
+    def get_size(self):
+        return self.display.get_size()
+
+    def fill(self, color, rect=None):
+        if rect is not None:
+            rect = self._rect(pygame.Rect(rect))
+        return self.surface.fill(color, rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is not None:
+            area = self._rect(pygame.Rect(area))
+        return self.surface.blit(self.scaled(source), self._point(dest), area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=True):
+        scaled = self.scaled
+        point = self._point
+        sequence = []
+        for source, dest, *rest in blit_sequence:
+            if rest and rest[0] is not None:
+                rest[0] = self._rect(pygame.Rect(rest[0]))
+            sequence.append((scaled(source), point(dest), *rest))
+        return self.surface.blits(sequence, doreturn)
+
+    def scaled(self, image):
+        """image at the internal resolution, built on first use."""
+        surface = self._scaled.get(image)
+        if surface is None:
+            width, height = image.get_size()
+            surface = pygame.transform.scale(image, (
+                max(1, round(width * self.scale)), max(1, round(height * self.scale))
+            ))
+            self._scaled[image] = surface
+        return surface
+
+    def present(self):
+        """Scale the internal surface onto the display in one step."""
+        if self.surface is self.display:
+            return
+        pygame.transform.scale(self.surface, self.display.get_size(), self.display)
+
+    def _point(self, dest):
+        scale = self.scale
+        # Flooring keeps tiled layers (parallax wrap) seamless
+        return math.floor(dest[0] * scale), math.floor(dest[1] * scale)
+
+    def _rect(self, rect):
+        scale = self.scale
+        left, top = math.floor(rect.x * scale), math.floor(rect.y * scale)
+        return pygame.Rect(
+            left, top,
+            math.floor(rect.right * scale) - left, math.floor(rect.bottom * scale) - top
+        )
+
+
+class RenderLayer:
+    """
+    One layer of a RenderQueue. It takes blit/blits calls like a Surface, so
+    code that draws to a surface can draw into a layer instead. Layers that
+    cull need every destination to be a Rect.
+    """
+
+    def __init__(self, cull=True):
+        self.cull = cull
+        self.items = []
+
+    def blit(self, source, dest):
+        self.items.append((source, dest))
+
+    def blits(self, blit_sequence, doreturn=False):
+        self.items.extend(blit_sequence)
+
+    def add_sprites(self, sprites):
+        self.items.extend((sprite.image, sprite.rect) for sprite in sprites)
+
+
+class RenderQueue:
+    """
+    Collects the frame's (surface, position) pairs per layer and submits each
+    layer to the target with a single blits() call, in layer order. Culling
+    layers drop every entry outside the screen with one collidelistall().
+    """
+
+    def __init__(self, target, layers):
+        self.target = target
+        self.bounds = pygame.Rect((0, 0), target.get_size())
+        self.layers = {name: RenderLayer(cull) for name, cull in layers}
+        self.submitted = 0
+        self.culled = 0
+        self._deltas = Deltas()
+
+    def __getitem__(self, name):
+        return self.layers[name]
+
+    def flush(self):
+        for layer in self.layers.values():
+            items = layer.items
+            if not items:
+                continue
+            if layer.cull:
+                visible = self.bounds.collidelistall([dest for _, dest in items])
+                self.culled += len(items) - len(visible)
+                items = [items[index] for index in visible]
+            if items:
+                self.target.blits(items, False)
+                self.submitted += len(items)
+            layer.items.clear()
+
+    def clear(self):
+        for layer in self.layers.values():
+            layer.items.clear()
+
+    def take_counts(self):
+        """(submitted, culled) since the previous call."""
+        return self._deltas.take((self.submitted, self.culled))
+
+
+class TextureDisplay:
+    """
+    Presents frames through pygame._sdl2.video instead of the display
+    surface. The world is drawn into a target texture by TextureTarget;
+    scenes keep drawing menus and the HUD onto `screen`, an alpha Surface
+    uploaded once per frame and drawn over the world. A display mode must
+    already be set (it can be hidden) so images can still be converted.
+    """
+
+    def __init__(self, size, title, driver=None):
+        from pygame._sdl2 import video
+
+        index = -1
+        if driver is not None:
+            index = [info.name for info in video.get_drivers()].index(driver)
+        self.window = video.Window(title, size)
+        self.renderer = video.Renderer(self.window, index=index)
+        self.world = video.Texture(self.renderer, size, target=True)
+        self.overlay = video.Texture(self.renderer, size, streaming=True)
+        # Alpha-blend the UI over the world
+        self.overlay.blend_mode = pygame.BLENDMODE_BLEND
+        self.screen = pygame.Surface(size, pygame.SRCALPHA)
+        self.frame = pygame.Surface(size)
+        self.size = size
+        self.world_drawn = False
+        self.renderer.target = self.world
+        self._texture_type = video.Texture
+
+    def present(self, offset=(0, 0)):
+        """Composite the world at offset and the UI over it, then show the frame."""
+        renderer = self.renderer
+        renderer.target = None
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+        if self.world_drawn:
+            self.world.draw(dstrect=(offset[0], offset[1], *self.size))
+        self.overlay.update(self.screen)
+        self.overlay.draw()
+        renderer.present()
+        renderer.target = self.world
+        self.world_drawn = False
+
+    def begin(self):
+        """Start a frame with nothing on `screen`. The last frame stays readable until then."""
+        self.screen.fill((0, 0, 0, 0))
+
+    def read(self, dest=None):
+        """
+        The world plus whatever is on `screen`, as a Surface. This reads the
+        GPU back, so it is meant for pause snapshots and captures only.
+        """
+        dest = dest if dest is not None else self.frame
+        self.renderer.to_surface(dest)
+        dest.blit(self.screen, (0, 0))
+        return dest
+
+
+class TextureTarget:
+    """
+    RenderTarget counterpart for TextureDisplay. Every image is uploaded
+    once as a texture and drawn with a renderer copy, so, as with
+    RenderTarget, only images that live across frames belong here.
+    """
+
+    def __init__(self, display):
+        self.display = display
+        self.renderer = display.renderer
+        self.scale = 1.0
+        self._textures = weakref.WeakKeyDictionary()
+
+    def get_size(self):
+        return self.display.size
+
+    def texture(self, image):
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = self.display._texture_type.from_surface(self.renderer, image)
+            self._textures[image] = texture
+        return texture
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = (*color[:3], 255)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(pygame.Rect(rect))
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is None:
+            width, height = source.get_size()
+        else:
+            area = pygame.Rect(area)
+            width, height = area.size
+        self.texture(source).draw(srcrect=area, dstrect=(dest[0], dest[1], width, height))
+
+    def blits(self, blit_sequence, doreturn=True):
+        for source, dest, *rest in blit_sequence:
+            self.blit(source, dest, *rest)
+
+    def present(self):
+        """The world texture is complete; TextureDisplay composites it."""
+        self.display.world_drawn = True
@@ -0,0 +1,176 @@
+"""
+Scene stack for Cosmic Heat.
+One main loop drives whichever scene is on top of the stack. Scenes are
+built once at startup and kept warm, so pushing or popping one only runs
+its enter/exit hooks.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+from camera import Camera
+from fonts import get_font
+
+
+# Transitions kept for the readout and transition_summary()
+TRANSITION_HISTORY = 256
+
+
+class Scene:
+    """Base class; every hook is optional."""
+
+    def enter(self):
+        """Called when the scene becomes active by push or replace."""
+
+    def exit(self):
+        """Called when the scene leaves the stack."""
+
+    def resume(self):
+        """Called when a scene above this one is popped."""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        pass
+
+
+class SceneManager:
+    """
+    Owns the display loop and the camera whose post effects are applied to
+    every finished frame. event_filters see every event first and return
+    True to consume it; before_flip hooks receive the finished screen,
+    after_present hooks the perf_counter time the frame was presented and
+    after_frame hooks the frame's work time in ms. With a TextureDisplay,
+    frames are presented through it instead of pygame.display.flip.
+    """
+
+    def __init__(self, screen, fps, display=None):
+        self.screen = screen
+        self.fps = fps
+        self.display = display
+        self.clock = pygame.time.Clock()
+        self.camera = Camera(screen.get_size())
+        self.stack = []
+        self.running = False
+        self.event_filters = []
+        self.before_flip = []
+        self.after_present = []
+        self.after_frame = []
+        # [label, switch ms, ms until the new scene's first frame was presented]
+        # for the most recent transitions only, so a long session stays bounded
+        self.transitions = deque(maxlen=TRANSITION_HISTORY)
+        self._pending = []
+        self.show_readout = False
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        self._transition(f"push {type(scene).__name__}", self._push, scene)
+
+    def pop(self):
+        self._transition(f"pop {type(self.top).__name__}", self._pop)
+
+    def replace(self, scene):
+        self._transition(f"replace {type(scene).__name__}", self._replace, scene)
+
+    def quit(self):
+        self.running = False
+
+    def _push(self, scene):
+        self.stack.append(scene)
+        scene.enter()
+
+    def _pop(self):
+        self.stack.pop().exit()
+        if self.stack:
+            self.stack[-1].resume()
+
+    def _replace(self, scene):
+        if self.stack:
+            self.stack.pop().exit()
+        self._push(scene)
+
+    def _transition(self, label, action, *args):
+        start = time.perf_counter()
+        action(*args)
+        transition = [label, (time.perf_counter() - start) * 1000, None]
+        self.transitions.append(transition)
+        self._pending.append((transition, start))
+
+    def run(self):
+        self.running = True
+        while self.running and self.stack:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                elif not any(handler(event) for handler in self.event_filters) and self.stack:
+                    self.stack[-1].handle_event(event)
+            if not self.running or not self.stack:
+                break
+
+            self.stack[-1].update()
+            if self.display is not None:
+                self.display.begin()
+            if self.stack:
+                self.stack[-1].draw(self.screen)
+            self.camera.apply(self.screen)
+            self.draw_readout(self.screen)
+            for hook in self.before_flip:
+                hook(self.screen)
+            if self.display is None:
+                pygame.display.flip()
+            else:
+                self.display.present(self.camera.offset)
+            presented = time.perf_counter()
+            if self._pending:
+                for transition, start in self._pending:
+                    transition[2] = (presented - start) * 1000
+                self._pending.clear()
+            for hook in self.after_present:
+                hook(presented)
+
+            self.clock.tick(self.fps)
+            frame_ms = self.clock.get_rawtime()
+            for hook in self.after_frame:
+                hook(frame_ms)
+
+    def read_frame(self, dest):
+        """Copy the last finished frame into dest."""
+        if self.display is None:
+            dest.blit(self.screen, (0, 0))
+        else:
+            self.display.read(dest)
+
+    def draw_readout(self, screen):
+        """Debug overlay with the most recent scene transition."""
+        if not self.show_readout or not self.transitions:
+            return
+        label, switch_ms, present_ms = self.transitions[-1]
+        presented = f"{present_ms:.1f} ms" if present_ms is not None else "-"
+        text = get_font(14).render(
+            f"{label}: switch {switch_ms:.2f} ms, presented after {presented}",
+            True, (180, 220, 255)
+        )
+        screen.blit(text, (10, screen.get_height() - 40))
+
+    def transition_summary(self):
+        """
+        {label: (count, mean switch ms, max switch ms, max present ms)} over
+        the last TRANSITION_HISTORY transitions.
+        """
+        summary = {}
+        for label, switch_ms, present_ms in self.transitions:
+            count, total, worst, worst_present = summary.get(label, (0, 0.0, 0.0, 0.0))
+            summary[label] = (count + 1, total + switch_ms, max(worst, switch_ms), max(worst_present, present_ms or 0))
+        return {
+            label: (count, total / count, worst, worst_present)
+            for label, (count, total, worst, worst_present) in summary.items()
+        }
@@ -0,0 +1,329 @@
+"""
+World snapshots for Cosmic Heat.
+A snapshot packs the whole game world into one bytes object: the run's
+scalars, one fixed-layout struct record per sprite, the projectile
+field's arrays and the RNG state. Images are stored as indexes into the
+game's image lists and tick-based timers relative to the capture time, so
+a snapshot can be restored later, in another process, or after a retry.
+RewindBuffer keeps the last few seconds of snapshots in a ring.
+"""
+
+import random
+import struct
+import time
+from array import array
+
+import numpy as np
+import pygame
+
+from classes.bosses import Boss
+from classes.bullets import Bullet
+from classes.collision import rotated
+from classes.enemies import Enemy1, Enemy2
+from classes.explosions import Explosion, Explosion2
+from classes.meteors import Meteors, Meteors2, BlackHole
+from classes.refill import BulletRefill, HealthRefill, DoubleRefill, ExtraScore
+
+MAGIC = b'CHWS'
+VERSION = 1
+
+PLAYER_DIRECTIONS = ('down', 'up', 'left', 'right', 'up_left', 'up_right', 'down_left', 'down_right')
+EFFECT_TYPES = (Explosion, Explosion2)
+
+_HEADER = struct.Struct('<4sH')
+_COUNT = struct.Struct('<I')
+# score, life, ammo, last shot (ms before capture), run frames, run seconds,
+# player x, y, direction, flipped, next boss, lifetime frame
+_GAME = struct.Struct('<iiiiIdiiBBBI')
+# Every sprite: rect, then born and seen frames (-1 for none)
+_ENEMY1 = struct.Struct('<iiiiiiHddd')
+_ENEMY2 = struct.Struct('<iiiiiiHdddii')
+_ROCK = struct.Struct('<iiiiiiHiddd')
+_REFILL = struct.Struct('<iiiiiiddd')
+_EXTRA = struct.Struct('<iiiiiidd')
+_BULLET = struct.Struct('<iiiii')
+_BOSS = struct.Struct('<iiiiBiBiiiiddd')
+_EFFECT = struct.Struct('<BBiiiiBbi')
+_RNG = struct.Struct('<iBd')
+
+# Groups whose sprites are rebuilt from one record layout each
+_ROCKS = (('meteor_group', Meteors), ('meteor2_group', Meteors2), ('black_hole_group', BlackHole))
+_REFILLS = (
+    ('bullet_refill_group', BulletRefill, 'bullet_refill_img'),
+    ('health_refill_group', HealthRefill, 'health_refill_img'),
+    ('double_refill_group', DoubleRefill, 'double_refill_img'),
+)
+_PROJECTILE_ARRAYS = ('pos', 'vel', 'kind', 'frame', 'age')
+
+
+def _seen(sprite):
+    seen = sprite.seen
+    return -1 if seen is None else seen
+
+
+def _rect(sprite, x, y, width, height, born=None, seen=None):
+    sprite.rect = pygame.Rect(x, y, width, height)
+    if born is not None:
+        sprite.born = born
+        sprite.seen = None if seen < 0 else seen
+
+
+class SnapshotCodec:
+    """
+    Captures and restores one GameScene's world. Restoring rebuilds every
+    sprite through its constructor and then overwrites its state, so the
+    RNG state is put back last.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.images = [
+            *game.enemy1_img, *game.enemy2_img, *game.meteor_imgs, *game.meteor2_imgs,
+            *game.black_hole_imgs, game.extra_score_img,
+        ]
+        self.image_ids = {image: index for index, image in enumerate(self.images)}
+        self.effect_images = [game.explosion_images, game.explosion2_images, game.explosion3_images]
+        self.bosses = game.boss_spawner.definitions
+
+    def capture(self, now=None):
+        """The world as bytes. now is the pygame tick count timers are stored against."""
+        game = self.game
+        now = pygame.time.get_ticks() if now is None else now
+        image_ids = self.image_ids
+        player = game.player
+        parts = [
+            _HEADER.pack(MAGIC, VERSION),
+            _GAME.pack(
+                game.score, game.player_life, game.bullet_counter, game.last_shot_time - now,
+                game.run_frames, time.time() - game.run_started,
+                player.rect.x, player.rect.y, PLAYER_DIRECTIONS.index(player.direction),
+                player.image is player.flipped_image, game.boss_spawner.next_index, game.lifetimes.frame,
+            ),
+        ]
+
+        def section(group, pack):
+            parts.append(_COUNT.pack(len(group)))
+            parts.extend(pack(sprite) for sprite in group)
+
+        section(game.enemy1_group, lambda sprite: _ENEMY1.pack(
+            *sprite.rect, sprite.born, _seen(sprite), image_ids[sprite.image], sprite.speed, *sprite.direction
+        ))
+        section(game.enemy2_group, lambda sprite: _ENEMY2.pack(
+            *sprite.rect, sprite.born, _seen(sprite), image_ids[sprite.image], sprite.speed, *sprite.direction,
+            sprite.shoot_timer, sprite.shots_fired
+        ))
+        for attribute, _ in _ROCKS:
+            section(getattr(game, attribute), lambda sprite: _ROCK.pack(
+                *sprite.rect, sprite.born, _seen(sprite), image_ids[sprite.original_image], sprite.angle,
+                sprite.speed, sprite.direction_x, sprite.direction_y
+            ))
+        for attribute, _, _ in _REFILLS:
+            section(getattr(game, attribute), lambda sprite: _REFILL.pack(
+                *sprite.rect, sprite.born, _seen(sprite), sprite.speed, sprite.direction_x, sprite.direction_y
+            ))
+        section(game.extra_score_group, lambda sprite: _EXTRA.pack(
+            *sprite.rect, sprite.born, _seen(sprite), sprite.speed, sprite.direction_y
+        ))
+        section(game.bullets, lambda sprite: _BULLET.pack(*sprite.rect, sprite.speed))
+        section(game.boss_group, lambda boss: _BOSS.pack(
+            *boss.rect, self.bosses.index(boss.definition), boss.health, boss.phase_index, boss.shots_fired,
+            boss.shoot_timer, boss.teleport_timer, boss.contact_timer, boss.spiral_angle, *boss.direction
+        ))
+        effect_images = self.effect_images
+        section(game.effects.group, lambda effect: _EFFECT.pack(
+            EFFECT_TYPES.index(type(effect)), effect_images.index(effect.images), effect.frame,
+            *effect.rect.center, effect.last_update - now, effect.sound_played, effect.priority,
+            effect.spawned - now
+        ))
+
+        field = game.enemy_projectiles
+        count = field.count
+        parts.append(_COUNT.pack(count))
+        parts.extend(getattr(field, name)[:count].tobytes() for name in _PROJECTILE_ARRAYS)
+
+        version, state, gauss = random.getstate()
+        parts.append(_RNG.pack(version, gauss is not None, gauss or 0.0))
+        parts.append(array('I', state).tobytes())
+        return b''.join(parts)
+
+    def restore(self, data, now=None, rng=True):
+        """
+        Replace the world with a captured one. With rng=False the random
+        module keeps its current state, so a retry does not replay the
+        previous run's spawns.
+        """
+        game = self.game
+        now = pygame.time.get_ticks() if now is None else now
+        view = memoryview(data)
+        magic, version = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} world snapshot")
+        offset = _HEADER.size
+
+        (
+            game.score, game.player_life, game.bullet_counter, last_shot, game.run_frames, seconds,
+            x, y, direction, flipped, game.boss_spawner.next_index, game.lifetimes.frame,
+        ) = _GAME.unpack_from(view, offset)
+        offset += _GAME.size
+        game.last_shot_time = now + last_shot
+        game.run_started = time.time() - seconds
+        player = game.player
+        player.rect.topleft = (x, y)
+        player.direction = PLAYER_DIRECTIONS[direction]
+        player.image = player.flipped_image if flipped else player.original_image
+
+        def section(group, layout, build):
+            nonlocal offset
+            (count,) = _COUNT.unpack_from(view, offset)
+            offset += _COUNT.size
+            group.empty()
+            for values in layout.iter_unpack(view[offset:offset + count * layout.size]):
+                group.add(build(values))
+            offset += count * layout.size
+
+        images = self.images
+
+        def enemy1(values):
+            sprite = Enemy1(0, 0, images[values[6]])
+            _rect(sprite, *values[:6])
+            sprite.speed = values[7]
+            sprite.direction = values[8:10]
+            return sprite
+
+        def enemy2(values):
+            sprite = Enemy2(0, 0, images[values[6]])
+            _rect(sprite, *values[:6])
+            sprite.speed = values[7]
+            sprite.direction = values[8:10]
+            sprite.shoot_timer, sprite.shots_fired = values[10:12]
+            return sprite
+
+        def rock(sprite_type):
+            def build(values):
+                sprite = sprite_type(0, 0, images[values[6]])
+                sprite.angle = values[7]
+                if sprite.angle:
+                    sprite.image, sprite.mask = rotated(sprite.original_image, sprite.angle)
+                _rect(sprite, *values[:6])
+                sprite.speed, sprite.direction_x, sprite.direction_y = values[8:11]
+                return sprite
+            return build
+
+        def refill(sprite_type, image):
+            def build(values):
+                sprite = sprite_type(0, 0, image)
+                _rect(sprite, *values[:6])
+                sprite.speed, sprite.direction_x, sprite.direction_y = values[6:9]
+                return sprite
+            return build
+
+        def extra(values):
+            sprite = ExtraScore(0, 0, game.extra_score_img, game.entities)
+            _rect(sprite, *values[:6])
+            sprite.speed, sprite.direction_y = values[6:8]
+            return sprite
+
+        def bullet(values):
+            sprite = Bullet(0, 0)
+            _rect(sprite, *values[:4])
+            sprite.speed = values[4]
+            return sprite
+
+        def boss(values):
+            sprite = Boss(0, 0, self.bosses[values[4]])
+            _rect(sprite, *values[:4])
+            (
+                sprite.health, sprite.phase_index, sprite.shots_fired, sprite.shoot_timer,
+                sprite.teleport_timer, sprite.contact_timer, sprite.spiral_angle,
+            ) = values[5:12]
+            sprite.direction = values[12:14]
+            sprite._render_health_bar()
+            return sprite
+
+        def effect(values):
+            kind, image_list, frame, x, y, last_update, sound_played, priority, spawned = values
+            images = self.effect_images[image_list]
+            sprite = EFFECT_TYPES[kind]((x, y), images)
+            sprite.frame = frame
+            sprite.image = images[frame]
+            sprite.rect = sprite.image.get_rect(center=(x, y))
+            sprite.last_update = now + last_update
+            sprite.sound_played = bool(sound_played)
+            sprite.images = images
+            sprite.priority = priority
+            sprite.spawned = now + spawned
+            return sprite
+
+        section(game.enemy1_group, _ENEMY1, enemy1)
+        section(game.enemy2_group, _ENEMY2, enemy2)
+        for attribute, sprite_type in _ROCKS:
+            section(getattr(game, attribute), _ROCK, rock(sprite_type))
+        for attribute, sprite_type, image in _REFILLS:
+            section(getattr(game, attribute), _REFILL, refill(sprite_type, getattr(game, image)))
+        section(game.extra_score_group, _EXTRA, extra)
+        section(game.bullets, _BULLET, bullet)
+        section(game.boss_group, _BOSS, boss)
+        section(game.effects.group, _EFFECT, effect)
+
+        field = game.enemy_projectiles
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        for name in _PROJECTILE_ARRAYS:
+            target = getattr(field, name)
+            size = count * target[0].nbytes
+            target[:count] = np.frombuffer(view[offset:offset + size], target.dtype).reshape(target[:count].shape)
+            offset += size
+        field.count = count
+
+        version, has_gauss, gauss = _RNG.unpack_from(view, offset)
+        offset += _RNG.size
+        if rng:
+            state = array('I')
+            state.frombytes(view[offset:])
+            random.setstate((version, tuple(state), gauss if has_gauss else None))
+
+
+class RewindBuffer:
+    """
+    The last `seconds` of snapshots, one every `every` frames, in a ring of
+    preallocated slots. rewind() restores the snapshot from about that
+    many seconds ago and forgets everything newer.
+    """
+
+    def __init__(self, codec, seconds=10, fps=60, every=1):
+        self.codec = codec
+        self.every = max(1, every)
+        self.fps = fps
+        self.slots = [None] * max(1, int(seconds * fps / self.every))
+        self.head = 0
+        self.count = 0
+        self.frame = 0
+
+    def __len__(self):
+        return self.count
+
+    def record(self):
+        """Call once per simulated frame."""
+        self.frame += 1
+        if self.frame % self.every:
+            return
+        self.slots[self.head] = self.codec.capture()
+        self.head = (self.head + 1) % len(self.slots)
+        self.count = min(self.count + 1, len(self.slots))
+
+    def rewind(self, seconds):
+        """Returns False when nothing has been recorded."""
+        if not self.count:
+            return False
+        back = min(self.count, max(1, round(seconds * self.fps / self.every)))
+        self.head = (self.head - back) % len(self.slots)
+        self.count -= back - 1
+        self.codec.restore(self.slots[self.head])
+        # The restored snapshot stays in the ring as the newest one
+        self.head = (self.head + 1) % len(self.slots)
+        return True
+
+    def clear(self):
+        self.slots = [None] * len(self.slots)
+        self.head = 0
+        self.count = 0
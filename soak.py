@@ -0,0 +1,271 @@
+"""
+Headless soak runner for Cosmic Heat.
+A scripted pilot plays for a fixed number of simulated frames, uncapped,
+and retries through the game over screen every time the player dies.
+Memory, live entity counts, cache sizes, busy mixer channels and frame
+times are sampled at intervals; the run fails with a report when any of
+them keeps growing past its threshold.
+
+Usage: python soak.py [--frames N] [--interval N] [--warmup N] [--round-frames N] [--seed N]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from classes.constants import WIDTH, HEIGHT, RENDER_SCALE
+
+
+# metric -> (relative growth, absolute growth). A metric fails when its
+# average over the last third of the samples exceeds the first third's by
+# both amounts; the absolute floor keeps small counts from flapping.
+# Samples taken during warmup (caches filling, first boss loading) are
+# left out of the comparison.
+THRESHOLDS = {
+    'rss_kb': (0.10, 16384),
+    'gc_objects': (0.10, 5000),
+    'entities': (0.50, 10),
+    'caches': (0.25, 50),
+    'mixer_busy': (0.50, 4),
+    'frame_p50_ms': (0.25, 1.0),
+    'frame_p95_ms': (0.25, 2.0),
+}
+
+_DIRECTIONS = (
+    (), (pygame.K_LEFT,), (pygame.K_RIGHT,), (pygame.K_UP,), (pygame.K_DOWN,),
+    (pygame.K_LEFT, pygame.K_UP), (pygame.K_RIGHT, pygame.K_UP),
+    (pygame.K_LEFT, pygame.K_DOWN), (pygame.K_RIGHT, pygame.K_DOWN),
+)
+
+
+def rss_kb():
+    """Resident set size of this process; peak RSS where /proc is missing."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def cache_sizes():
+    """Entries in the process-wide caches that are expected to level off."""
+    import fonts
+    import glow
+    from classes import assets, collision
+    images, sounds = assets.stats()
+    return {
+        'rotations': len(collision._rotations),
+        'masks': len(collision._masks),
+        'images': images,
+        'sounds': sounds,
+        'fonts': fonts.stats()[0],
+        'glow': glow.stats()[0],
+    }
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Pilot:
+    """
+    Posts key events like a player would: fire held, a new direction every
+    few dozen frames, and RETURN on the game over screen to retry. After
+    round_frames of one run the player is killed so retries keep coming.
+    """
+
+    def __init__(self, manager, game, round_frames):
+        self.manager = manager
+        self.game = game
+        self.round_frames = round_frames
+        self.held = ()
+        self.retries = 0
+
+    def _post(self, event_type, key):
+        pygame.event.post(pygame.event.Event(event_type, key=key, mod=0, unicode='', scancode=0))
+
+    def step(self, frame):
+        top = self.manager.top
+        if top is self.game.game_over_scene:
+            self._post(pygame.KEYDOWN, pygame.K_RETURN)
+            self.retries += 1
+            return
+        if top is not self.game:
+            return
+
+        if self.round_frames and self.game.run_frames >= self.round_frames:
+            self.game.player_life = 0
+        if frame % 10 == 0:
+            self._post(pygame.KEYDOWN, pygame.K_SPACE)
+        if frame % 40 == 0:
+            for key in self.held:
+                self._post(pygame.KEYUP, key)
+            self.held = random.choice(_DIRECTIONS)
+            for key in self.held:
+                self._post(pygame.KEYDOWN, key)
+
+
+class SoakRun:
+    """Samples the running game every interval frames and judges the trend."""
+
+    def __init__(self, manager, game, pilot, frames, interval):
+        self.manager = manager
+        self.game = game
+        self.pilot = pilot
+        self.frames = frames
+        self.interval = interval
+        self.frame = 0
+        self.frame_times = []
+        self.samples = []
+        self.channels = pygame.mixer.get_num_channels() if pygame.mixer.get_init() else 0
+        self.exhausted = 0
+        self._last = time.perf_counter()
+
+    def after_frame(self, frame_ms):
+        now = time.perf_counter()
+        self.frame_times.append((now - self._last) * 1000)
+        self._last = now
+        self.frame += 1
+
+        busy = sum(pygame.mixer.Channel(i).get_busy() for i in range(self.channels))
+        if self.channels and busy == self.channels:
+            self.exhausted += 1
+        if self.frame % self.interval == 0:
+            self.sample(busy)
+        if self.frame >= self.frames:
+            self.manager.quit()
+        else:
+            self.pilot.step(self.frame)
+
+    def sample(self, busy):
+        ordered = sorted(self.frame_times)
+        self.frame_times.clear()
+        groups = {name: len(group) for name, group in self.game.telemetry.groups}
+        caches = cache_sizes()
+        self.samples.append({
+            'frame': self.frame,
+            'rss_kb': rss_kb(),
+            'gc_objects': len(gc.get_objects()),
+            'entities': sum(groups.values()),
+            'caches': sum(caches.values()),
+            'mixer_busy': busy,
+            'frame_p50_ms': _percentile(ordered, 0.5),
+            'frame_p95_ms': _percentile(ordered, 0.95),
+            'frame_p99_ms': _percentile(ordered, 0.99),
+            'groups': groups,
+            'cache_sizes': caches,
+        })
+
+    def failures(self, warmup):
+        """[(metric, first-third mean, last-third mean)] past their thresholds."""
+        samples = [sample for sample in self.samples if sample['frame'] > warmup]
+        third = len(samples) // 3
+        if third == 0:
+            return []
+        failed = []
+        for metric, (relative, absolute) in THRESHOLDS.items():
+            first = sum(sample[metric] for sample in samples[:third]) / third
+            last = sum(sample[metric] for sample in samples[-third:]) / third
+            if last - first > absolute and last > first * (1 + relative):
+                failed.append((metric, first, last))
+        return failed
+
+    def report(self, warmup, out=sys.stdout):
+        """Write the sample table and the verdict; returns True when the run passed."""
+        out.write(
+            f"soak: {self.frame} frames, {len(self.samples)} samples, {self.pilot.retries} retries\n"
+        )
+        out.write(
+            f"{'frame':>8}{'rss MB':>9}{'objects':>9}{'entities':>9}{'caches':>8}"
+            f"{'mixer':>7}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}\n"
+        )
+        for sample in self.samples:
+            out.write(
+                f"{sample['frame']:>8}{sample['rss_kb'] / 1024:>9.1f}{sample['gc_objects']:>9}"
+                f"{sample['entities']:>9}{sample['caches']:>8}{sample['mixer_busy']:>7}"
+                f"{sample['frame_p50_ms']:>8.2f}{sample['frame_p95_ms']:>8.2f}{sample['frame_p99_ms']:>8.2f}\n"
+            )
+        if self.samples:
+            last = self.samples[-1]
+            out.write("groups at end: " + ", ".join(f"{name} {count}" for name, count in last['groups'].items()) + "\n")
+            out.write("caches at end: " + ", ".join(f"{name} {count}" for name, count in last['cache_sizes'].items()) + "\n")
+
+        if len([sample for sample in self.samples if sample['frame'] > warmup]) < 3:
+            out.write(f"FAIL too few samples after {warmup} warmup frames to judge a trend\n")
+            return False
+        failed = self.failures(warmup)
+        for metric, first, last in failed:
+            relative, absolute = THRESHOLDS[metric]
+            out.write(
+                f"FAIL {metric}: {first:.1f} -> {last:.1f} "
+                f"(limit +{relative:.0%} and +{absolute})\n"
+            )
+        if self.exhausted:
+            out.write(f"FAIL mixer: all {self.channels} channels busy on {self.exhausted} frames\n")
+        passed = not failed and not self.exhausted
+        if passed:
+            out.write("PASS: no metric trended upward past its threshold\n")
+        return passed
+
+
+def run(frames, interval, round_frames, seed, quality='high'):
+    from leaderboard import Leaderboard
+    from main import GameScene, apply_quality
+    from quality import QualityGovernor, tier_index
+    from render import RenderTarget
+    from scenes import SceneManager
+    from cosmic_ui import ParallaxBackground
+
+    random.seed(seed)
+    pygame.mixer.init()
+    pygame.init()
+    pygame.mixer.set_num_channels(20)
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    # A pinned tier keeps the workload comparable from start to end
+    governor = QualityGovernor(adaptive=False, tier=tier_index(quality))
+    governor.subscribe(apply_quality)
+    # fps 0 leaves the loop uncapped: frames are simulated as fast as they run
+    manager = SceneManager(screen, 0)
+    game = GameScene(manager, RenderTarget(screen, RENDER_SCALE), governor, ParallaxBackground(), '', Leaderboard(''))
+    pilot = Pilot(manager, game, round_frames)
+    soak = SoakRun(manager, game, pilot, frames, interval)
+    manager.after_frame.append(soak.after_frame)
+
+    manager.push(game)
+    manager.run()
+    pygame.quit()
+    return soak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cosmic Heat soak test")
+    parser.add_argument('--frames', type=int, default=60 * 60 * 30, help="simulated frames (default 30 min at 60 FPS)")
+    parser.add_argument('--interval', type=int, default=1800, help="frames between samples")
+    parser.add_argument('--warmup', type=int, default=7200, help="frames left out of the trend comparison")
+    parser.add_argument('--round-frames', type=int, default=3600, help="force a game over after this many frames; 0 to disable")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--quality', default='high')
+    args = parser.parse_args(argv)
+
+    soak = run(args.frames, args.interval, args.round_frames, args.seed, args.quality)
+    if not soak.report(args.warmup):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""
+Per-frame telemetry for Cosmic Heat.
+The game loop writes counters into a fixed-size, array-backed ring buffer
+without allocating; a background thread flushes finished frames to JSONL.
+
+Summarize a recorded file, or graph how counts change over the session:
+    python telemetry.py summary telemetry.jsonl
+    python telemetry.py graph telemetry.jsonl --fields enemy1,meteors2
+"""
+
+import argparse
+import json
+import sys
+import threading
+from array import array
+
+import hooks
+
+
+# Field name column of summary and graph, wide enough for the longest <pair>_us
+_NAME_WIDTH = 26
+
+
+class FrameTelemetry:
+    """Fixed-size ring of integer counter rows, one row per frame."""
+
+    def __init__(self, path=None, groups=None, counters=(), capacity=4096, flush_interval=0.5):
+        self.groups = list((groups or {}).items())
+        self.fields = ['frame', 'frame_ms'] + [name for name, _ in self.groups] + list(counters)
+        self.index = {name: i for i, name in enumerate(self.fields)}
+        self.width = len(self.fields)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.path = path
+        self.enabled = bool(path)
+
+        self.data = array('q', bytes(8 * self.width * capacity))
+        self.current = array('q', bytes(8 * self.width))
+        self._zeros = array('q', bytes(8 * self.width))
+        self.frames = 0
+        self.flushed = 0
+        self.frames_lost = 0
+
+        self._wake = threading.Event()
+        self._closing = False
+        self._worker = None
+        if self.enabled:
+            self._file = open(path, 'w')
+            self._worker = threading.Thread(target=self._run, name='telemetry-flush', daemon=True)
+            self._worker.start()
+
+    def count(self, name, amount=1):
+        """Add to a counter for the frame in progress."""
+        if self.enabled:
+            self.current[self.index[name]] += amount
+
+    def set(self, name, value):
+        if self.enabled:
+            self.current[self.index[name]] = value
+
+    def commit(self, frame_ms=0):
+        """Sample the watched groups and close the current frame's row."""
+        if not self.enabled:
+            return
+        current = self.current
+        current[0] = self.frames
+        current[1] = frame_ms
+        column = 2
+        for _, group in self.groups:
+            current[column] = len(group)
+            column += 1
+        offset = (self.frames % self.capacity) * self.width
+        self.data[offset:offset + self.width] = current
+        current[:] = self._zeros
+        self.frames += 1
+
+    def close(self):
+        """Flush every remaining frame and stop the worker."""
+        if not self.enabled:
+            return
+        self._closing = True
+        self._wake.set()
+        self._worker.join()
+        self._file.close()
+        if self.frames_lost:
+            print(f"Telemetry: {self.frames_lost} frames overwritten before flush")
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._flush()
+            if self._closing:
+                self._flush()
+                return
+
+    def _flush(self):
+        end = self.frames
+        start = self.flushed
+        if end - start > self.capacity:
+            self.frames_lost += end - start - self.capacity
+            start = end - self.capacity
+        if start == end:
+            return
+
+        rows = []
+        for frame in range(start, end):
+            offset = (frame % self.capacity) * self.width
+            rows.append(self.data[offset:offset + self.width])
+
+        # Rows the game loop lapped while we were copying are no longer valid
+        lapped = self.frames - self.capacity
+        if lapped > start:
+            self.frames_lost += lapped - start
+            rows = rows[lapped - start:]
+
+        fields = self.fields
+        self._file.write(''.join(json.dumps(dict(zip(fields, row))) + '\n' for row in rows))
+        self._file.flush()
+        self.flushed = end
+
+
+def install_pygame_counters(telemetry):
+    """
+    Count Surface allocations and sound plays into the 'surfaces' and
+    'sounds' counters, through the shared hooks layer.
+    """
+    if not telemetry.enabled:
+        return
+
+    current = telemetry.current
+    surfaces = telemetry.index['surfaces']
+    sounds = telemetry.index['sounds']
+
+    def count_surface(frame, surface):
+        current[surfaces] += 1
+
+    def count_sound():
+        current[sounds] += 1
+
+    hooks.install()
+    hooks.surface_listeners.append(count_surface)
+    hooks.sound_listeners.append(count_sound)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(path, out=sys.stdout):
+    """Print mean / p95 / max of every field in a telemetry file."""
+    frames, columns = _read_columns(path)
+    out.write(f"{path}: {frames} frames\n")
+    if not frames:
+        return
+    out.write(f"{'field':<{_NAME_WIDTH}}{'mean':>10}{'p95':>10}{'max':>10}{'total':>12}\n")
+    for name, values in columns.items():
+        out.write(
+            f"{name:<{_NAME_WIDTH}}{sum(values) / len(values):>10.2f}"
+            f"{_percentile(values, 0.95):>10}{max(values):>10}{sum(values):>12}\n"
+        )
+
+
+_BARS = ' ▁▂▃▄▅▆▇█'
+
+
+def _read_columns(path):
+    columns = {}
+    frames = 0
+    with open(path) as telemetry_file:
+        for line in telemetry_file:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            frames += 1
+            for name, value in row.items():
+                if name != 'frame':
+                    columns.setdefault(name, []).append(value)
+    return frames, columns
+
+
+def graph(path, fields=None, width=64, out=sys.stdout):
+    """
+    One bar chart line per field: the session is split into width buckets
+    and each bar shows the bucket's maximum. The last two columns compare
+    the first and second half of the session, so unbounded growth stands out.
+    """
+    frames, columns = _read_columns(path)
+    out.write(f"{path}: {frames} frames, {min(width, frames)} buckets\n")
+    if not frames:
+        return
+    names = fields or [name for name, values in columns.items() if name != 'frame_ms' and max(values)]
+    out.write(f"{'field':<{_NAME_WIDTH}}{'max':>7}  {'':<{width}}  {'1st half':>8}{'2nd half':>9}\n")
+    for name in names:
+        values = columns.get(name)
+        if values is None:
+            out.write(f"{name:<{_NAME_WIDTH}}{'(no such field)':>7}\n")
+            continue
+        peak = max(values)
+        buckets = min(width, len(values))
+        bars = []
+        for bucket in range(buckets):
+            start = bucket * len(values) // buckets
+            end = (bucket + 1) * len(values) // buckets
+            level = max(values[start:end])
+            bars.append(_BARS[(level * (len(_BARS) - 1) + peak - 1) // peak] if peak else _BARS[0])
+        half = len(values) // 2
+        first = max(values[:half]) if half else 0
+        second = max(values[half:])
+        out.write(f"{name:<{_NAME_WIDTH}}{peak:>7}  {''.join(bars):<{width}}  {first:>8}{second:>9}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cosmic Heat telemetry tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+    summary = commands.add_parser('summary', help="summarize a telemetry JSONL file")
+    summary.add_argument('path')
+    plot = commands.add_parser('graph', help="graph field values over a telemetry JSONL file")
+    plot.add_argument('path')
+    plot.add_argument('--fields', help="comma-separated fields; default every non-zero field")
+    plot.add_argument('--width', type=int, default=64)
+    args = parser.parse_args(argv)
+
+    if args.command == 'summary':
+        summarize(args.path)
+    elif args.command == 'graph':
+        graph(args.path, args.fields.split(',') if args.fields else None, args.width)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# Assets are loaded relative to the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+import pytest
+
+from classes.constants import WIDTH, HEIGHT
+
+
+@pytest.fixture(scope='session')
+def screen():
+    pygame.init()
+    surface = pygame.display.set_mode((WIDTH, HEIGHT))
+    yield surface
+    pygame.quit()
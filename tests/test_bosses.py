@@ -0,0 +1,79 @@
+import math
+
+import pygame
+import pytest
+
+from classes.bosses import BOSS_DEFINITIONS, FIRE_PATTERNS, Boss, BossSpawner
+from classes.constants import WIDTH, HEIGHT
+from classes.projectiles import MUZZLE_GAP, ProjectileField
+
+
+def phase_using(pattern):
+    for definition in BOSS_DEFINITIONS:
+        for phase in definition['phases']:
+            if phase.get('fire') == pattern:
+                return definition, phase
+    return None, None
+
+
+@pytest.fixture
+def field(screen):
+    return ProjectileField(capacity=256)
+
+
+@pytest.fixture
+def player():
+    player = pygame.sprite.Sprite()
+    player.rect = pygame.Rect(0, 0, 60, 60)
+    player.rect.center = (WIDTH // 2, HEIGHT - 100)
+    return player
+
+
+@pytest.mark.parametrize('pattern', sorted(FIRE_PATTERNS))
+def test_every_pattern_fires_into_a_field(pattern, field, player):
+    definition, phase = phase_using(pattern)
+    assert phase is not None, f"no boss phase fires {pattern!r}"
+    boss = Boss(WIDTH // 2, HEIGHT // 3, definition)
+
+    FIRE_PATTERNS[pattern](boss, player, phase, field)
+
+    expected = len(phase['offsets']) if pattern == 'volley' else phase.get('count', 1)
+    assert len(field) == expected
+    speed = field.speed(phase['bullet'])
+    for vx, vy in field.vel[:len(field)].tolist():
+        assert math.hypot(vx, vy) == pytest.approx(speed, rel=1e-4)
+    field.update()
+    assert len(field) == expected
+
+
+def test_downward_shots_start_below_the_boss(field, player):
+    definition, phase = phase_using('volley')
+    boss = Boss(WIDTH // 2, HEIGHT // 3, definition)
+
+    FIRE_PATTERNS['volley'](boss, player, phase, field)
+
+    bottoms = field.pos[:len(field), 1] + field.half_sizes[field.frame[:len(field)], 1]
+    assert bottoms.tolist() == [boss.rect.bottom + MUZZLE_GAP] * len(field)
+
+
+def spiral_boss(**changes):
+    definition, phase = phase_using('spiral')
+    return {**definition, 'phases': [{**phase, **changes}]}
+
+
+@pytest.mark.parametrize('changes, message', [
+    ({'count': 0}, 'count must be at least 1'),
+    ({'fire': 'wave'}, "unknown fire pattern 'wave'"),
+    ({'bullet': 'laser'}, "unknown bullet 'laser'"),
+])
+def test_bad_phases_are_rejected_on_load(changes, message):
+    with pytest.raises(ValueError, match=message):
+        BossSpawner([spiral_boss(**changes)])
+
+
+def test_missing_pattern_keys_are_rejected_on_load():
+    broken = spiral_boss()
+    del broken['phases'][0]['spin']
+
+    with pytest.raises(ValueError, match='spiral needs spin'):
+        BossSpawner([broken])
@@ -0,0 +1,17 @@
+from classes.counters import Deltas
+
+
+def test_take_returns_growth_since_the_previous_take():
+    deltas = Deltas()
+
+    assert deltas.take((3, 1)) == (3, 1)
+    assert deltas.take((5, 1)) == (2, 0)
+    assert deltas.take((5, 1)) == (0, 0)
+
+
+def test_keys_are_tracked_separately():
+    deltas = Deltas()
+    deltas.take((2, 0.5), 'left')
+
+    assert deltas.take((4, 1.5), 'left') == (2, 1.0)
+    assert deltas.take((4, 1.5), 'right') == (4, 1.5)
@@ -0,0 +1,37 @@
+import pygame
+import pytest
+
+from classes.ecs import EntitySprite, World
+
+
+@pytest.fixture
+def sprite():
+    world = World()
+    sprite = EntitySprite(world, pygame.Surface((10, 20)), pygame.Rect(5, 5, 10, 20), direction=(0, 1), speed=2.0)
+    pygame.sprite.Group(sprite)
+    return sprite
+
+
+def test_rect_changes_write_back_to_the_entity(sprite):
+    sprite.rect.x += 1
+    sprite.rect.move_ip(0, 4)
+    sprite.rect.center = (100, 100)
+
+    assert sprite.rect == pygame.Rect(95, 90, 10, 20)
+    assert sprite.world.get(sprite.entity, 'position').tolist() == [95, 90]
+
+
+def test_rect_changes_write_back_before_the_entity_exists():
+    sprite = EntitySprite(World(), pygame.Surface((10, 20)), pygame.Rect(5, 5, 10, 20))
+    sprite.rect[1] = 30
+
+    assert sprite.rect == pygame.Rect(5, 30, 10, 20)
+
+
+def test_derived_rects_are_detached(sprite):
+    moved = sprite.rect.move(50, 0)
+    moved.x = 0
+    copy = sprite.rect.copy()
+    copy.inflate_ip(10, 10)
+
+    assert sprite.rect == pygame.Rect(5, 5, 10, 20)
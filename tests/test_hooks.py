@@ -0,0 +1,42 @@
+import pygame
+import pytest
+
+import hooks
+
+
+@pytest.fixture
+def made(screen):
+    hooks.install()
+    made = []
+
+    def listener(frame, surface):
+        made.append(surface)
+    hooks.surface_listeners.append(listener)
+    yield made
+    hooks.surface_listeners.remove(listener)
+
+
+def test_new_surfaces_are_reported(made):
+    surface = pygame.Surface((8, 8))
+    scaled = pygame.transform.scale(surface, (16, 16))
+    text = pygame.font.Font(None, 12).render('x', True, (255, 255, 255))
+
+    assert made == [surface, scaled, text]
+
+
+def test_transforms_into_a_dest_surface_are_not_reported(made):
+    source, dest = pygame.Surface((8, 8)), pygame.Surface((16, 16))
+    made.clear()
+
+    pygame.transform.scale(source, (16, 16), dest)
+    pygame.transform.smoothscale(source, (16, 16), dest_surface=dest)
+
+    assert made == []
+
+
+def test_install_is_shared_and_only_wraps_once(made):
+    surface_type, scale = pygame.Surface, pygame.transform.scale
+
+    hooks.install()
+
+    assert pygame.Surface is surface_type and pygame.transform.scale is scale
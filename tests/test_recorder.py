@@ -0,0 +1,69 @@
+import os
+
+import pygame
+import pytest
+
+from recorder import FrameRecorder
+
+
+@pytest.fixture
+def recorder(screen, tmp_path):
+    recorder = FrameRecorder(screen, output_dir=str(tmp_path), slots=4, scale=0.25, fmt='raw')
+    yield recorder
+    recorder.close()
+
+
+def test_nothing_is_allocated_until_used(recorder, screen):
+    assert recorder.slots == [] and recorder.screenshot_surface is None
+
+    recorder.request_screenshot()
+    recorder.capture(screen)
+    recorder.start()
+
+    assert len(recorder.slots) == 4 and recorder.screenshot_surface is not None
+
+
+def test_write_error_stops_recording_and_the_worker_survives(recorder, screen, monkeypatch):
+    real_tobytes = pygame.image.tobytes
+    calls = [0]
+
+    def failing_tobytes(surface, fmt):
+        calls[0] += 1
+        if calls[0] == 3:
+            raise OSError("disk full")
+        return real_tobytes(surface, fmt)
+    monkeypatch.setattr(pygame.image, 'tobytes', failing_tobytes)
+
+    recorder.start()
+    for _ in range(10):
+        recorder.capture(screen)
+        recorder.pending.join()
+
+    assert not recorder.recording
+    assert recorder.stats()['error'] == 'frame: disk full'
+    assert recorder.frames_written == 2
+
+    recorder.start()
+    for _ in range(5):
+        recorder.capture(screen)
+        recorder.pending.join()
+    recorder.stop()
+    recorder.pending.join()
+
+    assert recorder._worker.is_alive()
+    assert recorder.frames_written == 5
+    width, height = recorder.frame_size
+    assert os.path.getsize(os.path.join(recorder.session_dir, 'frames.raw')) == 5 * width * height * 3
+
+
+def test_start_waits_for_the_previous_session(recorder, screen):
+    recorder.start()
+    for _ in range(4):
+        recorder.capture(screen)
+    recorder.stop()
+
+    recorder.start()
+
+    # Every frame of the first session was written, and its slot freed, first
+    assert recorder.free_slots.qsize() == 4
+    assert recorder.frames_written == 0
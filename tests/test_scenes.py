@@ -0,0 +1,13 @@
+from scenes import TRANSITION_HISTORY, Scene, SceneManager
+
+
+def test_transition_history_is_bounded(screen):
+    manager = SceneManager(screen, 60)
+    manager.push(Scene())
+    for _ in range(TRANSITION_HISTORY):
+        manager.push(Scene())
+        manager.pop()
+
+    assert len(manager.transitions) == TRANSITION_HISTORY
+    assert manager.transitions[-1][0] == 'pop Scene'
+    assert manager.transition_summary()['push Scene'][0] == TRANSITION_HISTORY // 2
@@ -0,0 +1,65 @@
+import random
+import time
+
+import pygame
+import pytest
+
+from main import GameScene
+from quality import QualityGovernor
+from render import RenderTarget
+from scenes import SceneManager
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Ticks and wall time frozen to a frame counter, so replays see the same clock."""
+    tick = [0]
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: tick[0])
+    monkeypatch.setattr(time, 'time', lambda: 1000.0)
+    return tick
+
+
+@pytest.fixture
+def game(screen, clock):
+    game = GameScene(SceneManager(screen, 60), RenderTarget(screen), QualityGovernor(), None)
+    # Held fire keeps bullets, hits and explosions in the world
+    game.input.held.add('fire')
+    return game
+
+
+def play(game, clock, frames):
+    for _ in range(frames):
+        clock[0] += 17
+        game.score = max(game.score, 16000)
+        game.player_life = 200
+        game.bullet_counter = 200
+        game.step()
+        game.render_queue.clear()
+
+
+def test_restore_then_capture_is_identical(game, clock):
+    random.seed(8)
+    play(game, clock, 600)
+    codec = game.snapshots
+    now = clock[0]
+    data = codec.capture(now)
+
+    codec.restore(data, now)
+
+    assert codec.capture(now) == data
+
+
+def test_replay_from_restored_snapshot_is_identical(game, clock):
+    random.seed(8)
+    play(game, clock, 600)
+    codec = game.snapshots
+    now = clock[0]
+    data = codec.capture(now)
+    play(game, clock, 120)
+    played = codec.capture(clock[0])
+
+    clock[0] = now
+    codec.restore(data, now)
+    play(game, clock, 120)
+
+    assert codec.capture(clock[0]) == played